@@ -0,0 +1,44 @@
+"""
+Compare the key lookups of a case insensitive config against a case sensitive one.
+
+Usage: python benchmarks/case_sensitive.py
+"""
+
+from __future__ import print_function
+
+import json
+import timeit
+
+from central.config import MemoryConfig
+from central.readers import JsonReader
+from io import StringIO
+
+
+def create_data(sections=50, keys=20):
+    return dict(('section%d' % i, dict(('key%d' % j, str(j)) for j in range(keys))) for i in range(sections))
+
+
+def main():
+    data = create_data()
+    content = json.dumps(data)
+
+    for ignore_case in (True, False):
+        reader = JsonReader(ignore_case=ignore_case)
+
+        config = MemoryConfig(data=data)
+        config.ignore_case = ignore_case
+
+        prefixed = config.prefixed('section10')
+
+        read = timeit.timeit(lambda: reader.read(StringIO(content)), number=200)
+        get_raw = timeit.timeit(lambda: config.get_raw('section10.key10'), number=200000)
+        prefixed_get = timeit.timeit(lambda: prefixed.get_raw('key10'), number=200000)
+
+        print('ignore_case=%s' % ignore_case)
+        print('  read:         %.3fs' % read)
+        print('  get_raw:      %.3fs' % get_raw)
+        print('  prefixed get: %.3fs' % prefixed_get)
+
+
+if __name__ == '__main__':
+    main()
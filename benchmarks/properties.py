@@ -0,0 +1,56 @@
+"""
+Measure the cost of updating a single key of a config
+observed by many properties with listeners and the cost
+of reading properties one by one, as a group, derived
+or through compiled accessors.
+
+Usage: python benchmarks/properties.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+from central.config import MemoryConfig
+from central.property import PropertyGroup, PropertyManager
+
+
+def create_data(sections=100, keys=20):
+    return dict(('section%d' % i, dict(('key%d' % j, j) for j in range(keys))) for i in range(sections))
+
+
+def main():
+    data = create_data()
+
+    config = MemoryConfig(data=data)
+    properties = PropertyManager(config)
+
+    for section, values in data.items():
+        for key in values:
+            prop = properties.get_property(section + '.' + key).as_int(0)
+            prop.on_updated(lambda value: None)
+
+    counter = [0]
+
+    def update():
+        counter[0] += 1
+        config.set('section10', {'key10': counter[0]})
+
+    host = properties.get_property('section1.key1').as_int(0)
+    port = properties.get_property('section1.key2').as_int(0)
+    group = PropertyGroup(host, port)
+    host_accessor = config.compile_accessor('section1.key1', int, 0)
+    port_accessor = config.compile_accessor('section1.key2', int, 0)
+    address = properties.derive(lambda host, port: 'localhost:%d/%d' % (host, port), host, port)
+
+    print('properties: %d' % sum(len(values) for values in data.values()))
+    print('  update:    %.3fs' % timeit.timeit(update, number=1000))
+    print('  get:       %.3fs' % timeit.timeit(lambda: (host.get(), port.get()), number=200000))
+    print('  group get: %.3fs' % timeit.timeit(group.get, number=200000))
+    print('  accessors: %.3fs' % timeit.timeit(lambda: (host_accessor(), port_accessor()), number=200000))
+    print('  computed:  %.3fs' % timeit.timeit(lambda: 'localhost:%d/%d' % (host.get(), port.get()), number=200000))
+    print('  derived:   %.3fs' % timeit.timeit(address.get, number=200000))
+
+
+if __name__ == '__main__':
+    main()
@@ -65,6 +65,16 @@ class Config(object):
         """
         raise NotImplementedError()
 
+    def get_many(self, keys):
+        """
+        Get the values for the given keys as the specified types, all the values
+        are read from the same version of the configuration.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        raise NotImplementedError()
+
     def get_raw(self, key):
         """
         Get the raw value for given key if key is in the configuration, otherwise None.
@@ -120,6 +130,32 @@ class Config(object):
         """
         raise NotImplementedError()
 
+    def aload(self):
+        """
+        Load the configuration asynchronously, it requires Python 3.5+.
+        This method does not trigger the updated event.
+
+        Example usage:
+
+        .. code-block:: python
+
+            await config.aload()
+
+        :return: An awaitable that loads the configuration.
+        """
+        raise NotImplementedError()
+
+    def compile_accessor(self, key, type=object, default=None):
+        """
+        Get a function without arguments that returns the value for the given key,
+        the value is kept by the function and read again only when the key is changed.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The function that returns the value.
+        """
+        raise NotImplementedError()
+
     @property
     def lookup(self):
         """
@@ -144,6 +180,15 @@ class Config(object):
         """
         raise NotImplementedError()
 
+    @property
+    def changed(self):
+        """
+        Get the changed event handler, its callbacks are called
+        with a `ChangeSet` right before the updated event is triggered.
+        :return EventHandler: The event handler.
+        """
+        raise NotImplementedError()
+
     def on_updated(self, func):
         """
         Add a new callback for updated event.
@@ -169,6 +214,15 @@ class Config(object):
         """
         raise NotImplementedError()
 
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        The nested dicts and lists it returns may be shared with the configuration
+        and must not be modified.
+        :return Config: The view of the current configuration.
+        """
+        raise NotImplementedError()
+
     def __contains__(self, key):
         """
         Get true if key is in the configuration, otherwise false.
@@ -239,6 +293,23 @@ class Merger(object):
         Merge the given list of dicts into `base` dict.
         :param dict base: The base dict that holds the merged data.
         :param tuple data: The list of dicts to be merge.
+        :return dict: The merged data, either `base` or a new dict.
+        """
+        raise NotImplementedError()
+
+
+class Dispatcher(object):
+    """
+    Interface for dispatching the execution of callbacks.
+    It is intended to be used for calling the callbacks of an event.
+    """
+
+    def dispatch(self, func, *args):
+        """
+        Dispatch the given func to be executed with the given arguments,
+        the funcs dispatched are executed in the order they are dispatched.
+        :param func: The function to be executed.
+        :param args: The arguments to be passed to the function.
         """
         raise NotImplementedError()
 
@@ -311,6 +382,8 @@ class PropertyContainer(object):
     Interface for a single property that can be parsed as any type.
     """
 
+    __slots__ = ()
+
     def as_bool(self, default):
         """
         Get a bool property object.
@@ -374,6 +447,8 @@ class Property(object):
     Interface to access latest cached value for a Property.
     """
 
+    __slots__ = ()
+
     def get(self):
         """
         Get the most recent value of the property.
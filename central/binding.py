@@ -0,0 +1,277 @@
+"""
+Schema binding implementations.
+"""
+
+import logging
+
+from . import abc
+from .compat import string_types, text_type
+from .config.core import _get_many_from
+from .utils import EventHandler
+from threading import Lock
+
+try:
+    from typing import get_type_hints
+except ImportError:
+    get_type_hints = None
+
+
+__all__ = [
+    'Binding',
+]
+
+
+logger = logging.getLogger(__name__)
+
+# sections compiled by schema class, the classes are generated only once.
+_compiled = {}
+
+
+class Binding(object):
+    """
+    Bind a schema to a config source.
+
+    The schema is a class whose annotations declare the keys and their types,
+    the class attributes are the default values and an annotation with another
+    schema class declares a nested section.
+
+    A class with `__slots__` is generated from the schema and an instance
+    holding the decoded values is built every time the config source is updated,
+    so reading a value is a plain attribute access.
+
+    The first instance is built on the first access to `value`,
+    so a binding made before the config source is loaded is not left stale.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.binding import Binding
+        from central.config import MemoryConfig
+
+        class Database:
+            host: str = 'localhost'
+            port: int = 5432
+
+        class Settings:
+            debug: bool = False
+            database: Database
+
+        config = MemoryConfig(data={'database': {'host': 'db.example.com'}})
+
+        settings = Binding(config, Settings)
+
+        host = settings.value.database.host
+
+        @settings.on_updated
+        def settings_updated(value):
+            print(value.database.host)
+
+    :param abc.Config config: The config source which provides the values.
+    :param type schema: The schema class.
+    """
+    def __init__(self, config, schema):
+        if not isinstance(config, abc.Config):
+            raise TypeError('config must be an abc.Config')
+
+        if not isinstance(schema, type):
+            raise TypeError('schema must be a class')
+
+        self._config = config
+        self._schema = schema
+        self._section = _compiled.get(schema)
+
+        if self._section is None:
+            self._section = _compiled.setdefault(schema, _Section(schema, ''))
+
+        self._keys = self._section.keys()
+        self._updated = EventHandler()
+        self._lock = Lock()
+        self._generation = 0
+        self._value = None
+        self._config.updated.add(self._config_updated)
+
+    @property
+    def schema(self):
+        """
+        Get the schema class.
+        :return type: The schema class.
+        """
+        return self._schema
+
+    @property
+    def updated(self):
+        """
+        Get the updated event handler.
+        :return EventHandler: The event handler.
+        """
+        return self._updated
+
+    @property
+    def value(self):
+        """
+        Get the most recent instance built from the config source.
+        :return: The instance of the class generated from the schema.
+        """
+        value = self._value
+
+        if value is None:
+            value = self._load(self._generation)
+
+        return value
+
+    def on_updated(self, func):
+        """
+        Add a new callback for updated event.
+        It can also be used as decorator.
+        :param func: The callback.
+        """
+        self.updated.add(func)
+
+    def _build(self):
+        """
+        Build a new instance reading all the keys at once.
+        :return: The instance of the class generated from the schema.
+        """
+        return self._section.build(_get_many_from(self._config, self._keys))
+
+    def _load(self, generation):
+        """
+        Build a new instance and keep it unless the config source
+        was updated after the given generation.
+        :param int generation: The generation the instance is built for.
+        :return: The instance of the class generated from the schema.
+        """
+        value = self._build()
+
+        with self._lock:
+            if self._generation == generation:
+                self._value = value
+
+        return value
+
+    def _config_updated(self):
+        """
+        Called when the config source attached was changed.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        try:
+            value = self._load(generation)
+        except:
+            logger.warning('Unable to bind schema %s' % text_type(self._schema), exc_info=True)
+            return
+
+        self.updated(value)
+
+
+class _Section(object):
+    """
+    Internal class that generates a class with `__slots__` from a schema
+    and builds its instances from the values read.
+
+    :param type schema: The schema class.
+    :param str prefix: The prefix of the keys of the section.
+    """
+
+    def __init__(self, schema, prefix):
+        self._fields = []
+        self._sections = []
+
+        for name, annotation in self._get_annotations(schema).items():
+            if not isinstance(name, string_types) or name.startswith('_'):
+                continue
+
+            if isinstance(annotation, string_types):
+                raise TypeError('Annotation of %s must be a type, not a str' % name)
+
+            key = prefix + name
+
+            if self._is_schema(annotation):
+                self._sections.append((name, _Section(annotation, key + '.')))
+            else:
+                self._fields.append((name, key, annotation, getattr(schema, name, None)))
+
+        names = tuple(name for name, _, _, _ in self._fields) + tuple(name for name, _ in self._sections)
+
+        self._cls = type(schema.__name__, (_Bound,), {'__slots__': names})
+
+    def keys(self):
+        """
+        Get the keys of the section and its nested sections.
+        :return dict: The keys mapped to a tuple of the type and default value.
+        """
+        keys = dict((key, (annotation, default)) for _, key, annotation, default in self._fields)
+
+        for _, section in self._sections:
+            keys.update(section.keys())
+
+        return keys
+
+    def build(self, values):
+        """
+        Build an instance of the generated class.
+        :param dict values: The values read mapped by key.
+        :return: The instance of the generated class.
+        """
+        o = self._cls.__new__(self._cls)
+
+        for name, key, _, _ in self._fields:
+            object.__setattr__(o, name, values[key])
+
+        for name, section in self._sections:
+            object.__setattr__(o, name, section.build(values))
+
+        return o
+
+    @staticmethod
+    def _get_annotations(schema):
+        """
+        Get the annotations of the schema including the ones from its base classes.
+        :param type schema: The schema class.
+        :return dict: The annotations.
+        """
+        if get_type_hints is not None:
+            # resolves the annotations written as str, e.g. forward references
+            # or modules using `from __future__ import annotations`.
+            try:
+                return get_type_hints(schema)
+            except (NameError, SyntaxError) as e:
+                raise TypeError('Unable to resolve the annotations of %s: %s' % (schema.__name__, e))
+
+        annotations = {}
+
+        for cls in reversed(schema.__mro__):
+            annotations.update(cls.__dict__.get('__annotations__', {}))
+
+        return annotations
+
+    @staticmethod
+    def _is_schema(annotation):
+        """
+        Get true if the given annotation is a schema class, otherwise false.
+        :param annotation: The annotation to be checked.
+        :return bool: True if it is a schema class.
+        """
+        return isinstance(annotation, type) and bool(getattr(annotation, '__annotations__', None))
+
+
+class _Bound(object):
+    """
+    Base class of the classes generated from a schema.
+    The instances are read only.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is read only' % type(self).__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError('%s is read only' % type(self).__name__)
+
+    def __repr__(self):
+        values = ', '.join('%s=%r' % (name, getattr(self, name)) for name in self.__slots__)
+        return '%s(%s)' % (type(self).__name__, values)
@@ -19,6 +19,8 @@ if PY2:
     text_type = unicode
 
     FileNotFoundError = OSError
+
+    intern = intern
 else:
     import urllib.request
     urlopen = urllib.request.urlopen
@@ -31,3 +33,5 @@ else:
     text_type = str
 
     FileNotFoundError = FileNotFoundError
+
+    intern = sys.intern
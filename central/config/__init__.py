@@ -1,4 +1,4 @@
 from .core import (
-    ChainConfig, CommandLineConfig, EnvironmentConfig, MemoryConfig,
-    MergeConfig, ModuleConfig, PrefixedConfig, ReloadConfig
+    ChainConfig, CommandLineConfig, DebounceConfig, EnvironmentConfig, LazyConfig,
+    MemoryConfig, MergeConfig, ModuleConfig, PrefixedConfig, ReloadConfig, SnapshotConfig
 )
@@ -0,0 +1,143 @@
+"""
+Asyncio support for the config implementations, it requires Python 3.5+.
+
+This module is imported on demand by the `aload` methods,
+it is never imported on Python versions without async/await.
+"""
+
+import asyncio
+import io
+
+from ..exceptions import ConfigError, LoadError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+async def run_in_executor(func, *args):
+    """
+    Run the given function in the default executor of the event loop.
+    :param func: The function to be called.
+    :param args: The arguments to be passed to the function.
+    :return: The value returned by the function.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+async def then(awaitable, func):
+    """
+    Await the given awaitable and call the given function afterwards.
+    :param awaitable: The awaitable to be awaited.
+    :param func: The function to be called without arguments.
+    """
+    await awaitable
+    func()
+
+
+async def load_config(config):
+    """
+    Load the given config by awaiting its `aload`, the configs
+    not implementing it are loaded in the default executor.
+    :param abc.Config config: The config to be loaded.
+    """
+    try:
+        awaitable = config.aload()
+    except NotImplementedError:
+        await run_in_executor(config.load)
+        return
+
+    await awaitable
+
+
+async def load_configs(configs, max_workers=None, timeout=None):
+    """
+    Load the given configs concurrently by awaiting their `aload`
+    or by calling their `load` in the default executor if not implemented,
+    at most `max_workers` configs are loaded at the same time if given.
+
+    The errors raised by the configs and the configs not loaded
+    before the timeout are raised together as a `LoadError`,
+    the configs still loading are cancelled.
+    :param list configs: The configs to be loaded.
+    :param int max_workers: The maximum number of configs loaded at the same time.
+    :param Number timeout: The maximum number of seconds to load the configs.
+    """
+    if not configs:
+        return
+
+    semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+    async def load(config):
+        if semaphore is None:
+            await load_config(config)
+            return
+
+        async with semaphore:
+            await load_config(config)
+
+    tasks = [asyncio.ensure_future(load(config)) for config in configs]
+
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    failures = []
+
+    for config, task in zip(configs, tasks):
+        if task in pending:
+            failures.append((config, ConfigError('Config not loaded within %s seconds' % timeout)))
+        elif task.exception() is not None:
+            failures.append((config, task.exception()))
+
+    if failures:
+        raise LoadError(failures)
+
+
+async def load_url(config):
+    """
+    Load the configuration of the given `UrlConfig`,
+    recursively loading any url referenced by an @next property.
+    :param UrlConfig config: The config to be loaded.
+    """
+    to_merge = []
+    url = config.url
+    lookup = config._create_url_lookup()
+
+    while url:
+        url = config._interpolator.resolve(url, lookup)
+
+        data = await config._afetch_url(url)
+
+        url = config._pop_next(data)
+
+        to_merge.append(data)
+
+    config._merge_urls(to_merge)
+
+
+async def fetch_url(config, url):
+    """
+    Open and read the given url using aiohttp if installed, otherwise the
+    `_fetch_url` method of the given `UrlConfig` is called in the default executor,
+    so the response is never read by the event loop thread.
+    :param UrlConfig config: The config reading the url.
+    :param str url: The url to be read.
+    :return MutableMapping: The data read.
+    """
+    if aiohttp is None:
+        return await run_in_executor(config._fetch_url, url)
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            content = await response.read()
+            content_type = response.headers.get('content-type')
+
+    # the content is already in memory, reading it does not block.
+    return config._read_url(url, content_type, io.BytesIO(content))
@@ -6,16 +6,24 @@ import importlib
 import logging
 import os
 import sys
+import time
+import weakref
 
-from collections import KeysView, ItemsView, ValuesView, Mapping
+from bisect import bisect_left
+from functools import partial
+from itertools import count
+from collections import KeysView, ItemsView, ValuesView, Mapping, MutableMapping
 from .. import abc
 from ..compat import text_type, string_types
 from ..decoders import Decoder
-from ..exceptions import ConfigError
+from ..exceptions import ConfigError, LoadError
 from ..interpolation import BashInterpolator, ConfigLookup, ChainLookup, EnvironmentLookup
+from ..mergers import DeepMerger, PersistentMerger
 from ..schedulers import FixedIntervalScheduler
-from ..structures import IgnoreCaseDict
-from ..utils import EventHandler, make_ignore_case, merge_dict
+from ..structures import ChangeSet, IgnoreCaseDict
+from ..utils import EventHandler, diff_dict, flatten_dict, make_case_sensitive, make_ignore_case
+from numbers import Number
+from threading import Condition, Lock, RLock, Thread
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +32,435 @@ logger = logging.getLogger(__name__)
 NESTED_DELIMITER = '.'
 
 
+# the values taken by the generations, they never repeat.
+_generations = count(1)
+
+
+class _Generation(object):
+    """
+    Internal counter of a cache built from the data of other configs,
+    it is bumped whenever any of those configs publishes new data.
+    """
+
+    __slots__ = ('value', '__weakref__')
+
+    def __init__(self):
+        self.value = next(_generations)
+
+    def bump(self):
+        """
+        Change the value, the caches stamped with the previous value are stale.
+        """
+        self.value = next(_generations)
+
+
+def _observe_data(config, generation):
+    """
+    Register the given generation to be bumped whenever the given config,
+    or any config it reads the data from, publishes new data.
+    :param abc.Config config: The config to be observed.
+    :param _Generation generation: The generation to be bumped.
+    """
+    if isinstance(config, BaseDataConfig):
+        config._observe(generation)
+
+    elif isinstance(config, ChainConfig):
+        for child in config.configs:
+            _observe_data(child, generation)
+
+    elif isinstance(config, (DebounceConfig, LazyConfig, PrefixedConfig, ReloadConfig)):
+        _observe_data(config.config, generation)
+
+
+def _check_load_options(max_workers, timeout):
+    """
+    Check the options used to load the children of a config concurrently.
+    :param int max_workers: The maximum number of threads.
+    :param Number timeout: The maximum number of seconds to load the children.
+    """
+    if max_workers is not None:
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+            raise TypeError('max_workers must be an int')
+
+        if max_workers < 1:
+            raise ValueError('max_workers must be greater than 0')
+
+    if timeout is not None:
+        if not isinstance(timeout, Number):
+            raise TypeError('timeout must be a number')
+
+        if max_workers is None:
+            raise ValueError('timeout requires max_workers')
+
+
+def _load_configs(configs, max_workers=None, timeout=None):
+    """
+    Load the given configs, sequentially if `max_workers` is None,
+    otherwise concurrently using up to `max_workers` threads.
+
+    When loaded concurrently the errors raised by the configs
+    and the configs not loaded before the timeout are raised together
+    as a `LoadError`, the configs still loading are not interrupted.
+    :param list configs: The configs to be loaded.
+    :param int max_workers: The maximum number of threads.
+    :param Number timeout: The maximum number of seconds to load the configs.
+    """
+    if max_workers is None:
+        for config in configs:
+            config.load()
+        return
+
+    errors = [None] * len(configs)
+    loaded = [False] * len(configs)
+    pending = iter(enumerate(configs))
+    lock = Lock()
+    cancelled = []
+
+    def load():
+        while True:
+            with lock:
+                if cancelled:
+                    return
+
+                try:
+                    index, config = next(pending)
+                except StopIteration:
+                    return
+
+            try:
+                config.load()
+            except Exception as e:
+                errors[index] = e
+            finally:
+                loaded[index] = True
+
+    threads = [Thread(target=load, name='LoadConfig') for _ in range(min(max_workers, len(configs)))]
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    deadline = None if timeout is None else time.time() + timeout
+
+    for thread in threads:
+        thread.join(None if deadline is None else max(0, deadline - time.time()))
+
+    with lock:
+        cancelled.append(True)
+
+    failures = []
+
+    for index, config in enumerate(configs):
+        if errors[index] is not None:
+            failures.append((config, errors[index]))
+        elif not loaded[index]:
+            failures.append((config, ConfigError('Config not loaded within %s seconds' % timeout)))
+
+    if failures:
+        raise LoadError(failures)
+
+
+def _subscribe_changes(config, callback):
+    """
+    Add a callback called with a `ChangeSet` whenever the given config is updated,
+    the configs that do not provide the keys changed are reported with an unknown change set.
+    :param abc.Config config: The config to be observed.
+    :param callback: The callback.
+    """
+    if isinstance(config, BaseConfig):
+        config.changed.add(callback)
+    else:
+        config.updated.add(lambda: callback(ChangeSet(unknown=True)))
+
+
+def _is_ignore_case(config):
+    """
+    Get whether the keys of the given config are case insensitive.
+    The wrapper configs follow their child, a chain ignores the case
+    only if all its children do and the other configs ignore the case.
+    :param abc.Config config: The config to be checked.
+    :return bool: True if the keys are case insensitive, otherwise False.
+    """
+    if isinstance(config, BaseDataConfig):
+        return config.ignore_case
+
+    if isinstance(config, ChainConfig):
+        return all(_is_ignore_case(child) for child in config.configs)
+
+    child = getattr(config, 'config', None) if isinstance(config, BaseConfig) else None
+
+    if isinstance(child, abc.Config):
+        return _is_ignore_case(child)
+
+    return True
+
+
+def _get_many_from(config, keys):
+    """
+    Get the values for the given keys from the given config,
+    the values are read one by one from the configs not implementing `get_many`.
+    :param abc.Config config: The config to read the values from.
+    :param dict keys: The keys to be found mapped to a tuple of the
+        data type to convert the value to and the default value.
+    :return dict: The values found mapped by key, otherwise the default values.
+    """
+    try:
+        return config.get_many(keys)
+    except NotImplementedError:
+        values = {}
+
+        for key, (type, default) in keys.items():
+            values[key] = config.get_value(key, type, default)
+
+        return values
+
+
+def _diff_configs(before, after):
+    """
+    Get the keys changed between the given snapshots of a config.
+    :param abc.Config before: The snapshot taken before the change.
+    :param abc.Config after: The snapshot taken after the change.
+    :return ChangeSet: The keys changed.
+    """
+    if isinstance(before, BaseDataConfig) and isinstance(after, BaseDataConfig):
+        return diff_dict(before._data, after._data, NESTED_DELIMITER, after.ignore_case)
+
+    ignore_case = _is_ignore_case(after)
+    dict_cls = IgnoreCaseDict if ignore_case else dict
+
+    before_data = dict_cls((key, before.get_raw(key)) for key in before)
+    after_data = dict_cls((key, after.get_raw(key)) for key in after)
+
+    return diff_dict(before_data, after_data, NESTED_DELIMITER, ignore_case)
+
+
+def _find_dependencies(config, key):
+    """
+    Find the keys the value of the given key depends on,
+    which are the key itself and the keys referenced by interpolation recursively.
+    :param abc.Config config: The config to find the keys.
+    :param str key: The key to be found.
+    :return frozenset: The keys the value depends on.
+    """
+    interpolator = getattr(config, 'interpolator', None)
+
+    if not isinstance(interpolator, abc.StrInterpolator):
+        interpolator = BashInterpolator()
+
+    dependencies = set()
+    pending = [key]
+
+    while pending:
+        key = pending.pop()
+
+        if key in dependencies:
+            continue
+
+        dependencies.add(key)
+
+        try:
+            value = config.get_raw(key)
+        except:
+            logger.warning('Unable to get the raw value of key %s' % key, exc_info=True)
+            continue
+
+        if isinstance(value, string_types):
+            lookup = _ReferenceLookup()
+            interpolator.resolve(value, lookup)
+            pending.extend(lookup.keys)
+
+    return frozenset(dependencies)
+
+
+class _ReferenceLookup(abc.StrLookup):
+    """
+    Internal lookup that records the keys looked up by an interpolator.
+    """
+    def __init__(self):
+        self.keys = []
+
+    def lookup(self, key):
+        """
+        Record the given key.
+        :param str key: The key to lookup.
+        :return str: Always None.
+        """
+        self.keys.append(key)
+
+
+class _Accessor(object):
+    """
+    Internal state of an accessor compiled by `BaseConfig.compile_accessor`.
+
+    The value is read once and kept in a cell read by the accessor,
+    it is read again only when the keys it depends on are changed.
+
+    Every change bumps a generation, a value is kept only if no change
+    happened while it was read, so a stale value never replaces a newer one.
+
+    The values referencing other keys are not kept when the config resolves
+    the variables from another config, e.g. a child of a `ChainConfig`,
+    the keys referenced may be changed there without this config knowing.
+
+    :param BaseConfig config: The config to read the value from.
+    :param str key: The key to be found.
+    :param type: The data type to convert the value to.
+    :param default: The default value if the key is not found.
+    """
+
+    __slots__ = ('_config', '_key', '_type', '_default', '_dependencies', '_volatile',
+                 '_generation', '_lock', 'cell', 'func')
+
+    __marker = object()
+
+    def __init__(self, config, key, type, default):
+        self._config = config
+        self._key = key
+        self._type = type
+        self._default = default
+        self._dependencies = None
+        self._volatile = False
+        self._generation = 0
+        self._lock = Lock()
+
+        marker = self.__marker
+
+        # the value is read on the first call, so an accessor
+        # compiled before the config is loaded is not left stale.
+        cell = [marker]
+
+        def accessor():
+            value = cell[0]
+
+            if value is marker:
+                if self._volatile:
+                    return self.get()
+
+                value = self._load()
+
+            return value
+
+        self.cell = cell
+        self.func = accessor
+
+    def config_changed(self, changes):
+        """
+        Called when the config was changed, the value is read again
+        if any key it depends on has changed.
+        :param ChangeSet changes: The keys changed.
+        """
+        dependencies = self._dependencies
+
+        if dependencies is not None and not changes.unknown and \
+                not any(changes.affects(key) for key in dependencies):
+            return
+
+        with self._lock:
+            self._generation += 1
+            self._volatile = False
+
+        if dependencies is None:
+            # never read, or the first read is in progress and
+            # discards its value, the value is read on the next call.
+            return
+
+        self._load()
+
+    def get(self):
+        """
+        Get the value from the config without keeping it,
+        the default value is returned if the value cannot be read.
+        :return: The value.
+        """
+        try:
+            return self._config.get_value(self._key, self._type, self._default)
+        except:
+            logger.warning('Unable to get the value of key %s' % self._key, exc_info=True)
+            return self._default() if callable(self._default) else self._default
+
+    def _load(self):
+        """
+        Read the value and keep it in the cell unless
+        the config was changed while it was being read.
+        :return: The value.
+        """
+        generation = self._generation
+
+        # the dependencies are found first, so a change made
+        # while reading the value reads it again.
+        dependencies = self._dependencies = _find_dependencies(self._config, self._key)
+
+        value = self.get()
+
+        lookup = self._config.lookup
+        volatile = len(dependencies) > 1 and not (isinstance(lookup, ConfigLookup) and lookup.config is self._config)
+
+        with self._lock:
+            if self._generation == generation:
+                if volatile:
+                    self._volatile = True
+                    self.cell[0] = self.__marker
+                else:
+                    self.cell[0] = value
+
+        return value
+
+
+class _UpdatedEventHandler(EventHandler):
+    """
+    Internal updated event handler of a `BaseConfig`.
+
+    The configs built before the changed event announced new data by
+    triggering the updated event directly, so triggering it directly
+    triggers the changed event with an unknown change set first.
+
+    :param EventHandler changed: The changed event handler of the config.
+    """
+
+    __slots__ = ('_changed',)
+
+    def __init__(self, changed):
+        super(_UpdatedEventHandler, self).__init__()
+        self._changed = changed
+
+    def __call__(self, *args):
+        """
+        Trigger the changed event with an unknown change set
+        followed by the callbacks of this event.
+        """
+        self._changed(ChangeSet(unknown=True))
+        return self.trigger(*args)
+
+    def trigger(self, *args):
+        """
+        Execute the callbacks without triggering the changed event,
+        it is used once the changed event has been triggered.
+        """
+        return super(_UpdatedEventHandler, self).__call__(*args)
+
+
+def _scan_prefixed_keys(config, prefix):
+    """
+    Find the keys under the given prefix by going through every key of the config.
+    :param abc.Config config: The config to find the keys.
+    :param str prefix: The prefix without the trailing delimiter.
+    :return set: The keys found without the prefix.
+    """
+    keys = set()
+    prefix_delimited = prefix + NESTED_DELIMITER
+
+    for key in config:
+        if key == prefix:
+            value = config.get(key)
+            if isinstance(value, Mapping):
+                keys.update(value.keys())
+
+        elif key.startswith(prefix_delimited):
+            keys.add(key[len(prefix_delimited):])
+
+    return keys
+
+
 class BaseConfig(abc.Config):
     """
     Base config class for implementing an `abc.Config`.
@@ -31,7 +468,10 @@ class BaseConfig(abc.Config):
 
     def __init__(self):
         self._lookup = ConfigLookup(self)
-        self._updated = EventHandler()
+        self._changed = EventHandler()
+        self._updated = _UpdatedEventHandler(self._changed)
+        self._prefixed_cached = {}
+        self._accessors = {}
 
     def get(self, key, default=None):
         """
@@ -87,6 +527,38 @@ class BaseConfig(abc.Config):
         """
         return self.get_value(key, list, default=default)
 
+    def get_many(self, keys):
+        """
+        Get the values for the given keys as the specified types, all the values
+        are read from the same version of the configuration.
+
+        Example usage:
+
+        .. code-block:: python
+
+            from central.config import MemoryConfig
+
+            config = MemoryConfig(data={'host': 'localhost', 'port': '5432'})
+
+            values = config.get_many({
+                'host': (str, None),
+                'port': (int, 5432),
+            })
+
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        if not isinstance(keys, Mapping):
+            raise TypeError('keys must be a dict')
+
+        try:
+            config = self.snapshot()
+        except NotImplementedError:
+            config = self
+
+        return config._get_many(keys)
+
     def get_str(self, key, default=None):
         """
         Get the value for given key as a str if key is in the configuration, otherwise None.
@@ -143,11 +615,35 @@ class BaseConfig(abc.Config):
     @property
     def updated(self):
         """
-        Get the updated event handler.
+        Get the updated event handler, triggering it directly
+        triggers the changed event with an unknown change set first.
         :return EventHandler: The event handler.
         """
         return self._updated
 
+    @property
+    def changed(self):
+        """
+        Get the changed event handler, its callbacks are called
+        with a `ChangeSet` right before the updated event is triggered.
+
+        Example usage:
+
+        .. code-block:: python
+
+            from central.config import MemoryConfig
+
+            config = MemoryConfig()
+
+            @config.changed.add
+            def config_changed(changes):
+                if changes.affects('database'):
+                    pass
+
+        :return EventHandler: The event handler.
+        """
+        return self._changed
+
     def on_updated(self, func):
         """
         Add a new callback for updated event.
@@ -169,6 +665,63 @@ class BaseConfig(abc.Config):
         """
         self.updated.add(func)
 
+    def compile_accessor(self, key, type=object, default=None):
+        """
+        Get a function without arguments that returns the value for the given key,
+        it is meant for the values read so often that the cost of reading a
+        `Property` matters.
+
+        The value is kept by the function and read again from the configuration
+        only when the key or any key referenced by it is changed. If the variables
+        are resolved from another configuration, e.g. by a child of a `ChainConfig`,
+        the values referencing other keys are read on every call.
+
+        Example usage:
+
+        .. code-block:: python
+
+            from central.config import MemoryConfig
+
+            config = MemoryConfig(data={'database': {'port': '5432'}})
+
+            port = config.compile_accessor('database.port', int, 5432)
+
+            value = port()
+
+        The functions are cached by key, data type and default value,
+        if the default value is not hashable the function is not cached
+        and reads the value from the configuration on every call.
+
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The function that returns the value.
+        """
+        if not isinstance(key, string_types):
+            raise TypeError('key must be a str')
+
+        if type is None:
+            raise ValueError('type cannot be None')
+
+        cache_key = (key, type, default)
+
+        try:
+            accessor = self._accessors.get(cache_key)
+        except TypeError:
+            # the default value is not hashable, e.g. a list or a dict,
+            # the accessor cannot be cached so it is not subscribed
+            # to the changes and the value is read on every call.
+            return _Accessor(self, key, type, default).get
+
+        if accessor is None:
+            created = _Accessor(self, key, type, default)
+            accessor = self._accessors.setdefault(cache_key, created)
+
+            if accessor is created:
+                self._changed.add(accessor.config_changed)
+
+        return accessor.func
+
     def prefixed(self, prefix):
         """
         Get a subset of the configuration prefixed by a key.
@@ -183,10 +736,24 @@ class BaseConfig(abc.Config):
 
             host = config.get('host')
 
+        The subsets are cached by prefix and share the lookup of this
+        configuration, so variables are resolved from the root of it.
+
         :param str prefix: The prefix to prepend to the keys.
         :return abc.Config: The subset of the configuration prefixed by a key.
         """
-        return PrefixedConfig(prefix, self)
+        if not isinstance(prefix, string_types):
+            raise TypeError('prefix must be a str')
+
+        prefix = prefix.rstrip(NESTED_DELIMITER)
+
+        config = self._prefixed_cached.get(prefix)
+
+        if config is None:
+            config = PrefixedConfig(prefix, self, share_lookup=True)
+            config = self._prefixed_cached.setdefault(prefix, config)
+
+        return config
 
     def reload_every(self, interval):
         """
@@ -197,6 +764,63 @@ class BaseConfig(abc.Config):
         """
         return ReloadConfig(self, FixedIntervalScheduler(interval))
 
+    def aload(self):
+        """
+        Load the configuration asynchronously, it requires Python 3.5+.
+        By default `load` is called in the default executor of the event loop.
+
+        This method does not trigger the updated event.
+        :return: A coroutine that loads the configuration.
+        """
+        from .aio import run_in_executor
+        return run_in_executor(self.load)
+
+    def debounce(self, window, max_delay=None):
+        """
+        Get a debounce configuration that coalesces the bursts
+        of changes of the current configuration into one updated event.
+        :param Number window: The seconds without changes that ends a burst.
+        :param Number max_delay: The maximum number of seconds a change is delayed.
+        :return DebounceConfig: The debounce config object.
+        """
+        return DebounceConfig(self, window, max_delay)
+
+    def lazy(self):
+        """
+        Get a lazy configuration that loads the current
+        configuration only when a key is first accessed.
+        :return LazyConfig: The lazy config object.
+        """
+        return LazyConfig(self)
+
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys from this configuration.
+        It is called by `get_many` on a snapshot of the configuration.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        values = {}
+
+        for key, (type, default) in keys.items():
+            values[key] = self.get_value(key, type, default)
+
+        return values
+
+    def _inherit_lookup(self, snapshot):
+        """
+        Set the lookup of this config to the given snapshot.
+        If it is the default lookup, the snapshot resolves variables by itself.
+        :param abc.Config snapshot: The snapshot taken from this config.
+        """
+        lookup = self._lookup
+
+        if isinstance(lookup, ConfigLookup) and lookup.config is self:
+            snapshot.lookup = None
+        else:
+            snapshot.lookup = lookup
+
     def _lookup_changed(self, lookup):
         """
         Called when the lookup property is changed.
@@ -204,6 +828,25 @@ class BaseConfig(abc.Config):
         """
         pass
 
+    def _prefixed_keys(self, prefix):
+        """
+        Get the keys under the given prefix, it is used by `PrefixedConfig`.
+        The keys are either the keys of a dict stored in the prefix
+        or the keys starting with the prefix followed by the delimiter.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
+        """
+        return _scan_prefixed_keys(self, prefix)
+
+    def _trigger_updated(self, changes):
+        """
+        Trigger the changed event with the given change set
+        followed by the updated event.
+        :param ChangeSet changes: The keys changed.
+        """
+        self._changed(changes)
+        self._updated.trigger()
+
     def __contains__(self, key):
         """
         Get true if key is in the configuration, otherwise false.
@@ -229,18 +872,69 @@ class BaseConfig(abc.Config):
 class BaseDataConfig(BaseConfig):
     """
     Base config class that holds keys.
+
+    The data is published as a snapshot which is never modified and is
+    replaced by a single assignment whenever the data changes, readers
+    never take a lock and never see a partially applied change.
+
+    The nested dicts and lists returned by `get` are the ones held by the
+    snapshot, they are shared by every snapshot of the same data and
+    must not be modified.
+
+    The decoded values are cached by key and type until the data changes.
     """
 
+    __marker = object()
+
     def __init__(self):
         super(BaseDataConfig, self).__init__()
-        self._data = IgnoreCaseDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._ignore_case = True
+        self._indexed = False
+        self._lock = Lock()
+        self._observers = ()
+        self._snapshot = _Snapshot(IgnoreCaseDict(), None, 0)
         self._decoder = Decoder.instance()
         self._interpolator = BashInterpolator()
 
     @property
-    def decoder(self):
+    def _data(self):
         """
-        Get the decoder.
+        Get the data loaded.
+        :return IgnoreCaseDict: The data loaded.
+        """
+        return self._snapshot.data
+
+    @_data.setter
+    def _data(self, value):
+        """
+        Set the data loaded.
+        The data must not be modified once it has been set.
+        :param IgnoreCaseDict value: The data loaded.
+        """
+        self._publish(value)
+
+    @property
+    def cache_hits(self):
+        """
+        Get the number of values found in the cache of decoded values.
+        :return int: The number of cache hits.
+        """
+        return self._cache_hits
+
+    @property
+    def cache_misses(self):
+        """
+        Get the number of values not found in the cache of decoded values.
+        :return int: The number of cache misses.
+        """
+        return self._cache_misses
+
+    @property
+    def decoder(self):
+        """
+        Get the decoder.
         :return abc.Decoder: The decoder.
         """
         return self._decoder
@@ -255,6 +949,7 @@ class BaseDataConfig(BaseConfig):
             raise TypeError('decoder must be an abc.Decoder')
 
         self._decoder = value
+        self._publish(self._data, self._snapshot.index)
 
     @property
     def interpolator(self):
@@ -274,6 +969,68 @@ class BaseDataConfig(BaseConfig):
             raise TypeError('interpolator must be an abc.StrInterpolator')
 
         self._interpolator = value
+        self._publish(self._data, self._snapshot.index)
+
+    @property
+    def ignore_case(self):
+        """
+        Get whether the keys are case insensitive.
+        :return bool: True if the keys are case insensitive, otherwise False.
+        """
+        return self._ignore_case
+
+    @ignore_case.setter
+    def ignore_case(self, value):
+        """
+        Set whether the keys are case insensitive.
+
+        When disabled, the data is held by plain dicts and the keys
+        are matched exactly, which avoids lower casing the keys on
+        every lookup, it should be used when the keys are normalized.
+        :param bool value: True if the keys are case insensitive, otherwise False.
+        """
+        if not isinstance(value, bool):
+            raise TypeError('ignore_case must be a bool')
+
+        with self._lock:
+            self._ignore_case = value
+            self._publish(self._make_dict(self._data))
+
+    @property
+    def indexed(self):
+        """
+        Get whether the nested keys are indexed.
+        :return bool: True if the nested keys are indexed, otherwise False.
+        """
+        return self._indexed
+
+    @indexed.setter
+    def indexed(self, value):
+        """
+        Set whether the nested keys are indexed.
+
+        When enabled, a flattened index of every delimited path is
+        built once per load, so a nested key costs a single lookup.
+        :param bool value: True to index the nested keys, otherwise False.
+        """
+        if not isinstance(value, bool):
+            raise TypeError('indexed must be a bool')
+
+        self._indexed = value
+        self._publish(self._data)
+
+    def get_many(self, keys):
+        """
+        Get the values for the given keys as the specified types, all the values
+        are read from the same version of the data without taking a snapshot.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        if not isinstance(keys, Mapping):
+            raise TypeError('keys must be a dict')
+
+        return self._get_many(keys)
 
     def get_raw(self, key):
         """
@@ -285,17 +1042,118 @@ class BaseDataConfig(BaseConfig):
         if key is None:
             raise TypeError('key cannot be None')
 
-        value = self._data.get(key)
+        return self._find(self._snapshot, key)
+
+    def get_value(self, key, type, default=None):
+        """
+        Get the value for given key as the specified type if key is in the configuration, otherwise default.
+        It can access a nested field by passing a . delimited path of keys and
+        the interpolator is used to resolve variables.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The value found, otherwise default.
+        """
+        return self._get_value(self._snapshot, key, type, default)
+
+    def snapshot(self):
+        """
+        Get a view of the current data, not affected by further changes,
+        so multiple keys can be read from the same data.
+        :return SnapshotConfig: The view of the current data.
+        """
+        return SnapshotConfig(self)
+
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys from the current data.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        snapshot = self._snapshot
+
+        values = {}
+
+        for key, (type, default) in keys.items():
+            values[key] = self._get_value(snapshot, key, type, default)
+
+        return values
+
+    def _get_value(self, snapshot, key, type, default):
+        """
+        Get the value for given key as the specified type from the given snapshot.
+        :param _Snapshot snapshot: The snapshot to look the key up.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The value found, otherwise default.
+        """
+        if key is None:
+            raise TypeError('key cannot be None')
+
+        if type is None:
+            raise TypeError('type cannot be None')
+
+        cache_key = (key, type)
+
+        value = snapshot.cache.get(cache_key, self.__marker)
+
+        if value is not self.__marker:
+            self._cache_hits += 1
+            return value
+
+        self._cache_misses += 1
+
+        value = self._find(snapshot, key)
+
+        if value is None:
+            if callable(default):
+                return default()
+
+            return default
+
+        cacheable = True
+
+        if isinstance(value, string_types):
+            resolved_value = self._interpolator.resolve(value, self._lookup)
+
+            # interpolated values depend on other keys,
+            # possibly from other configs, so they are not cached.
+            cacheable = resolved_value == value
+            value = resolved_value
+
+        if type is not object:
+            value = self._decoder.decode(value, type)
+
+        # mutable values are not cached, otherwise a change made
+        # by a caller would be seen by every later caller.
+        if cacheable and not isinstance(value, (list, set, MutableMapping)):
+            snapshot.cache[cache_key] = value
+
+        return value
+
+    def _find(self, snapshot, key):
+        """
+        Find the raw value for given key in the given snapshot.
+        :param _Snapshot snapshot: The snapshot to look the key up.
+        :param str key: The key to be found.
+        :return: The value found, otherwise None.
+        """
+        value = snapshot.data.get(key)
 
         if value is not None:
             return value
 
+        if snapshot.index is not None:
+            return snapshot.index.get(key.lower() if self._ignore_case else key)
+
         paths = key.split(NESTED_DELIMITER)
 
         if key == paths[0]:
             return None
 
-        value = self._data.get(paths[0])
+        value = snapshot.data.get(paths[0])
 
         for i in range(1, len(paths)):
             if value is None:
@@ -309,37 +1167,124 @@ class BaseDataConfig(BaseConfig):
 
         return value
 
-    def get_value(self, key, type, default=None):
+    def _prefixed_keys(self, prefix):
         """
-        Get the value for given key as the specified type if key is in the configuration, otherwise default.
-        It can access a nested field by passing a . delimited path of keys and
-        the interpolator is used to resolve variables.
-        :param str key: The key to be found.
-        :param type: The data type to convert the value to.
-        :param default: The default value if the key is not found.
-        :return: The value found, otherwise default.
+        Get the keys under the given prefix, it is used by `PrefixedConfig`.
+        The keys are found by a binary search on the sorted keys,
+        so the cost is proportional to the number of keys found.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
         """
-        if key is None:
-            raise TypeError('key cannot be None')
+        snapshot = self._snapshot
 
-        if type is None:
-            raise TypeError('type cannot be None')
+        sorted_keys = snapshot.sorted_keys
 
-        value = self.get_raw(key)
+        if sorted_keys is None:
+            sorted_keys = snapshot.sorted_keys = sorted(snapshot.data)
 
-        if value is None:
-            if callable(default):
-                return default()
+        keys = set()
 
-            return default
+        i = bisect_left(sorted_keys, prefix)
 
-        if isinstance(value, string_types):
-            value = self._interpolator.resolve(value, self._lookup)
+        if i < len(sorted_keys) and sorted_keys[i] == prefix:
+            value = snapshot.data.get(prefix)
+            if isinstance(value, Mapping):
+                keys.update(value.keys())
 
-        if type is object:
-            return value
+        prefix_delimited = prefix + NESTED_DELIMITER
+
+        for i in range(bisect_left(sorted_keys, prefix_delimited), len(sorted_keys)):
+            key = sorted_keys[i]
+
+            if not key.startswith(prefix_delimited):
+                break
+
+            keys.add(key[len(prefix_delimited):])
+
+        return keys
+
+    def _make_dict(self, data=None):
+        """
+        Make a dict that matches the keys according to `ignore_case`.
+        :param Mapping data: The mapping to be converted along with its
+            nested mappings, if None an empty dict is made.
+        :return Mapping: An `IgnoreCaseDict` if the keys are case insensitive,
+            otherwise a plain dict.
+        """
+        if data is None:
+            return IgnoreCaseDict() if self._ignore_case else {}
+
+        if self._ignore_case:
+            return make_ignore_case(data)
+
+        return make_case_sensitive(data)
+
+    def _publish(self, data, index=None):
+        """
+        Publish a new snapshot holding the given data.
+        :param IgnoreCaseDict data: The data to be published.
+        :param dict index: The index of nested keys for the data,
+            if None and the nested keys are indexed a new index is built.
+        """
+        if not self._indexed:
+            index = None
+        elif index is None:
+            index = flatten_dict(data, NESTED_DELIMITER, self._ignore_case)
+
+        self._snapshot = _Snapshot(data, index, self._snapshot.version + 1)
+
+        # the generations are bumped after the snapshot is published, so a
+        # cache stamped with a new generation is never built from the old data.
+        for ref in self._observers:
+            generation = ref()
+
+            if generation is not None:
+                generation.bump()
+
+    def _observe(self, generation):
+        """
+        Register the given generation to be bumped whenever new data is published,
+        the generation is held by a weak reference.
+        :param _Generation generation: The generation to be bumped.
+        """
+        with self._lock:
+            # the observers are replaced rather than modified,
+            # so publishing goes through them without a lock.
+            self._observers = tuple(ref for ref in self._observers if ref() is not None) + \
+                (weakref.ref(generation),)
+
+    def _set_key(self, key, value):
+        """
+        Publish a copy of the current data with the value
+        of the given top level key replaced.
+        :param str key: The top level key.
+        :param value: The new value.
+        :return ChangeSet: The keys changed.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+
+            data = snapshot.data.copy()
+
+            old_value = data.get(key)
+
+            data[key] = value
+
+            index = snapshot.index
 
-        return self._decoder.decode(value, type)
+            if index is not None and NESTED_DELIMITER not in key:
+                index = index.copy()
+
+                if old_value is not None:
+                    for path in flatten_dict({key: old_value}, NESTED_DELIMITER, self._ignore_case):
+                        index.pop(path, None)
+
+                if value is not None:
+                    index.update(flatten_dict({key: value}, NESTED_DELIMITER, self._ignore_case))
+
+            self._publish(data, index)
+
+        return diff_dict({key: old_value}, {key: value}, NESTED_DELIMITER, self._ignore_case)
 
     def __iter__(self):
         """
@@ -356,6 +1301,28 @@ class BaseDataConfig(BaseConfig):
         return len(self._data)
 
 
+class _Snapshot(object):
+    """
+    Internal class that holds the data published by a `BaseDataConfig`.
+
+    The data and the index are never modified once published, only the
+    cache of decoded values and the sorted keys are filled on demand.
+
+    :param IgnoreCaseDict data: The data.
+    :param dict index: The index of nested keys, None if not indexed.
+    :param int version: The version of the data.
+    """
+
+    __slots__ = ('data', 'index', 'cache', 'sorted_keys', 'version')
+
+    def __init__(self, data, index, version):
+        self.data = data
+        self.index = index
+        self.cache = {}
+        self.sorted_keys = None
+        self.version = version
+
+
 class ChainConfig(BaseConfig):
     """
     Combine multiple `abc.Config` in a fallback chain.
@@ -379,19 +1346,40 @@ class ChainConfig(BaseConfig):
         value = config.get('key1')
 
     :param configs: The list of `abc.Config`.
+    :param int max_workers: If given the children are loaded concurrently
+        using up to `max_workers` threads, otherwise they are loaded sequentially.
+    :param Number timeout: The maximum number of seconds to load the children concurrently.
     """
-    def __init__(self, *configs):
+
+    __marker = object()
+
+    def __init__(self, *configs, **kwargs):
         super(ChainConfig, self).__init__()
 
+        max_workers = kwargs.pop('max_workers', None)
+        timeout = kwargs.pop('timeout', None)
+
+        if kwargs:
+            raise TypeError('Unexpected keyword argument %s' % next(iter(kwargs)))
+
+        _check_load_options(max_workers, timeout)
+
         for config in configs:
             if not isinstance(config, abc.Config):
                 raise TypeError('config must be an abc.Config')
 
             config.lookup = self._lookup
-            config.updated.add(self._config_updated)
+            _subscribe_changes(config, self._config_updated)
 
         self._configs = configs
         self._keys_cached = None
+        self._owners_cached = (None, {})
+        self._generation = _Generation()
+
+        for config in configs:
+            _observe_data(config, self._generation)
+        self._max_workers = max_workers
+        self._timeout = timeout
 
     @property
     def configs(self):
@@ -401,6 +1389,22 @@ class ChainConfig(BaseConfig):
         """
         return self._configs
 
+    @property
+    def max_workers(self):
+        """
+        Get the maximum number of threads used to load the children.
+        :return int: The maximum number of threads, None if loaded sequentially.
+        """
+        return self._max_workers
+
+    @property
+    def timeout(self):
+        """
+        Get the maximum number of seconds to load the children.
+        :return Number: The maximum number of seconds, None if there is no timeout.
+        """
+        return self._timeout
+
     def get_raw(self, key):
         """
         Get the raw value for given key if key is in the configuration, otherwise None.
@@ -408,12 +1412,12 @@ class ChainConfig(BaseConfig):
         :param str key: The key to be found.
         :return: The value found, otherwise None.
         """
-        for config in reversed(self._configs):
-            value = config.get_raw(key)
-            if value is not None:
-                return value
+        owner = self._get_owner(key)
+
+        if owner is None:
+            return None
 
-        return None
+        return owner.get_raw(key)
 
     def get_value(self, key, type, default=None):
         """
@@ -424,8 +1428,13 @@ class ChainConfig(BaseConfig):
         :param default: The default value if the key is not found.
         :return: The value found, otherwise default.
         """
-        for config in reversed(self._configs):
-            value = config.get_value(key, type)
+        if type is None:
+            raise TypeError('type cannot be None')
+
+        owner = self._get_owner(key)
+
+        if owner is not None:
+            value = owner.get_value(key, type)
             if value is not None:
                 return value
 
@@ -434,27 +1443,62 @@ class ChainConfig(BaseConfig):
 
         return default
 
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        It is made of a snapshot of every sub configuration.
+        :return ChainConfig: The view of the current configuration.
+        """
+        snapshot = ChainConfig(*[config.snapshot() for config in self._configs])
+        self._inherit_lookup(snapshot)
+        return snapshot
+
     def load(self):
         """
         Load the sub configurations.
 
         This method does not trigger the updated event.
         """
-        self._keys_cached = None
+        _load_configs(self._configs, self._max_workers, self._timeout)
 
-        for config in self._configs:
-            config.load()
+        # the cache is reset once the children are loaded, so the owners
+        # found by a read made while loading are not kept.
+        self._reset_cache()
+
+    def aload(self):
+        """
+        Load the sub configurations asynchronously, it requires Python 3.5+.
+        The sub configurations are loaded concurrently by awaiting their `aload`.
+
+        The errors raised by the sub configurations are raised together as a `LoadError`.
+
+        This method does not trigger the updated event.
+        :return: A coroutine that loads the sub configurations.
+        """
+        from .aio import load_configs, then
+        return then(load_configs(self._configs, self._max_workers, self._timeout), self._reset_cache)
 
-    def _config_updated(self):
+    def _config_updated(self, changes):
         """
-        Called by updated event from the children.
+        Called by changed event from the children.
         It is not intended to be called directly.
+        :param ChangeSet changes: The keys changed in the child.
         """
+        if not changes:
+            return
+
         # reset the cache because the children's
         # configuration has been changed.
-        self._keys_cached = None
+        self._reset_cache()
 
-        self.updated()
+        self._trigger_updated(changes)
+
+    def _reset_cache(self):
+        """
+        Reset the cache for the children's keys and owners.
+        """
+        self._keys_cached = None
+        self._owners_cached = (None, {})
 
     def _lookup_changed(self, lookup):
         """
@@ -466,10 +1510,11 @@ class ChainConfig(BaseConfig):
 
     def _build_cached_keys(self):
         """
-        Build the cache for the children's keys.
-        :return IgnoreCaseDict: The dict containing the keys. 
+        Build the cache for the children's keys, the keys differing
+        only in case are merged only if every child ignores the case.
+        :return Mapping: The dict containing the keys.
         """
-        keys = IgnoreCaseDict()
+        keys = IgnoreCaseDict() if _is_ignore_case(self) else {}
 
         for config in self._configs:
             for key in config.keys():
@@ -480,12 +1525,94 @@ class ChainConfig(BaseConfig):
     def _get_cached_keys(self):
         """
         Get the cache for the children's keys.
-        :return IgnoreCaseDict: The dict containing the keys. 
+        :return Mapping: The dict containing the keys.
         """
         if self._keys_cached is None:
             self._keys_cached = self._build_cached_keys()
         return self._keys_cached
 
+    def _get_owner(self, key):
+        """
+        Get the child that holds the given key, the last child wins.
+
+        The owners are cached by key, including the keys not found,
+        the cache is reset by the changed events of the children and
+        whenever any data config under the children publishes new data.
+        :param str key: The key to be found.
+        :return abc.Config: The child found, otherwise None.
+        """
+        # the cache and the generation are read before the children,
+        # so an owner found in stale data never lands in a newer cache.
+        generation, owners = self._owners_cached
+        latest_generation = self._generation.value
+
+        if generation != latest_generation:
+            owners = {}
+            self._owners_cached = (latest_generation, owners)
+
+        owner = owners.get(key, self.__marker)
+
+        if owner is not self.__marker:
+            return owner
+
+        owner = None
+
+        for config in reversed(self._configs):
+            if config.get_raw(key) is not None:
+                owner = config
+                break
+
+        owners[key] = owner
+
+        return owner
+
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys going through every child once,
+        the keys found in a child are not looked up in the previous children.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        values = {}
+        pending = dict((key, (type, None)) for key, (type, _) in keys.items())
+
+        for config in reversed(self._configs):
+            if not pending:
+                break
+
+            if isinstance(config, BaseConfig):
+                found = config._get_many(pending)
+            else:
+                found = _get_many_from(config, pending)
+
+            for key, value in found.items():
+                if value is not None:
+                    values[key] = value
+                    del pending[key]
+
+        for key in pending:
+            default = keys[key][1]
+            values[key] = default() if callable(default) else default
+
+        return values
+
+    def _prefixed_keys(self, prefix):
+        """
+        Get the keys under the given prefix from every child.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
+        """
+        keys = set()
+
+        for config in self._configs:
+            if isinstance(config, BaseConfig):
+                keys.update(config._prefixed_keys(prefix))
+            else:
+                keys.update(_scan_prefixed_keys(config, prefix))
+
+        return keys
+
     def __iter__(self):
         """
         Get a new iterator object that can iterate over the keys of the configuration.
@@ -524,7 +1651,7 @@ class CommandLineConfig(BaseDataConfig):
 
         This method does not trigger the updated event.
         """
-        data = IgnoreCaseDict()
+        data = self._make_dict()
 
         # the first item is the file name.
         args = sys.argv[1:]
@@ -539,61 +1666,599 @@ class CommandLineConfig(BaseDataConfig):
 
             key_start_index = 0
 
-            if current_arg.startswith('--'):
-                key_start_index = 2
+            if current_arg.startswith('--'):
+                key_start_index = 2
+
+            elif current_arg.startswith('-'):
+                key_start_index = 1
+
+            separator = current_arg.find('=')
+
+            if separator == -1:
+                if key_start_index == 0:
+                    raise ConfigError('Unrecognized argument %s format' % current_arg)
+
+                key = current_arg[key_start_index:]
+
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    raise ConfigError('Value for argument %s is missing' % key)
+            else:
+                key = current_arg[key_start_index:separator].strip()
+
+                if not key:
+                    raise ConfigError('Unrecognized argument %s format' % current_arg)
+
+                value = current_arg[separator + 1:].strip()
+
+            data[key] = value
+
+        self._data = data
+
+
+class DebounceConfig(BaseConfig):
+    """
+    A debounce config that coalesces the bursts of changes of its child,
+    the updated event is triggered once with all the keys changed
+    after the child stops changing for a window of time.
+
+    The values are always read from the child, only the
+    updated event is delayed.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.config import DebounceConfig
+        from central.config.etcd import EtcdConfig
+
+        config = DebounceConfig(EtcdConfig(client, '/appname/config'), window=0.1, max_delay=1)
+        config.load()
+
+        @config.on_updated
+        def config_updated():
+            pass
+
+    :param abc.Config config: The config whose changes are coalesced.
+    :param Number window: The seconds without changes that ends a burst.
+    :param Number max_delay: The maximum number of seconds a change is delayed
+        when the child keeps changing, if None a burst lasts until the child stops changing.
+    """
+    def __init__(self, config, window, max_delay=None):
+        super(DebounceConfig, self).__init__()
+
+        if not isinstance(config, abc.Config):
+            raise TypeError('config must be an abc.Config')
+
+        if not isinstance(window, Number):
+            raise TypeError('window must be a number')
+
+        if window < 0:
+            raise ValueError('window cannot be negative')
+
+        if max_delay is not None:
+            if not isinstance(max_delay, Number):
+                raise TypeError('max_delay must be a number')
+
+            if max_delay < window:
+                raise ValueError('max_delay cannot be less than window')
+
+        self._config = config
+        self._config.lookup = self.lookup
+        self._window = window
+        self._max_delay = max_delay
+        self._condition = Condition()
+        self._trigger_lock = Lock()
+        self._changes = None
+        self._first_change = None
+        self._last_change = None
+        _subscribe_changes(self._config, self._config_updated)
+
+    @property
+    def config(self):
+        """
+        Get the config.
+        :return abc.Config: The config.
+        """
+        return self._config
+
+    @property
+    def window(self):
+        """
+        Get the seconds without changes that ends a burst.
+        :return Number: The number of seconds.
+        """
+        return self._window
+
+    @property
+    def max_delay(self):
+        """
+        Get the maximum number of seconds a change is delayed.
+        :return Number: The number of seconds, None if it is not bounded.
+        """
+        return self._max_delay
+
+    def get_raw(self, key):
+        """
+        Get the raw value for given key if key is in the configuration, otherwise None.
+        :param str key: The key to be found.
+        :return: The value found, otherwise default.
+        """
+        return self._config.get_raw(key)
+
+    def get_value(self, key, type, default=None):
+        """
+        Get the value for given key as the specified type if key is in the configuration, otherwise default.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The value found, otherwise default.
+        """
+        return self._config.get_value(key, type, default=default)
+
+    def load(self):
+        """
+        Load the child configuration.
+
+        This method does not trigger the updated event.
+        """
+        self._config.load()
+
+    def aload(self):
+        """
+        Load the child configuration asynchronously, it requires Python 3.5+.
+
+        This method does not trigger the updated event.
+        :return: A coroutine that loads the child configuration.
+        """
+        from .aio import load_config
+        return load_config(self._config)
+
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        :return abc.Config: The view of the current configuration.
+        """
+        snapshot = self._config.snapshot()
+        self._inherit_lookup(snapshot)
+        return snapshot
+
+    def flush(self):
+        """
+        Trigger the updated event for the changes not reported yet
+        without waiting for the burst to end.
+        """
+        with self._trigger_lock:
+            with self._condition:
+                changes = self._changes
+                self._changes = None
+                self._condition.notify_all()
+
+            if changes:
+                try:
+                    self._trigger_updated(changes)
+                except:
+                    logger.warning('Error calling updated event from ' + str(self), exc_info=True)
+
+    def _config_updated(self, changes):
+        """
+        Called by changed event from the child.
+        It is not intended to be called directly.
+        :param ChangeSet changes: The keys changed in the child.
+        """
+        if not changes:
+            return
+
+        with self._condition:
+            now = time.time()
+
+            self._last_change = now
+
+            if self._changes is not None:
+                self._changes = self._changes.merge(changes)
+                return
+
+            self._changes = changes
+            self._first_change = now
+
+        thread = Thread(target=self._wait_burst, name='DebounceConfig')
+        thread.daemon = True
+        thread.start()
+
+    def _wait_burst(self):
+        """
+        Wait for the burst of changes to end and trigger the updated event.
+        It is only intended to be called by the thread started on the first change.
+        """
+        with self._condition:
+            while self._changes is not None:
+                deadline = self._last_change + self._window
+
+                if self._max_delay is not None:
+                    deadline = min(deadline, self._first_change + self._max_delay)
+
+                remaining = deadline - time.time()
+
+                if remaining <= 0:
+                    break
+
+                self._condition.wait(remaining)
+
+        self.flush()
+
+    def _lookup_changed(self, lookup):
+        """
+        Set the new lookup to the child.
+        :param lookup: The new lookup object.
+        """
+        self._config.lookup = lookup
+
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys from the child.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        return _get_many_from(self._config, keys)
+
+    def _prefixed_keys(self, prefix):
+        """
+        Get the keys under the given prefix from the child.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
+        """
+        if isinstance(self._config, BaseConfig):
+            return self._config._prefixed_keys(prefix)
+
+        return _scan_prefixed_keys(self._config, prefix)
+
+    def __iter__(self):
+        """
+        Get a new iterator object that can iterate over the keys of the configuration.
+        :return: The iterator.
+        """
+        return iter(self._config)
+
+    def __len__(self):
+        """
+        Get the number of keys.
+        :return int: The number of keys.
+        """
+        return len(self._config)
+
+
+class EnvironmentConfig(BaseDataConfig):
+    """
+    An environment variable configuration based on `BaseDataConfig`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.config import EnvironmentConfig
+
+        config = EnvironmentConfig()
+        config.load()
+
+        value = config.get('key1')
+
+    """
+
+    def load(self):
+        """
+        Load the configuration from environment variables.
+
+        This method does not trigger the updated event.
+        """
+        self._data = self._make_dict(os.environ)
+
+
+class LazyConfig(BaseConfig):
+    """
+    A lazy config that defers the loading of its child until
+    the configuration is first accessed, the child is loaded only once
+    even when accessed by multiple threads.
+
+    Calling `load` before the first access does nothing,
+    after that the child configuration is loaded again.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.config import ChainConfig, FileConfig, LazyConfig
+
+        config = ChainConfig(
+            LazyConfig(FileConfig('base.json')),
+            LazyConfig(FileConfig('dev.json'))
+        )
+        config.load()
+
+        # dev.json is loaded, base.json is loaded only if
+        # the key is not found in dev.json.
+        value = config.get('key')
+
+    :param abc.Config config: The config to be loaded on first access.
+    """
+    def __init__(self, config):
+        super(LazyConfig, self).__init__()
+
+        if not isinstance(config, abc.Config):
+            raise TypeError('config must be an abc.Config')
+
+        self._config = config
+        self._config.lookup = self.lookup
+        _subscribe_changes(self._config, self._config_updated)
+        self._lock = RLock()
+        self._loaded = False
+        self._loading = False
+
+    @property
+    def config(self):
+        """
+        Get the config.
+        :return abc.Config: The config.
+        """
+        return self._config
+
+    @property
+    def loaded(self):
+        """
+        Get whether the child configuration has been loaded.
+        :return bool: True if the child configuration has been loaded, otherwise False.
+        """
+        return self._loaded
+
+    def get_raw(self, key):
+        """
+        Get the raw value for given key if key is in the configuration, otherwise None.
+        The child configuration is loaded if not loaded yet.
+        :param str key: The key to be found.
+        :return: The value found, otherwise None.
+        """
+        self._ensure_loaded()
+        return self._config.get_raw(key)
+
+    def get_value(self, key, type, default=None):
+        """
+        Get the value for given key as the specified type if key is in the configuration, otherwise default.
+        The child configuration is loaded if not loaded yet.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The value found, otherwise default.
+        """
+        self._ensure_loaded()
+        return self._config.get_value(key, type, default=default)
+
+    def load(self):
+        """
+        Load the child configuration if it has already been loaded,
+        otherwise the load is deferred until the first access.
+
+        This method does not trigger the updated event.
+        """
+        with self._lock:
+            if self._loaded:
+                self._config.load()
+
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        If the child configuration is not loaded yet, the view
+        loads it and takes its snapshot on the first access.
+        :return abc.Config: The view of the current configuration.
+        """
+        if self._loaded:
+            snapshot = self._config.snapshot()
+        else:
+            snapshot = _LazySnapshot(self)
+
+        self._inherit_lookup(snapshot)
+        return snapshot
+
+    def _ensure_loaded(self):
+        """
+        Load the child configuration if not loaded yet.
+        """
+        if self._loaded:
+            return
+
+        with self._lock:
+            # the child may read keys through the lookup
+            # while loading, it reads the data not loaded yet.
+            if self._loaded or self._loading:
+                return
+
+            self._loading = True
+
+            try:
+                self._config.load()
+                self._loaded = True
+            finally:
+                self._loading = False
+
+    def _config_updated(self, changes):
+        """
+        Called by changed event from the child.
+        It is not intended to be called directly.
+        :param ChangeSet changes: The keys changed in the child.
+        """
+        if changes:
+            self._trigger_updated(changes)
+
+    def _lookup_changed(self, lookup):
+        """
+        Set the new lookup to the child.
+        :param lookup: The new lookup object.
+        """
+        self._config.lookup = lookup
+
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys from the child.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        self._ensure_loaded()
+        return _get_many_from(self._config, keys)
+
+    def _prefixed_keys(self, prefix):
+        """
+        Get the keys under the given prefix from the child.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
+        """
+        self._ensure_loaded()
+
+        if isinstance(self._config, BaseConfig):
+            return self._config._prefixed_keys(prefix)
+
+        return _scan_prefixed_keys(self._config, prefix)
+
+    def __iter__(self):
+        """
+        Get a new iterator object that can iterate over the keys of the configuration.
+        The child configuration is loaded if not loaded yet.
+        :return: The iterator.
+        """
+        self._ensure_loaded()
+        return iter(self._config)
+
+    def __len__(self):
+        """
+        Get the number of keys.
+        The child configuration is loaded if not loaded yet.
+        :return int: The number of keys.
+        """
+        self._ensure_loaded()
+        return len(self._config)
+
+
+class _LazySnapshot(BaseConfig):
+    """
+    Internal snapshot of a `LazyConfig` taken before its child was loaded,
+    the child is loaded and its snapshot taken on the first access,
+    every later access reads that snapshot.
+
+    :param LazyConfig config: The config the snapshot was taken from.
+    """
+    def __init__(self, config):
+        super(_LazySnapshot, self).__init__()
+        self._config = config
+        self._lock = RLock()
+        self._snapshot = None
+
+    @property
+    def config(self):
+        """
+        Get the config the snapshot was taken from.
+        :return LazyConfig: The config.
+        """
+        return self._config
 
-            elif current_arg.startswith('-'):
-                key_start_index = 1
+    def get_raw(self, key):
+        """
+        Get the raw value for given key if key is in the configuration, otherwise None.
+        :param str key: The key to be found.
+        :return: The value found, otherwise None.
+        """
+        return self._get_snapshot().get_raw(key)
 
-            separator = current_arg.find('=')
+    def get_value(self, key, type, default=None):
+        """
+        Get the value for given key as the specified type if key is in the configuration, otherwise default.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The value found, otherwise default.
+        """
+        return self._get_snapshot().get_value(key, type, default=default)
 
-            if separator == -1:
-                if key_start_index == 0:
-                    raise ConfigError('Unrecognized argument %s format' % current_arg)
+    def load(self):
+        """
+        Do nothing, a snapshot cannot be reloaded.
+        """
 
-                key = current_arg[key_start_index:]
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        :return _LazySnapshot: The snapshot itself.
+        """
+        return self
 
-                try:
-                    value = next(iterator)
-                except StopIteration:
-                    raise ConfigError('Value for argument %s is missing' % key)
-            else:
-                key = current_arg[key_start_index:separator].strip()
+    def _get_snapshot(self):
+        """
+        Get the snapshot of the child, it is taken on the first call.
+        :return abc.Config: The snapshot of the child.
+        """
+        snapshot = self._snapshot
 
-                if not key:
-                    raise ConfigError('Unrecognized argument %s format' % current_arg)
+        if snapshot is not None:
+            return snapshot
 
-                value = current_arg[separator + 1:].strip()
+        with self._lock:
+            if self._snapshot is None:
+                self._config._ensure_loaded()
 
-            data[key] = value
+                snapshot = self._config.config.snapshot()
+                snapshot.lookup = self._lookup
 
-        self._data = data
+                self._snapshot = snapshot
 
+        return self._snapshot
 
-class EnvironmentConfig(BaseDataConfig):
-    """
-    An environment variable configuration based on `BaseDataConfig`.
+    def _lookup_changed(self, lookup):
+        """
+        Set the new lookup to the snapshot of the child.
+        :param lookup: The new lookup object.
+        """
+        if self._snapshot is not None:
+            self._snapshot.lookup = lookup
 
-    Example usage:
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys from the snapshot of the child.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        snapshot = self._get_snapshot()
 
-    .. code-block:: python
+        if isinstance(snapshot, BaseConfig):
+            return snapshot._get_many(keys)
 
-        from central.config import EnvironmentConfig
+        return _get_many_from(snapshot, keys)
 
-        config = EnvironmentConfig()
-        config.load()
+    def _prefixed_keys(self, prefix):
+        """
+        Get the keys under the given prefix from the snapshot of the child.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
+        """
+        snapshot = self._get_snapshot()
 
-        value = config.get('key1')
+        if isinstance(snapshot, BaseConfig):
+            return snapshot._prefixed_keys(prefix)
 
-    """
+        return _scan_prefixed_keys(snapshot, prefix)
 
-    def load(self):
+    def __iter__(self):
         """
-        Load the configuration from environment variables.
+        Get a new iterator object that can iterate over the keys of the configuration.
+        :return: The iterator.
+        """
+        return iter(self._get_snapshot())
 
-        This method does not trigger the updated event.
+    def __len__(self):
+        """
+        Get the number of keys.
+        :return int: The number of keys.
         """
-        self._data = IgnoreCaseDict(os.environ)
+        return len(self._get_snapshot())
 
 
 class MemoryConfig(BaseDataConfig):
@@ -614,6 +2279,9 @@ class MemoryConfig(BaseDataConfig):
 
         value = config.get('other key')
 
+    The nested mappings of the data and of the values set are not copied,
+    they are shared with the caller and must not be modified after.
+
     :param dict data: The initial data.
     """
 
@@ -624,7 +2292,7 @@ class MemoryConfig(BaseDataConfig):
             if not isinstance(data, Mapping):
                 raise TypeError('data must be a dict')
 
-            self._data = make_ignore_case(data)
+            self._data = self._make_dict(data)
 
     def set(self, key, value):
         """
@@ -637,10 +2305,12 @@ class MemoryConfig(BaseDataConfig):
             raise TypeError('key cannot be None')
 
         if isinstance(value, Mapping):
-            value = make_ignore_case(value)
+            value = self._make_dict(value)
 
-        self._data[key] = value
-        self.updated()
+        changes = self._set_key(key, value)
+
+        if changes:
+            self._trigger_updated(changes)
 
     def load(self):
         """
@@ -663,23 +2333,46 @@ class MergeConfig(BaseDataConfig):
 
         value = config.get('key1')
 
+    When a child is updated only the keys changed by the child are merged again,
+    the nested dicts not affected by the change are shared with the previous merge.
+
     :param configs: The list of `abc.Config`.
+    :param abc.Merger merger: The merger used to merge the keys, if None a `PersistentMerger`
+        is going to be used, the values are copied before being merged by any other merger.
+    :param int max_workers: If given the children are loaded concurrently
+        using up to `max_workers` threads, otherwise they are loaded sequentially.
+    :param Number timeout: The maximum number of seconds to load the children concurrently.
     """
-    def __init__(self, *configs):
+    def __init__(self, *configs, **kwargs):
         super(MergeConfig, self).__init__()
 
+        merger = kwargs.pop('merger', None)
+        max_workers = kwargs.pop('max_workers', None)
+        timeout = kwargs.pop('timeout', None)
+
+        if kwargs:
+            raise TypeError('Unexpected keyword argument %s' % next(iter(kwargs)))
+
         if not isinstance(configs, (tuple, list)):
             raise TypeError('configs must be a list or tuple')
 
-        for config in configs:
+        if merger is not None and not isinstance(merger, abc.Merger):
+            raise TypeError('merger must be an abc.Merger')
+
+        _check_load_options(max_workers, timeout)
+
+        for index, config in enumerate(configs):
             if not isinstance(config, abc.Config):
                 raise TypeError('config must be an abc.Config')
 
             config.lookup = self._lookup
-            config.updated.add(self._config_updated)
+            _subscribe_changes(config, partial(self._config_updated, index))
 
         self._configs = configs
-        self._raw_configs = [self._RawConfig(config) for config in self._configs]
+        self._contributions = None
+        self._merger = merger or PersistentMerger()
+        self._max_workers = max_workers
+        self._timeout = timeout
 
     @property
     def configs(self):
@@ -689,6 +2382,30 @@ class MergeConfig(BaseDataConfig):
         """
         return self._configs
 
+    @property
+    def merger(self):
+        """
+        Get the merger.
+        :return abc.Merger: The merger.
+        """
+        return self._merger
+
+    @property
+    def max_workers(self):
+        """
+        Get the maximum number of threads used to load the children.
+        :return int: The maximum number of threads, None if loaded sequentially.
+        """
+        return self._max_workers
+
+    @property
+    def timeout(self):
+        """
+        Get the maximum number of seconds to load the children.
+        :return Number: The maximum number of seconds, None if there is no timeout.
+        """
+        return self._timeout
+
     def load(self):
         """
         Load the sub configurations and merge them
@@ -696,55 +2413,168 @@ class MergeConfig(BaseDataConfig):
 
         This method does not trigger the updated event.
         """
-        for config in self._configs:
-            config.load()
+        _load_configs(self._configs, self._max_workers, self._timeout)
 
-        data = IgnoreCaseDict()
+        self._merge_configs()
 
-        if len(self._configs) == 0:
-            return data
+    def aload(self):
+        """
+        Load the sub configurations asynchronously and merge them
+        into a single configuration, it requires Python 3.5+.
+        The sub configurations are loaded concurrently by awaiting their `aload`.
 
-        merge_dict(data, *self._raw_configs)
+        The errors raised by the sub configurations are raised together as a `LoadError`.
 
-        self._data = data
+        This method does not trigger the updated event.
+        :return: A coroutine that loads the sub configurations.
+        """
+        from .aio import load_configs, then
+        return then(load_configs(self._configs, self._max_workers, self._timeout), self._merge_configs)
 
-    def _config_updated(self):
+    def _config_updated(self, index, changes):
         """
-        Called by updated event from the children.
+        Called by changed event from the children.
         It is not intended to be called directly.
+        :param int index: The index of the child updated.
+        :param ChangeSet changes: The keys changed in the child.
         """
-        self.updated()
+        with self._lock:
+            if self._contributions is not None:
+                previous_data = self._data
+
+                contributions = list(self._contributions)
+                contributions[index] = self._get_contribution(self._configs[index])
+
+                self._merge_contributions(contributions)
+
+                # the keys changed in the child may be overridden by other children.
+                changes = diff_dict(previous_data, self._data, NESTED_DELIMITER, self._ignore_case)
+
+        if changes:
+            self._trigger_updated(changes)
+
+    def _merge_configs(self):
+        """
+        Merge the sub configurations already loaded.
+        """
+        with self._lock:
+            contributions = [self._get_contribution(config) for config in self._configs]
+
+            self._merge_contributions(contributions)
 
-    class _RawConfig(Mapping):
+    def _get_contribution(self, config):
         """
-        Internal class used to merge a `abc.Config`.
+        Get the top level keys and their raw values from the given child.
+        :param abc.Config config: The child.
+        :return Mapping: The raw values by key.
+        """
+        if isinstance(config, BaseDataConfig):
+            data = config._data
+
+            if self._ignore_case and not isinstance(data, IgnoreCaseDict):
+                data = make_ignore_case(data)
+
+            return data
+
+        data = self._make_dict()
+
+        for key in config:
+            value = config.get_raw(key)
+
+            if value is not None:
+                data[key] = value
+
+        return data
 
-        When we merge configs we want to merge the raw value
-        rather than decoded and interpolated value.
+    def _merge_contributions(self, contributions):
         """
-        def __init__(self, config):
-            self._config = config
+        Merge the keys which differ from the previous contributions
+        and publish the merged data.
+        :param list contributions: The top level data of each child.
+        """
+        previous = self._contributions or [None] * len(contributions)
+
+        changed_keys = self._make_dict()
+
+        for old, new in zip(previous, contributions):
+            if old is new:
+                continue
+
+            for key in new:
+                if old is None or old.get(key) is not new.get(key):
+                    changed_keys[key] = True
+
+            if old is not None:
+                for key in old:
+                    if key not in new:
+                        changed_keys[key] = True
+
+        if self._contributions is None:
+            data = self._make_dict()
+        else:
+            data = self._data.copy()
+
+        for key in changed_keys:
+            value = self._merge_values([contribution.get(key) for contribution in contributions])
 
-        def get(self, key, default=None):
-            value = self._config.get_raw(key)
             if value is None:
-                return default
-            return value
+                data.pop(key, None)
+            else:
+                data[key] = value
+
+        self._contributions = contributions
+        self._data = data
+
+    def _merge_values(self, values):
+        """
+        Merge the given values of a key using the merger.
+        :param list values: The values to be merged, the None values are skipped.
+        :return: The merged value, None if there is no value.
+        """
+        # the values are merged as the value of a single key,
+        # so the merger handles the collisions at any level.
+        key = '_'
+
+        sources = []
 
-        def __contains__(self, key):
-            return key in self._config
+        # the mergers other than PersistentMerger may modify the given values,
+        # which belong to the data published by the children.
+        copy = not isinstance(self._merger, PersistentMerger)
 
-        def __getitem__(self, key):
-            value = self._config.get_raw(key)
+        for value in values:
             if value is None:
-                raise KeyError(key)
-            return value
+                continue
+
+            if copy:
+                value = self._copy_value(value)
+            elif self._ignore_case and isinstance(value, Mapping):
+                value = make_ignore_case(value)
+
+            sources.append({key: value})
+
+        if not sources:
+            return None
+
+        return self._merger.merge(self._make_dict(), *sources).get(key)
 
-        def __iter__(self):
-            return iter(self._config)
+    def _copy_value(self, value):
+        """
+        Copy the given value, the nested dicts and lists are copied as well.
+        :param value: The value to be copied.
+        :return: The copied value.
+        """
+        if isinstance(value, Mapping):
+            data = self._make_dict()
+
+            for key in value:
+                data[key] = self._copy_value(value[key])
 
-        def __len__(self):
-            return len(self._config)
+            return data
+
+        if isinstance(value, list):
+            return [self._copy_value(item) for item in value]
+
+        return value
 
 
 class ModuleConfig(BaseDataConfig):
@@ -764,14 +2594,20 @@ class ModuleConfig(BaseDataConfig):
         value = config.get('key')
 
     :param str name: The module name to be loaded.
+    :param abc.Merger merger: The merger used to merge the modules referenced by _next,
+        if None a `DeepMerger` is going to be used.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, merger=None):
         super(ModuleConfig, self).__init__()
         if not isinstance(name, string_types):
             raise TypeError('name must be a str')
 
+        if merger is not None and not isinstance(merger, abc.Merger):
+            raise TypeError('merger must be an abc.Merger')
+
         self._name = name
+        self._merger = merger or DeepMerger()
 
     @property
     def name(self):
@@ -781,6 +2617,14 @@ class ModuleConfig(BaseDataConfig):
         """
         return self._name
 
+    @property
+    def merger(self):
+        """
+        Get the merger.
+        :return abc.Merger: The merger.
+        """
+        return self._merger
+
     def load(self):
         """
         Load the configuration from a file.
@@ -811,10 +2655,10 @@ class ModuleConfig(BaseDataConfig):
 
             to_merge.append(data)
 
-        data = make_ignore_case(to_merge[0])
+        data = self._make_dict(to_merge[0])
 
         if len(to_merge) > 1:
-            merge_dict(data, *to_merge[1:])
+            data = self._merger.merge(data, *to_merge[1:])
 
         self._data = data
 
@@ -846,8 +2690,11 @@ class PrefixedConfig(BaseConfig):
 
     :param str prefix: The prefix to prepend to the keys.
     :param abc.Config config: The config to load the keys from.
+    :param bool share_lookup: If True the lookup of the config is shared by this
+        view, otherwise the lookup of the config is replaced by the lookup of this view,
+        so variables are resolved relative to the prefix.
     """
-    def __init__(self, prefix, config):
+    def __init__(self, prefix, config, share_lookup=False):
         super(PrefixedConfig, self).__init__()
 
         if not isinstance(prefix, string_types):
@@ -859,7 +2706,12 @@ class PrefixedConfig(BaseConfig):
         self._prefix = prefix.rstrip(NESTED_DELIMITER)
         self._prefix_delimited = prefix if prefix.endswith(NESTED_DELIMITER) else prefix + NESTED_DELIMITER
         self._config = config
-        self._config.lookup = self.lookup
+        self._share_lookup = share_lookup
+
+        if share_lookup:
+            self._lookup = config.lookup
+        else:
+            self._config.lookup = self.lookup
 
     @property
     def config(self):
@@ -911,6 +2763,23 @@ class PrefixedConfig(BaseConfig):
 
         return self._config.get_value(key, type, default=default)
 
+    def compile_accessor(self, key, type=object, default=None):
+        """
+        Get a function without arguments that returns the value for the given key,
+        the function is compiled by the underlying config for the prefixed key.
+        :param str key: The key to be found.
+        :param type: The data type to convert the value to.
+        :param default: The default value if the key is not found.
+        :return: The function that returns the value.
+        """
+        if not isinstance(self._config, BaseConfig):
+            return super(PrefixedConfig, self).compile_accessor(key, type, default)
+
+        if not isinstance(key, string_types):
+            raise TypeError('key must be a str')
+
+        return self._config.compile_accessor(self._prefix_delimited + key, type, default)
+
     def load(self):
         """
         Load the child configuration.
@@ -919,6 +2788,28 @@ class PrefixedConfig(BaseConfig):
         """
         self._config.load()
 
+    def aload(self):
+        """
+        Load the child configuration asynchronously, it requires Python 3.5+.
+
+        This method does not trigger the updated event.
+        :return: An awaitable that loads the child configuration.
+        """
+        from .aio import load_config
+        return load_config(self._config)
+
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        :return PrefixedConfig: The view of the current configuration.
+        """
+        if self._share_lookup:
+            return PrefixedConfig(self._prefix, self._config.snapshot(), share_lookup=True)
+
+        snapshot = PrefixedConfig(self._prefix, self._config.snapshot())
+        self._inherit_lookup(snapshot)
+        return snapshot
+
     def _lookup_changed(self, lookup):
         """
         Set the new lookup to the child.
@@ -926,41 +2817,53 @@ class PrefixedConfig(BaseConfig):
         """
         self._config.lookup = lookup
 
-    def __iter__(self):
+    def _get_many(self, keys):
         """
-        Get a new iterator object that can iterate over the keys of the configuration.
-        :return: The iterator.
+        Get the values for the given keys from the child.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
         """
-        keys = set()
+        prefixed_keys = {}
+
+        for key, value in keys.items():
+            try:
+                prefixed_keys[self._prefix_delimited + key] = value
+            except TypeError:
+                raise TypeError('key must be a str')
 
-        for key in self._config:
-            if key == self._prefix:
-                value = self._config.get(key)
-                if isinstance(value, Mapping):
-                    keys.update(value.keys())
+        if isinstance(self._config, BaseConfig):
+            values = self._config._get_many(prefixed_keys)
+        else:
+            values = _get_many_from(self._config, prefixed_keys)
 
-            elif key.startswith(self._prefix_delimited):
-                keys.update((key[len(self._prefix_delimited):],))
+        start = len(self._prefix_delimited)
 
-        return iter(keys)
+        return dict((key[start:], value) for key, value in values.items())
 
-    def __len__(self):
+    def _find_keys(self):
         """
-        Get the number of keys.
-        :return int: The number of keys.
+        Find the keys under the prefix in the child.
+        :return set: The keys found without the prefix.
         """
-        length = 0
+        if isinstance(self._config, BaseConfig):
+            return self._config._prefixed_keys(self._prefix)
 
-        for key in self._config:
-            if key == self._prefix:
-                value = self._config.get(key)
-                if isinstance(value, Mapping):
-                    length += len(value)
+        return _scan_prefixed_keys(self._config, self._prefix)
 
-            elif key.startswith(self._prefix_delimited):
-                length += 1
+    def __iter__(self):
+        """
+        Get a new iterator object that can iterate over the keys of the configuration.
+        :return: The iterator.
+        """
+        return iter(self._find_keys())
 
-        return length
+    def __len__(self):
+        """
+        Get the number of keys.
+        :return int: The number of keys.
+        """
+        return len(self._find_keys())
 
 
 class ReloadConfig(BaseConfig):
@@ -1039,23 +2942,76 @@ class ReloadConfig(BaseConfig):
         This method does not trigger the updated event.
         """
         self._config.load()
+        self._schedule_reload()
+
+    def aload(self):
+        """
+        Load the child configuration asynchronously and start the scheduler
+        to reload the child configuration from time to time, it requires Python 3.5+.
 
+        The child configuration is reloaded by `load` as the scheduler runs out of the event loop.
+
+        This method does not trigger the updated event.
+        :return: A coroutine that loads the child configuration.
+        """
+        from .aio import load_config, then
+        return then(load_config(self._config), self._schedule_reload)
+
+    def snapshot(self):
+        """
+        Get a view of the current configuration, not affected by further changes.
+        :return abc.Config: The view of the current configuration.
+        """
+        snapshot = self._config.snapshot()
+        self._inherit_lookup(snapshot)
+        return snapshot
+
+    def _schedule_reload(self):
+        """
+        Start the scheduler to reload the child configuration if not started yet.
+        """
         if not self._loaded:
             self._scheduler.schedule(self._reload)
             self._loaded = True
 
+    def _load_changes(self):
+        """
+        Load the child configuration and get the keys changed by it,
+        the changes are unknown if the child cannot take snapshots.
+        :return ChangeSet: The keys changed.
+        """
+        if isinstance(self._config, LazyConfig) and not self._config.loaded:
+            # nothing has been read yet, comparing the snapshots
+            # would load the child before the first access.
+            return ChangeSet()
+
+        try:
+            before = self._config.snapshot()
+        except NotImplementedError:
+            self._config.load()
+            return ChangeSet(unknown=True)
+
+        self._config.load()
+
+        return _diff_configs(before, self._config.snapshot())
+
     def _reload(self):
         """
-        Reload the child configuration and trigger the updated event.
+        Reload the child configuration and trigger the updated event
+        if any key has changed.
         It is only intended to be called by the scheduler.
         """
         try:
-            self._config.load()
+            changes = self._load_changes()
         except:
             logger.warning('Unable to load config ' + text_type(self._config), exc_info=True)
+            return
+
+        if not changes:
+            return
 
         try:
-            self.updated()
+            self._trigger_updated(changes)
         except:
             logger.warning('Error calling updated event from ' + str(self), exc_info=True)
 
@@ -1066,6 +3022,26 @@ class ReloadConfig(BaseConfig):
         """
         self._config.lookup = lookup
 
+    def _get_many(self, keys):
+        """
+        Get the values for the given keys from the child.
+        :param dict keys: The keys to be found mapped to a tuple of the
+            data type to convert the value to and the default value.
+        :return dict: The values found mapped by key, otherwise the default values.
+        """
+        return _get_many_from(self._config, keys)
+
+    def _prefixed_keys(self, prefix):
+        """
+        Get the keys under the given prefix from the child.
+        :param str prefix: The prefix without the trailing delimiter.
+        :return set: The keys found without the prefix.
+        """
+        if isinstance(self._config, BaseConfig):
+            return self._config._prefixed_keys(prefix)
+
+        return _scan_prefixed_keys(self._config, prefix)
+
     def __iter__(self):
         """
         Get a new iterator object that can iterate over the keys of the configuration.
@@ -1079,3 +3055,62 @@ class ReloadConfig(BaseConfig):
         :return int: The number of keys.
         """
         return len(self._config)
+
+
+class SnapshotConfig(BaseDataConfig):
+    """
+    A view of the data held by a `BaseDataConfig`
+    at the time the snapshot was taken.
+
+    It shares the data with the config it was taken from,
+    so taking a snapshot does not copy any data, the nested
+    dicts and lists it returns must not be modified.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.config import MemoryConfig
+
+        config = MemoryConfig(data={'host': 'localhost', 'port': 5432})
+
+        snapshot = config.snapshot()
+
+        host = snapshot.get('host')
+        port = snapshot.get_int('port')
+
+    :param BaseDataConfig config: The config to take the snapshot from.
+    """
+    def __init__(self, config):
+        super(SnapshotConfig, self).__init__()
+
+        if not isinstance(config, BaseDataConfig):
+            raise TypeError('config must be a BaseDataConfig')
+
+        self._decoder = config.decoder
+        self._interpolator = config.interpolator
+        self._ignore_case = config.ignore_case
+        self._indexed = config.indexed
+        self._snapshot = config._snapshot
+
+        config._inherit_lookup(self)
+
+    @property
+    def version(self):
+        """
+        Get the version of the data.
+        :return int: The version of the data.
+        """
+        return self._snapshot.version
+
+    def load(self):
+        """
+        Do nothing, a snapshot cannot be reloaded.
+        """
+
+    def snapshot(self):
+        """
+        Get a view of the current data, not affected by further changes.
+        :return SnapshotConfig: The snapshot itself.
+        """
+        return self
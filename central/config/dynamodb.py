@@ -6,8 +6,6 @@ from collections import Mapping
 
 from ..compat import string_types
 from ..exceptions import LibraryRequiredError
-from ..structures import IgnoreCaseDict
-from ..utils import make_ignore_case
 from .core import BaseDataConfig
 
 try:
@@ -130,7 +128,7 @@ class DynamoDBConfig(BaseDataConfig):
         """
         Load the configuration stored in the DynamoDB.
         """
-        data = IgnoreCaseDict()
+        data = self._make_dict()
 
         table = self._client.Table(self._table_name)
 
@@ -153,7 +151,7 @@ class DynamoDBConfig(BaseDataConfig):
                 value = item[self._value_attribute]
 
                 if isinstance(value, Mapping):
-                    value = make_ignore_case(value)
+                    value = self._make_dict(value)
 
                 data[key] = value
 
@@ -7,8 +7,8 @@ import logging
 from threading import Event, Thread
 from ..compat import string_types
 from ..exceptions import LibraryRequiredError
-from ..structures import IgnoreCaseDict
-from .core import BaseDataConfig
+from ..utils import diff_dict
+from .core import NESTED_DELIMITER, BaseDataConfig
 
 try:
     import etcd
@@ -109,7 +109,7 @@ class EtcdConfig(BaseDataConfig):
         """
         Read the configuration stored in the etcd.
         """
-        data = IgnoreCaseDict()
+        data = self._make_dict()
 
         result = self._client.read(self._path, recursive=True)
 
@@ -119,7 +119,7 @@ class EtcdConfig(BaseDataConfig):
                 continue
 
             keys = self._parse_keys(item.key)
-            value = IgnoreCaseDict() if item.dir else item.value
+            value = self._make_dict() if item.dir else item.value
 
             nested = data
 
@@ -163,39 +163,58 @@ class EtcdConfig(BaseDataConfig):
             try:
                 result = self._client.watch(self._path, index=self._etcd_index, recursive=True)
 
-                for item in result.get_subtree():
-                    keys = self._parse_keys(item.key)
+                with self._lock:
+                    # the published data is never modified, the changes are
+                    # applied to a copy of the nested dicts along each path.
+                    previous_data = self._data
+                    data = previous_data.copy()
+                    copies = set()
 
-                    if len(keys) == 0:
-                        continue
+                    for item in result.get_subtree():
+                        keys = self._parse_keys(item.key)
 
-                    value = IgnoreCaseDict() if item.dir else item.value
+                        if len(keys) == 0:
+                            continue
 
-                    data = self._data
+                        value = self._make_dict() if item.dir else item.value
+
+                        nested = data
 
-                    if len(keys) > 1:
                         for key in keys[:-1]:
-                            if key in data:
-                                data = data[key]
-                            else:
-                                data = data[key] = IgnoreCaseDict()
+                            child = nested.get(key)
+
+                            if child is None:
+                                child = self._make_dict()
+                            elif id(child) not in copies:
+                                child = child.copy()
+
+                            copies.add(id(child))
+                            nested[key] = child
+                            nested = child
 
-                    if item.action == 'create':
-                        data[keys[-1]] = value
+                        if item.action == 'create':
+                            nested[keys[-1]] = value
 
-                    elif item.action == 'set':
-                        data[keys[-1]] = value
+                        elif item.action == 'set':
+                            nested[keys[-1]] = value
 
-                    elif item.action == 'delete':
-                        data.pop(keys[-1], None)
+                        elif item.action == 'delete':
+                            nested.pop(keys[-1], None)
 
-                    else:
-                        logger.warning('Unrecognized etcd action %s ', item.action)
+                        else:
+                            logger.warning('Unrecognized etcd action %s ', item.action)
+
+                    self._data = data
+
+                    changes = diff_dict(previous_data, data, NESTED_DELIMITER, self._ignore_case)
 
                 self._etcd_index = result.modifiedIndex + 1
 
+                if not changes:
+                    continue
+
                 try:
-                    self.updated()
+                    self._trigger_updated(changes)
                 except:
                     logger.warning('Error calling updated event from ' + str(self), exc_info=True)
 
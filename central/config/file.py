@@ -1,13 +1,15 @@
 import codecs
 import os
 
+from collections import MutableMapping
 from .. import abc
 from ..compat import string_types, FileNotFoundError
 from ..exceptions import ConfigError
 from ..interpolation import ChainLookup, EnvironmentLookup
+from ..mergers import DeepMerger
 from ..readers import get_reader
 from ..structures import IgnoreCaseDict
-from ..utils import get_file_ext, merge_dict
+from ..utils import get_file_ext
 from .core import BaseDataConfig
 
 
@@ -30,9 +32,11 @@ class FileConfig(BaseDataConfig):
     :param str filename: The filename to be read.
     :param abc.Reader reader: The reader used to read the file content as a dict,
         if None a reader based on the filename is going to be used.
+    :param abc.Merger merger: The merger used to merge the content referenced by @next,
+        if None a `DeepMerger` is going to be used.
     """
 
-    def __init__(self, filename, reader=None):
+    def __init__(self, filename, reader=None, merger=None):
         super(FileConfig, self).__init__()
         if not isinstance(filename, string_types):
             raise TypeError('filename must be a str')
@@ -40,8 +44,12 @@ class FileConfig(BaseDataConfig):
         if reader is not None and not isinstance(reader, abc.Reader):
             raise TypeError('reader must be an abc.Reader')
 
+        if merger is not None and not isinstance(merger, abc.Merger):
+            raise TypeError('merger must be an abc.Merger')
+
         self._filename = filename
         self._reader = reader
+        self._merger = merger or DeepMerger()
 
     @property
     def filename(self):
@@ -59,6 +67,14 @@ class FileConfig(BaseDataConfig):
         """
         return self._reader
 
+    @property
+    def merger(self):
+        """
+        Get the merger.
+        :return abc.Merger: The merger.
+        """
+        return self._merger
+
     def load(self):
         """
         Load the configuration from a file.
@@ -77,9 +93,12 @@ class FileConfig(BaseDataConfig):
 
             data = self._read_file(file)
 
-            if not isinstance(data, IgnoreCaseDict):
+            if self._ignore_case and not isinstance(data, IgnoreCaseDict):
                 raise ConfigError('reader must return an IgnoreCaseDict object')
 
+            if not isinstance(data, MutableMapping):
+                raise ConfigError('reader must return a dict object')
+
             filename = data.pop('@next', None)
 
             if filename is not None and not isinstance(filename, string_types):
@@ -90,7 +109,7 @@ class FileConfig(BaseDataConfig):
         data = to_merge[0]
 
         if len(to_merge) > 1:
-            merge_dict(data, *to_merge[1:])
+            data = self._merger.merge(data, *to_merge[1:])
 
         self._data = data
 
@@ -111,6 +130,9 @@ class FileConfig(BaseDataConfig):
         if reader_cls is None:
             raise ConfigError('File %s is not supported' % filename)
 
+        if not self._ignore_case:
+            return reader_cls(ignore_case=False)
+
         return reader_cls()
 
     def _find_file(self, filename):
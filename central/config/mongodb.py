@@ -5,8 +5,6 @@ MongoDB config implementation.
 from collections import Mapping
 from ..compat import string_types, text_type
 from ..exceptions import LibraryRequiredError
-from ..structures import IgnoreCaseDict
-from ..utils import make_ignore_case
 from .core import BaseDataConfig
 
 try:
@@ -110,14 +108,14 @@ class MongoDBConfig(BaseDataConfig):
         """
         result = self._collection.find(self._query)
 
-        data = IgnoreCaseDict()
+        data = self._make_dict()
 
         for item in result:
             key = text_type(item[self._key_attribute])
             value = item[self._value_attribute]
 
             if isinstance(value, Mapping):
-                value = make_ignore_case(value)
+                value = self._make_dict(value)
 
             data[key] = value
 
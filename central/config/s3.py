@@ -5,14 +5,16 @@ S3 config implementation.
 import codecs
 import io
 
+from collections import MutableMapping
 from .core import BaseDataConfig
 from .. import abc
 from ..compat import string_types
 from ..exceptions import ConfigError, LibraryRequiredError
 from ..interpolation import ChainLookup, EnvironmentLookup
+from ..mergers import DeepMerger
 from ..readers import get_reader
 from ..structures import IgnoreCaseDict
-from ..utils import get_file_ext, merge_dict
+from ..utils import get_file_ext
 
 try:
     import boto3
@@ -51,9 +53,11 @@ class S3Config(BaseDataConfig):
     :param str filename: The file name to be read.
     :param abc.Reader reader: The reader used to read the file content as a dict,
         if None a reader based on file name is going to be used.
+    :param abc.Merger merger: The merger used to merge the content referenced by @next,
+        if None a `DeepMerger` is going to be used.
     """
 
-    def __init__(self, client, bucket_name, filename, reader=None):
+    def __init__(self, client, bucket_name, filename, reader=None, merger=None):
         if boto3 is None:
             raise LibraryRequiredError('boto3', 'https://pypi.python.org/pypi/boto3')
 
@@ -71,10 +75,14 @@ class S3Config(BaseDataConfig):
         if reader is not None and not isinstance(reader, abc.Reader):
             raise TypeError('reader must be an abc.Reader')
 
+        if merger is not None and not isinstance(merger, abc.Merger):
+            raise TypeError('merger must be an abc.Merger')
+
         self._client = client
         self._bucket_name = bucket_name
         self._filename = filename
         self._reader = reader
+        self._merger = merger or DeepMerger()
 
     @property
     def bucket_name(self):
@@ -100,6 +108,14 @@ class S3Config(BaseDataConfig):
         """
         return self._reader
 
+    @property
+    def merger(self):
+        """
+        Get the merger.
+        :return abc.Merger: The merger.
+        """
+        return self._merger
+
     def load(self):
         """
         Load the configuration stored in the S3.
@@ -133,11 +149,14 @@ class S3Config(BaseDataConfig):
 
         data = to_merge[0]
 
-        if not isinstance(data, IgnoreCaseDict):
+        if self._ignore_case and not isinstance(data, IgnoreCaseDict):
             raise ConfigError('reader must return an IgnoreCaseDict object')
 
+        if not isinstance(data, MutableMapping):
+            raise ConfigError('reader must return a dict object')
+
         if len(to_merge) > 1:
-            merge_dict(data, *to_merge[1:])
+            data = self._merger.merge(data, *to_merge[1:])
 
         self._data = data
 
@@ -158,6 +177,9 @@ class S3Config(BaseDataConfig):
         if reader_cls is None:
             raise ConfigError('File %s is not supported' % filename)
 
+        if not self._ignore_case:
+            return reader_cls(ignore_case=False)
+
         return reader_cls()
 
     def _open_file(self, filename):
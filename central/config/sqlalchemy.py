@@ -6,8 +6,6 @@ from collections import Mapping
 from .core import BaseDataConfig
 from ..compat import string_types
 from ..exceptions import LibraryRequiredError
-from ..structures import IgnoreCaseDict
-from ..utils import make_ignore_case
 
 
 try:
@@ -108,14 +106,14 @@ class SQLAlchemyConfig(BaseDataConfig):
         result = self._engine.execute(self._query)
 
         try:
-            data = IgnoreCaseDict()
+            data = self._make_dict()
 
             for row in result:
                 key = row[self._key_column]
                 value = row[self._value_column]
 
                 if isinstance(value, Mapping):
-                    value = make_ignore_case(value)
+                    value = self._make_dict(value)
 
                 data[key] = value
 
@@ -1,12 +1,13 @@
 import codecs
 
+from collections import MutableMapping
 from .. import abc
 from ..compat import string_types, urlopen
 from ..exceptions import ConfigError
 from ..interpolation import ChainLookup, EnvironmentLookup
+from ..mergers import DeepMerger
 from ..readers import get_reader
 from ..structures import IgnoreCaseDict
-from ..utils import merge_dict
 from .core import BaseDataConfig
 
 
@@ -29,8 +30,10 @@ class UrlConfig(BaseDataConfig):
     :param str url: The url to be read.
     :param abc.Reader reader: The reader used to read the response from url as a dict,
         if None a reader based on the content type of the response is going to be used.
+    :param abc.Merger merger: The merger used to merge the content referenced by @next,
+        if None a `DeepMerger` is going to be used.
     """
-    def __init__(self, url, reader=None):
+    def __init__(self, url, reader=None, merger=None):
         super(UrlConfig, self).__init__()
 
         if not isinstance(url, string_types):
@@ -39,8 +42,12 @@ class UrlConfig(BaseDataConfig):
         if reader is not None and not isinstance(reader, abc.Reader):
             raise TypeError('reader must be an abc.Reader')
 
+        if merger is not None and not isinstance(merger, abc.Merger):
+            raise TypeError('merger must be an abc.Merger')
+
         self._url = url
         self._reader = reader
+        self._merger = merger or DeepMerger()
 
     @property
     def url(self):
@@ -58,6 +65,14 @@ class UrlConfig(BaseDataConfig):
         """
         return self._reader
 
+    @property
+    def merger(self):
+        """
+        Get the merger.
+        :return abc.Merger: The merger.
+        """
+        return self._merger
+
     def load(self):
         """
         Load the configuration from a url.
@@ -67,43 +82,101 @@ class UrlConfig(BaseDataConfig):
         """
         to_merge = []
         url = self.url
-
-        # create a chain lookup to resolve any variable left
-        # using environment variable.
-        lookup = ChainLookup(EnvironmentLookup(), self._lookup)
+        lookup = self._create_url_lookup()
 
         while url:
             # resolve variables.
             url = self._interpolator.resolve(url, lookup)
 
-            content_type, stream = self._open_url(url)
+            data = self._fetch_url(url)
 
-            try:
-                reader = self._reader or self._get_reader(url, content_type)
+            url = self._pop_next(data)
 
-                encoding = self._get_encoding(content_type)
+            to_merge.append(data)
 
-                text_reader_cls = codecs.getreader(encoding)
+        self._merge_urls(to_merge)
 
-                with text_reader_cls(stream) as text_reader:
-                    data = reader.read(text_reader)
-            finally:
-                stream.close()
+    def aload(self):
+        """
+        Load the configuration from a url asynchronously.
+        Recursively load any url referenced by an @next property in the response.
 
-            if not isinstance(data, IgnoreCaseDict):
-                raise ConfigError('reader must return an IgnoreCaseDict object')
+        The urls are read using aiohttp if installed,
+        otherwise they are read in the default executor of the event loop.
 
-            url = data.pop('@next', None)
+        This method does not trigger the updated event.
+        :return: A coroutine that loads the configuration.
+        """
+        from .aio import load_url
+        return load_url(self)
 
-            to_merge.append(data)
+    def _create_url_lookup(self):
+        """
+        Create a chain lookup to resolve any variable left
+        in the url using environment variables.
+        :return abc.StrLookup: The lookup.
+        """
+        return ChainLookup(EnvironmentLookup(), self._lookup)
 
-            if url and not isinstance(url, string_types):
-                raise ConfigError('@next must be a str')
+    def _fetch_url(self, url):
+        """
+        Open the given url and read the response as a dict.
+        :param str url: The url to be read.
+        :return MutableMapping: The data read.
+        """
+        content_type, stream = self._open_url(url)
+        return self._read_url(url, content_type, stream)
 
+    def _read_url(self, url, content_type, stream):
+        """
+        Read the response from the given url as a dict, the stream is closed afterwards.
+        :param str url: The url opened.
+        :param str content_type: The content type from the response.
+        :param stream: The stream to read from.
+        :return MutableMapping: The data read.
+        """
+        try:
+            reader = self._reader or self._get_reader(url, content_type)
+
+            encoding = self._get_encoding(content_type)
+
+            text_reader_cls = codecs.getreader(encoding)
+
+            with text_reader_cls(stream) as text_reader:
+                data = reader.read(text_reader)
+        finally:
+            stream.close()
+
+        if self._ignore_case and not isinstance(data, IgnoreCaseDict):
+            raise ConfigError('reader must return an IgnoreCaseDict object')
+
+        if not isinstance(data, MutableMapping):
+            raise ConfigError('reader must return a dict object')
+
+        return data
+
+    def _pop_next(self, data):
+        """
+        Remove the @next property from the given data.
+        :param MutableMapping data: The data read from a url.
+        :return str: The next url to be read, None if there is no next url.
+        """
+        url = data.pop('@next', None)
+
+        if url and not isinstance(url, string_types):
+            raise ConfigError('@next must be a str')
+
+        return url
+
+    def _merge_urls(self, to_merge):
+        """
+        Merge the data read from the urls and set it as the current data.
+        :param list to_merge: The data read from each url, in the order they were read.
+        """
         data = to_merge[0]
 
         if len(to_merge) > 1:
-            merge_dict(data, *to_merge[1:])
+            data = self._merger.merge(data, *to_merge[1:])
 
         self._data = data
 
@@ -148,6 +221,9 @@ class UrlConfig(BaseDataConfig):
         for name in names:
             reader_cls = get_reader(name)
             if reader_cls:
+                if not self._ignore_case:
+                    return reader_cls(ignore_case=False)
+
                 return reader_cls()
 
         raise ConfigError('Response from %s provided content type %s which is not supported' % (url, content_type))
@@ -189,3 +265,13 @@ class UrlConfig(BaseDataConfig):
         response = urlopen(url)
         content_type = response.headers.get('content-type')
         return content_type, response
+
+    def _afetch_url(self, url):
+        """
+        Open and read the given url asynchronously using aiohttp if installed,
+        otherwise `_fetch_url` is called in the default executor of the event loop.
+        :param url: The url to be read.
+        :return: A coroutine that returns the data read.
+        """
+        from .aio import fetch_url
+        return fetch_url(self, url)
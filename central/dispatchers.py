@@ -0,0 +1,260 @@
+"""
+Dispatcher implementations.
+"""
+
+import logging
+import time
+
+from collections import deque
+from threading import Condition, Thread, current_thread
+from . import abc
+from .compat import text_type
+from .exceptions import DispatcherError
+
+
+__all__ = [
+    'ThreadPoolDispatcher',
+]
+
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadPoolDispatcher(abc.Dispatcher):
+    """
+    A dispatcher implementation that executes the funcs
+    in a bounded pool of threads.
+
+    The calls to the same func are executed one at a time in the order
+    they are dispatched, the calls to different funcs run concurrently,
+    so a slow func does not delay the others.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.config import MemoryConfig
+        from central.dispatchers import ThreadPoolDispatcher
+
+        config = MemoryConfig()
+        config.updated.dispatcher = ThreadPoolDispatcher(max_workers=2)
+
+        @config.on_updated
+        def config_updated():
+            pass
+
+        config.set('key', 'value')
+
+    :param int max_workers: The maximum number of threads.
+    :param int max_queue_size: The maximum number of calls waiting or running,
+        once reached `dispatch` blocks until a call completes, if None it is unbounded.
+        The calls dispatched by the funcs running in the pool never block,
+        otherwise a func dispatching another one would wait for itself.
+    """
+
+    def __init__(self, max_workers=1, max_queue_size=None):
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+            raise TypeError('max_workers must be an int')
+
+        if max_workers < 1:
+            raise ValueError('max_workers must be greater than 0')
+
+        if max_queue_size is not None:
+            if not isinstance(max_queue_size, int) or isinstance(max_queue_size, bool):
+                raise TypeError('max_queue_size must be an int')
+
+            if max_queue_size < 1:
+                raise ValueError('max_queue_size must be greater than 0')
+
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._condition = Condition()
+        self._pending = {}
+        self._ready = deque()
+        self._threads = 0
+        self._worker_threads = set()
+        self._idle_threads = 0
+        self._closed = False
+        self._queue_size = 0
+        self._max_queue_size_reached = 0
+        self._calls = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def max_workers(self):
+        """
+        Get the maximum number of threads.
+        :return int: The maximum number of threads.
+        """
+        return self._max_workers
+
+    @property
+    def max_queue_size(self):
+        """
+        Get the maximum number of calls waiting or running.
+        :return int: The maximum number of calls, None if it is unbounded.
+        """
+        return self._max_queue_size
+
+    @property
+    def queue_size(self):
+        """
+        Get the number of calls waiting or running.
+        :return int: The number of calls.
+        """
+        return self._queue_size
+
+    @property
+    def max_queue_size_reached(self):
+        """
+        Get the highest number of calls waiting or running at the same time.
+        :return int: The number of calls.
+        """
+        return self._max_queue_size_reached
+
+    @property
+    def calls(self):
+        """
+        Get the number of calls completed.
+        :return int: The number of calls.
+        """
+        return self._calls
+
+    @property
+    def total_latency(self):
+        """
+        Get the sum of the seconds taken by the calls completed,
+        from the moment they were dispatched to the moment they returned.
+        :return float: The number of seconds.
+        """
+        return self._total_latency
+
+    @property
+    def max_latency(self):
+        """
+        Get the highest number of seconds taken by a call completed,
+        from the moment it was dispatched to the moment it returned.
+        :return float: The number of seconds.
+        """
+        return self._max_latency
+
+    def dispatch(self, func, *args):
+        """
+        Dispatch the given func to be executed in the pool with the given arguments.
+        :param func: The function to be executed.
+        :param args: The arguments to be passed to the function.
+        """
+        if not callable(func):
+            raise TypeError('func must be a callable object.')
+
+        key = func
+
+        try:
+            hash(key)
+        except TypeError:
+            key = id(func)
+
+        with self._condition:
+            # a worker waiting for room would wait for the call it is running.
+            bounded = self._max_queue_size and current_thread() not in self._worker_threads
+
+            while bounded and self._queue_size >= self._max_queue_size and not self._closed:
+                self._condition.wait()
+
+            if self._closed:
+                raise DispatcherError('Dispatcher is closed')
+
+            calls = self._pending.get(key)
+
+            if calls is None:
+                # a func already pending is made ready again once its running call completes.
+                calls = self._pending[key] = deque()
+                self._ready.append(key)
+
+            calls.append((func, args, time.time()))
+
+            self._queue_size += 1
+            self._max_queue_size_reached = max(self._max_queue_size_reached, self._queue_size)
+
+            if self._idle_threads == 0 and self._threads < self._max_workers:
+                self._threads += 1
+
+                thread = Thread(target=self._process, name='ThreadPoolDispatcher')
+                thread.daemon = True
+                thread.start()
+            else:
+                self._condition.notify_all()
+
+    def wait(self, timeout=None):
+        """
+        Wait until all the calls dispatched are completed.
+        :param Number timeout: The maximum number of seconds to wait, if None it waits forever.
+        :return bool: True if all the calls are completed, otherwise False.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+
+        with self._condition:
+            while self._queue_size:
+                if deadline is None:
+                    self._condition.wait()
+                else:
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
+                        return False
+
+                    self._condition.wait(remaining)
+
+        return True
+
+    def close(self):
+        """
+        Stop the threads once the calls already dispatched are completed.
+        The dispatcher cannot be used again.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _process(self):
+        """
+        Keep executing the calls dispatched until the dispatcher is closed.
+        """
+        with self._condition:
+            self._worker_threads.add(current_thread())
+
+        while True:
+            with self._condition:
+                while not self._ready:
+                    if self._closed:
+                        self._threads -= 1
+                        self._worker_threads.discard(current_thread())
+                        return
+
+                    self._idle_threads += 1
+                    self._condition.wait()
+                    self._idle_threads -= 1
+
+                key = self._ready.popleft()
+                func, args, dispatched_at = self._pending[key].popleft()
+
+            try:
+                func(*args)
+            except:
+                logger.warning('Dispatched callback %s failed' % text_type(func), exc_info=True)
+
+            latency = time.time() - dispatched_at
+
+            with self._condition:
+                if self._pending[key]:
+                    self._ready.append(key)
+                else:
+                    del self._pending[key]
+
+                self._queue_size -= 1
+                self._calls += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+
+                self._condition.notify_all()
@@ -25,7 +25,36 @@ class LibraryRequiredError(Exception):
         )
 
 
+class LoadError(ConfigError):
+    """
+    An error raised when one or more configs could not be loaded.
+
+    :param list errors: The list of tuples of the config and the error raised.
+    """
+    def __init__(self, errors):
+        super(LoadError, self).__init__(
+            'Unable to load %d config(s): %s' % (
+                len(errors), '; '.join('%s: %s' % (config, error) for config, error in errors))
+        )
+        self._errors = errors
+
+    @property
+    def errors(self):
+        """
+        Get the errors raised by the configs.
+        :return list: The list of tuples of the config and the error raised.
+        """
+        return self._errors
+
+
+class DispatcherError(Exception):
+    """
+    An error related to the dispatcher.
+    """
+
+
 class SchedulerError(Exception):
     """
     An error related to the scheduler.
     """
+
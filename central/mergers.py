@@ -0,0 +1,229 @@
+"""
+Merger implementations.
+"""
+
+from collections import Mapping, MutableMapping
+from . import abc
+
+
+__all__ = [
+    'DeepMerger',
+    'ListMerger',
+    'PersistentMerger',
+    'ReplaceMerger',
+]
+
+
+class DeepMerger(abc.Merger):
+    """
+    A merger that merges the nested dicts recursively into the base dict,
+    in case of key collision last-match wins.
+
+    The base dict and its nested dicts are modified.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.mergers import DeepMerger
+
+        merger = DeepMerger()
+
+        data = merger.merge({'database': {'host': 'localhost'}}, {'database': {'port': 5432}})
+
+    """
+
+    def merge(self, base, *data):
+        """
+        Merge the given list of dicts into `base` dict.
+        :param dict base: The base dict that holds the merged data.
+        :param tuple data: The list of dicts to be merged.
+        :return dict: The `base` dict.
+        """
+        for source in data:
+            self._merge_dict(base, source)
+
+        return base
+
+    def _merge_dict(self, target, source):
+        """
+        Merge the given source dict into the target dict.
+        :param MutableMapping target: The dict to receive the merge.
+        :param Mapping source: The dict to be merged.
+        """
+        if not isinstance(target, MutableMapping):
+            raise TypeError('target must be a dict')
+
+        if not isinstance(source, Mapping):
+            raise TypeError('data must be a dict')
+
+        for key in source:
+            target[key] = self._merge_value(target.get(key), source[key])
+
+    def _merge_value(self, target_value, source_value):
+        """
+        Merge the given values.
+        :param target_value: The current value.
+        :param source_value: The value to be merged.
+        :return: The merged value.
+        """
+        if target_value is None or source_value is None:
+            return source_value
+
+        if isinstance(target_value, Mapping) and isinstance(source_value, Mapping):
+            self._merge_dict(target_value, source_value)
+            return target_value
+
+        return source_value
+
+
+class ListMerger(DeepMerger):
+    """
+    A merger based on `DeepMerger` that also merges the lists,
+    the items of the last list are appended to the previous ones.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.mergers import ListMerger
+
+        merger = ListMerger(unique=True)
+
+        data = merger.merge({'hosts': ['host1', 'host2']}, {'hosts': ['host2', 'host3']})
+
+    :param bool unique: If True the items already in the list are not appended.
+    """
+
+    def __init__(self, unique=False):
+        if not isinstance(unique, bool):
+            raise TypeError('unique must be a bool')
+
+        self._unique = unique
+
+    @property
+    def unique(self):
+        """
+        Get whether the items already in the list are not appended.
+        :return bool: True if the items already in the list are not appended.
+        """
+        return self._unique
+
+    def _merge_value(self, target_value, source_value):
+        """
+        Merge the given values.
+        :param target_value: The current value.
+        :param source_value: The value to be merged.
+        :return: The merged value.
+        """
+        if isinstance(target_value, list) and isinstance(source_value, list):
+            value = list(target_value)
+
+            for item in source_value:
+                if not self._unique or item not in value:
+                    value.append(item)
+
+            return value
+
+        return super(ListMerger, self)._merge_value(target_value, source_value)
+
+
+class PersistentMerger(DeepMerger):
+    """
+    A merger based on `DeepMerger` that never modifies the given dicts.
+
+    The dicts are merged into new dicts and the nested dicts found in only one
+    of the given dicts are shared with the merged dict rather than copied,
+    so merging large dicts costs proportionally to the keys in collision.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.mergers import PersistentMerger
+
+        merger = PersistentMerger()
+
+        data = merger.merge({'database': {'host': 'localhost'}}, {'database': {'port': 5432}})
+
+    """
+
+    def merge(self, base, *data):
+        """
+        Merge the given list of dicts into a new dict.
+        :param dict base: The base dict, it is not modified.
+        :param tuple data: The list of dicts to be merged.
+        :return dict: The merged dict.
+        """
+        for source in data:
+            base = self._merge_dict(base, source)
+
+        return base
+
+    def _merge_dict(self, target, source):
+        """
+        Merge the given dicts into a new dict.
+        :param Mapping target: The dict to merge into.
+        :param Mapping source: The dict to be merged.
+        :return Mapping: The merged dict.
+        """
+        if not isinstance(target, Mapping):
+            raise TypeError('target must be a dict')
+
+        if not isinstance(source, Mapping):
+            raise TypeError('data must be a dict')
+
+        merged = target.copy() if hasattr(target, 'copy') else dict(target)
+
+        for key in source:
+            merged[key] = self._merge_value(merged.get(key), source[key])
+
+        return merged
+
+    def _merge_value(self, target_value, source_value):
+        """
+        Merge the given values.
+        :param target_value: The current value.
+        :param source_value: The value to be merged.
+        :return: The merged value.
+        """
+        if isinstance(target_value, Mapping) and isinstance(source_value, Mapping):
+            return self._merge_dict(target_value, source_value)
+
+        return source_value
+
+
+class ReplaceMerger(abc.Merger):
+    """
+    A merger that replaces the top level keys of the base dict,
+    the nested dicts are not merged.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.mergers import ReplaceMerger
+
+        merger = ReplaceMerger()
+
+        data = merger.merge({'database': {'host': 'localhost'}}, {'database': {'port': 5432}})
+
+    """
+
+    def merge(self, base, *data):
+        """
+        Merge the given list of dicts into `base` dict.
+        :param dict base: The base dict that holds the merged data.
+        :param tuple data: The list of dicts to be merged.
+        :return dict: The `base` dict.
+        """
+        if not isinstance(base, MutableMapping):
+            raise TypeError('base must be a dict')
+
+        for source in data:
+            if not isinstance(source, Mapping):
+                raise TypeError('data must be a dict')
+
+            base.update(source)
+
+        return base
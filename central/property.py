@@ -1,12 +1,20 @@
 import logging
+import weakref
 
+from functools import partial
+from itertools import count
+from threading import Lock
 from . import abc
 from .compat import string_types, text_type
+from .config.core import NESTED_DELIMITER, BaseConfig, _find_dependencies
 from .utils import EventHandler, Version
 
 
 logger = logging.getLogger(__name__)
 
+# the values taken by the stamps of the groups, they never repeat.
+_stamps = count(1)
+
 
 class PropertyManager(abc.PropertyManager):
     """
@@ -17,6 +25,14 @@ class PropertyManager(abc.PropertyManager):
     Once created a PropertyContainer property cannot be removed,
     however, listeners may be added and removed.
 
+    Each PropertyContainer has its own version of the data, when the config
+    source reports the keys changed only the containers depending on them are
+    invalidated. A container depends on its key, the parents and children of
+    its key and the keys referenced by interpolation in its value.
+
+    The properties with listeners are recomputed together from a single snapshot
+    of the config source, the listeners are called once all the new values are known.
+
     Example usage:
 
     .. code-block:: python
@@ -31,6 +47,10 @@ class PropertyManager(abc.PropertyManager):
 
         value = prop.get()
 
+        upper = properties.derive(lambda value: value.upper(), prop)
+
+        value = upper.get()
+
         @prop.on_updated
         def prop_updated(value):
             print(value)
@@ -38,15 +58,31 @@ class PropertyManager(abc.PropertyManager):
         config.set('key', 'new value')
 
     :param abc.Config: The config source which provides the values for properties.
+    :param abc.Dispatcher dispatcher: The dispatcher used to execute the callbacks
+        of the updated event of the properties, if None they are executed by the
+        thread that changed the config source.
     """
-    def __init__(self, config):
+    def __init__(self, config, dispatcher=None):
         if not isinstance(config, abc.Config):
             raise TypeError('config must be an abc.Config')
 
+        if dispatcher is not None and not isinstance(dispatcher, abc.Dispatcher):
+            raise TypeError('dispatcher must be an abc.Dispatcher')
+
         self._containers = {}
-        self._version = Version()
+        self._dependencies = {}
+        self._dependents = {}
+        self._unindexed = set()
+        self._lock = Lock()
         self._config = config
-        self._config.updated.add(self._config_updated)
+        self._dispatcher = dispatcher
+
+        if isinstance(config, BaseConfig):
+            # the updated event triggered directly is reported
+            # by the changed event with an unknown change set.
+            self._config.changed.add(self._config_changed)
+        else:
+            self._config.updated.add(self._config_updated)
 
     def get_property(self, name):
         """
@@ -65,13 +101,55 @@ class PropertyManager(abc.PropertyManager):
         container = self._containers.get(name)
 
         if not container:
-            container = self._containers[name] = PropertyContainer(name, self._config, self._version)
+            with self._lock:
+                container = self._containers.get(name)
+
+                if not container:
+                    container = PropertyContainer(name, self._config, Version(), self._dispatcher)
+                    self._containers[name] = container
+                    self._unindexed.add(name)
 
         return container
 
-    def _config_updated(self):
+    def derive(self, func, *properties):
+        """
+        Get a property whose value is computed by the given function
+        from the values of the given properties.
+
+        The value is cached and the function is called again only when
+        the value of any of the given properties has changed, the updated
+        event is triggered only when the value computed has changed.
+
+        The given properties may be derived properties as well.
+
+        :param func: The function called with the values of the properties.
+        :param properties: The properties the value is computed from,
+            they must be provided by this manager.
+        :return DerivedProperty: The property object.
+        """
+        for prop in properties:
+            if not isinstance(prop, (Property, DerivedProperty)):
+                raise TypeError('property must be a Property or a DerivedProperty')
+
+            if prop._config is not self._config:
+                raise ValueError('properties must be provided by this manager')
+
+        return DerivedProperty(func, properties, self._config, self._dispatcher)
+
+    def _config_changed(self, changes):
         """
         Called when the config source attached was changed.
+        :param ChangeSet changes: The keys changed.
+        """
+        if changes.unknown:
+            self._invalidate()
+        else:
+            self._invalidate_keys(changes)
+
+    def _config_updated(self):
+        """
+        Called when the config source attached was changed
+        without reporting the keys changed.
         """
         self._invalidate()
 
@@ -82,13 +160,137 @@ class PropertyManager(abc.PropertyManager):
         It forces all properties to get its value from
         the config source again.
         """
-        self._version.number += 1
+        with self._lock:
+            for name in list(self._dependencies):
+                self._unindex(name)
+
+            containers = list(self._containers.values())
+
+        self._update(containers)
+
+    def _invalidate_keys(self, changes):
+        """
+        Invalidate the cached value in the properties depending on the keys changed.
+        :param ChangeSet changes: The keys changed.
+        """
+        affected = []
+
+        with self._lock:
+            names = set(self._unindexed)
+
+            for key in changes.keys:
+                names.update(self._dependents.get(key.split(NESTED_DELIMITER, 1)[0].lower(), ()))
+
+            for name in names:
+                dependencies = self._dependencies.get(name)
+
+                if dependencies is None:
+                    dependencies = self._index(name)
+
+                for key in dependencies:
+                    if changes.affects(key):
+                        # the value of the property may reference other keys now.
+                        self._unindex(name)
+                        affected.append(self._containers[name])
+                        break
+
+        self._update(affected)
+
+    def _update(self, containers):
+        """
+        Invalidate the given containers and recompute the properties with listeners,
+        the values are read from the same snapshot of the config source and
+        the listeners are called after all the values have been recomputed.
+        :param list containers: The containers to be invalidated.
+        """
+        if not containers:
+            return
+
+        try:
+            snapshot = self._config.snapshot()
+        except NotImplementedError:
+            snapshot = self._config
+        except:
+            logger.warning('Unable to get a snapshot from ' + str(self._config), exc_info=True)
+            snapshot = self._config
+
+        updated = []
+
+        for container in containers:
+            # the values are bound to the version about to be published,
+            # so the properties do not read them again once it is published.
+            number = container._version.number + 1
+
+            for prop in container._get_properties():
+                if prop._has_listeners() and prop._refresh(snapshot, number):
+                    updated.append(prop)
+
+        for container in containers:
+            container._version.number += 1
+
+        for prop in updated:
+            try:
+                prop.updated(prop._value)
+            except:
+                logger.warning('Error calling updated event from property %s' % prop.name, exc_info=True)
+
+    def _index(self, name):
+        """
+        Find the keys the given property depends on and index them by their top level key.
+        :param str name: The name of the property.
+        :return frozenset: The keys the property depends on.
+        """
+        dependencies = self._find_dependencies(name)
+
+        self._dependencies[name] = dependencies
+        self._unindexed.discard(name)
+
+        for key in dependencies:
+            self._dependents.setdefault(key.split(NESTED_DELIMITER, 1)[0].lower(), set()).add(name)
+
+        return dependencies
+
+    def _unindex(self, name):
+        """
+        Remove the keys the given property depends on from the index,
+        they are found again on the next change.
+        :param str name: The name of the property.
+        """
+        dependencies = self._dependencies.pop(name, None)
+
+        if dependencies is None:
+            return
+
+        self._unindexed.add(name)
+
+        for key in dependencies:
+            top_key = key.split(NESTED_DELIMITER, 1)[0].lower()
+            names = self._dependents.get(top_key)
+
+            if names is not None:
+                names.discard(name)
+
+                if not names:
+                    del self._dependents[top_key]
+
+    def _find_dependencies(self, name):
+        """
+        Find the keys the value of the given property depends on,
+        which are its own key and the keys referenced by interpolation recursively.
+        :param str name: The name of the property.
+        :return frozenset: The keys the property depends on.
+        """
+        return _find_dependencies(self._config, name)
 
 
 class PropertyContainer(abc.PropertyContainer):
     """
     Implementation of PropertyContainer which reuses
-    the same Property object for each data type.
+    the same Property object for each data type and default value.
+
+    The properties are cached while they are referenced, a property with
+    listeners is always referenced, the others are garbage collected
+    once no longer referenced.
 
     It should be created by PropertyManager.
 
@@ -96,8 +298,13 @@ class PropertyContainer(abc.PropertyContainer):
     :param abc.Config: The config source which provides the value to the property.
     :param Version version: The current version of the data,
         used to know if data of the property has been changed.
+    :param abc.Dispatcher dispatcher: The dispatcher used to execute the
+        callbacks of the updated event of the properties.
     """
-    def __init__(self, name, config, version):
+
+    __slots__ = ('_name', '_config', '_version', '_dispatcher', '_properties', '_unhashable_properties')
+
+    def __init__(self, name, config, version, dispatcher=None):
         if not isinstance(name, string_types):
             raise TypeError('name must be a str')
 
@@ -110,7 +317,9 @@ class PropertyContainer(abc.PropertyContainer):
         self._name = name
         self._config = config
         self._version = version
-        self._properties = []
+        self._dispatcher = dispatcher
+        self._properties = {}
+        self._unhashable_properties = None
 
     def as_bool(self, default):
         """
@@ -174,16 +383,67 @@ class PropertyContainer(abc.PropertyContainer):
             config source doesn't hold the property name.
         :return Property: The property object.
         """
-        for prop in self._properties:
-            if prop.type == type and prop.default == default:
-                return prop
+        key = (type, default)
+
+        try:
+            ref = self._properties.get(key)
+        except TypeError:
+            # the default value is not hashable, e.g. a list or a dict.
+            return self._as_unhashable_type(type, default)
 
-        prop = Property(self._name, default, type, self._config, self._version)
+        prop = None if ref is None else ref()
 
-        self._properties.append(prop)
+        if prop is None:
+            prop = Property(self._name, default, type, self._config, self._version, self._dispatcher)
+            self._properties[key] = weakref.ref(prop)
 
         return prop
 
+    def _as_unhashable_type(self, type, default):
+        """
+        Get a cached property based on the given type and a default value not hashable.
+        :param type: The type to convert the value to.
+        :param default: The default value used if the
+            config source doesn't hold the property name.
+        :return Property: The property object.
+        """
+        refs = []
+        found = None
+
+        for ref in self._unhashable_properties or ():
+            prop = ref()
+
+            if prop is None:
+                continue
+
+            refs.append(ref)
+
+            if found is None and prop.type == type and prop.default == default:
+                found = prop
+
+        if found is None:
+            found = Property(self._name, default, type, self._config, self._version, self._dispatcher)
+            refs.append(weakref.ref(found))
+
+        self._unhashable_properties = refs
+
+        return found
+
+    def _get_properties(self):
+        """
+        Get the properties still referenced.
+        :return list: The properties.
+        """
+        properties = []
+
+        for ref in list(self._properties.values()) + (self._unhashable_properties or []):
+            prop = ref()
+
+            if prop is not None:
+                properties.append(prop)
+
+        return properties
+
 
 class Property(abc.Property):
     """
@@ -199,8 +459,15 @@ class Property(abc.Property):
     :param abc.Config: The config source which provides the value to the property.
     :param Version version: The current version of the data,
         used to know if data of the property has been changed.
+    :param abc.Dispatcher dispatcher: The dispatcher used to execute
+        the callbacks of the updated event.
     """
-    def __init__(self, name, default, type, config, version):
+
+    __slots__ = ('_name', '_default', '_type', '_config', '_master_version',
+                 '_current_version', '_value', '_dispatcher', '_updated', '_version_listener',
+                 '__weakref__')
+
+    def __init__(self, name, default, type, config, version, dispatcher=None):
         if not isinstance(name, string_types):
             raise TypeError('name must be a str')
 
@@ -220,8 +487,9 @@ class Property(abc.Property):
         self._master_version = version
         self._current_version = -1
         self._value = None
-        self._updated = EventHandler(after_add_func=self._after_add_updated,
-                                     after_remove_func=self._after_remove_updated)
+        self._dispatcher = dispatcher
+        self._updated = None
+        self._version_listener = None
 
     @property
     def name(self):
@@ -250,9 +518,14 @@ class Property(abc.Property):
     @property
     def updated(self):
         """
-        Get the updated event handler.
+        Get the updated event handler, it is created on first access.
         :return EventHandler: The event handler.
         """
+        if self._updated is None:
+            self._updated = EventHandler(after_add_func=self._after_add_updated,
+                                         after_remove_func=self._after_remove_updated,
+                                         dispatcher=self._dispatcher)
+
         return self._updated
 
     def get(self):
@@ -266,12 +539,7 @@ class Property(abc.Property):
             return self._value
 
         self._current_version = latest_version
-
-        try:
-            self._value = self._config.get_value(self._name, self._type, self._default)
-        except:
-            self._value = self._default() if callable(self._default) else self._default
-            logger.warning('Unable to get current version of property %s' % self._name, exc_info=True)
+        self._value = self._get_value(self._config)
 
         return self._value
 
@@ -283,19 +551,60 @@ class Property(abc.Property):
         """
         self.updated.add(func)
 
+    def _get_value(self, config):
+        """
+        Get the value of the property from the given config,
+        the default value is returned if the value cannot be read.
+        :param abc.Config config: The config to read the value from.
+        :return: The value of the property.
+        """
+        try:
+            return config.get_value(self._name, self._type, self._default)
+        except:
+            logger.warning('Unable to get current version of property %s' % self._name, exc_info=True)
+            return self._default() if callable(self._default) else self._default
+
+    def _has_listeners(self):
+        """
+        Get whether the updated event has any callback.
+        :return bool: True if there is any callback, otherwise False.
+        """
+        return self._updated is not None and len(self._updated) > 0
+
+    def _refresh(self, config, version):
+        """
+        Read the value of the property from the given config
+        and bind it to the given version number.
+        :param abc.Config config: The config to read the value from.
+        :param int version: The version number the value belongs to.
+        :return bool: True if the value has changed, otherwise False.
+        """
+        previous_value = self._value
+
+        self._value = self._get_value(config)
+        self._current_version = version
+
+        return previous_value != self._value
+
     def _after_add_updated(self):
         """
         Add a new listener for the first subscriber of data modification.
+
+        The listener is not a bound method, so the version holds it by a strong
+        reference and the property is kept alive while it has subscribers.
         """
-        if len(self._updated) == 1:
-            self._master_version.changed.add(self._version_changed)
+        if len(self._updated) == 1 and self._version_listener is None:
+            self._version_listener = partial(Property._version_changed, self)
+            self._master_version.changed.add(self._version_listener)
 
     def _after_remove_updated(self):
         """
-        Remove the listener if there is not subscribers for data modification.
+        Remove the listener if there is not subscribers for data modification,
+        the property can be garbage collected once no longer referenced.
         """
-        if len(self._updated) == 0:
-            self._master_version.changed.remove(self._version_changed)
+        if len(self._updated) == 0 and self._version_listener is not None:
+            self._master_version.changed.remove(self._version_listener)
+            self._version_listener = None
 
     def _version_changed(self):
         """
@@ -320,3 +629,301 @@ class Property(abc.Property):
         :return str: The string representation of a property.
         """
         return text_type(self.get())
+
+
+class PropertyGroup(object):
+    """
+    A group of properties whose values are read together from
+    the same version of the config source, so a reload happening while
+    the values are read cannot produce a mismatched set of values.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from central.config import MemoryConfig
+        from central.property import PropertyGroup, PropertyManager
+
+        config = MemoryConfig(data={'db': {'host': 'localhost', 'port': 5432}})
+        properties = PropertyManager(config)
+
+        database = PropertyGroup(
+            properties.get_property('db.host').as_str('localhost'),
+            properties.get_property('db.port').as_int(5432)
+        )
+
+        host, port = database.get()
+
+    :param properties: The properties, they must have unique names and share the same config source.
+    """
+    def __init__(self, *properties):
+        config = None
+        keys = {}
+
+        for prop in properties:
+            if not isinstance(prop, Property):
+                raise TypeError('property must be a Property')
+
+            if config is None:
+                config = prop._config
+            elif config is not prop._config:
+                raise ValueError('properties must share the same config')
+
+            if prop.name in keys:
+                raise ValueError('properties must have unique names')
+
+            keys[prop.name] = (prop.type, prop.default)
+
+        self._properties = properties
+        self._config = config
+        self._keys = keys
+        self._versions = tuple(prop._master_version for prop in properties)
+        self._stamp = _Stamp(self, self._versions)
+        self._cached = (None, None)
+
+    @property
+    def properties(self):
+        """
+        Get the properties.
+        :return tuple: The properties.
+        """
+        return self._properties
+
+    def get(self):
+        """
+        Get the most recent values of the properties, all the values
+        are read from the same version of the config source.
+
+        The values are cached until any of the properties is invalidated.
+        :return tuple: The values in the same order as the properties.
+        """
+        stamp, values = self._cached
+
+        # the stamp is read before the values,
+        # so a change made while reading them is not missed.
+        latest_stamp = self._stamp.value
+
+        if stamp == latest_stamp:
+            return values
+
+        try:
+            found = self._config.get_many(self._keys) if self._properties else {}
+            values = tuple([found[prop.name] for prop in self._properties])
+        except:
+            values = self._get_values()
+
+        self._cached = (latest_stamp, values)
+
+        return values
+
+    def _get_values(self):
+        """
+        Get the values of the properties one by one from a snapshot
+        of the config source, the default value is used for the
+        properties whose value cannot be read.
+        :return tuple: The values in the same order as the properties.
+        """
+        try:
+            config = self._config.snapshot()
+        except NotImplementedError:
+            config = self._config
+        except:
+            logger.warning('Unable to get a snapshot from ' + str(self._config), exc_info=True)
+            config = self._config
+
+        return tuple(prop._get_value(config) for prop in self._properties)
+
+
+class _Stamp(object):
+    """
+    Internal stamp of the values cached by a `PropertyGroup`, it is
+    changed by the changed event of the versions of the properties,
+    so the cache is validated by comparing a single number.
+
+    The callbacks are removed from the versions once the group is collected.
+
+    :param PropertyGroup group: The group using the stamp.
+    :param tuple versions: The versions of the properties of the group.
+    """
+
+    __slots__ = ('value', '_ref')
+
+    def __init__(self, group, versions):
+        self.value = next(_stamps)
+
+        versions = set(versions)
+
+        for version in versions:
+            version.changed.add(self.bump)
+
+        self._ref = weakref.ref(group, partial(_Stamp._release, self, versions))
+
+    def bump(self):
+        """
+        Change the value, the values cached with the previous value are stale.
+        """
+        self.value = next(_stamps)
+
+    def _release(self, versions, ref):
+        """
+        Remove the callbacks from the versions, called once the group is collected.
+        :param set versions: The versions of the properties of the group.
+        :param ref: The weak reference to the group.
+        """
+        for version in versions:
+            version.changed.remove(self.bump)
+
+
+class DerivedProperty(abc.Property):
+    """
+    Implementation of Property whose value is computed by a function
+    from the values of other properties.
+
+    The value is cached until the version of any property it depends on
+    changes, the function is called again only if the values of the
+    properties are not the same as the last time it was called.
+
+    It should be created by PropertyManager.
+
+    :param func: The function called with the values of the properties.
+    :param tuple properties: The properties the value is computed from.
+    :param abc.Config: The config source which provides the values to the properties.
+    :param abc.Dispatcher dispatcher: The dispatcher used to execute
+        the callbacks of the updated event.
+    """
+
+    __slots__ = ('_func', '_properties', '_config', '_versions', '_cached',
+                 '_notified', '_dispatcher', '_updated', '__weakref__')
+
+    def __init__(self, func, properties, config, dispatcher=None):
+        if not callable(func):
+            raise TypeError('func must be a callable')
+
+        if not isinstance(config, abc.Config):
+            raise TypeError('config must be an abc.Config')
+
+        versions = []
+
+        for prop in properties:
+            if isinstance(prop, DerivedProperty):
+                prop_versions = prop._versions
+            else:
+                prop_versions = (prop._master_version,)
+
+            for version in prop_versions:
+                if version not in versions:
+                    versions.append(version)
+
+        self._func = func
+        self._properties = tuple(properties)
+        self._config = config
+        self._versions = tuple(versions)
+        self._cached = (None, None, None)
+        self._notified = None
+        self._dispatcher = dispatcher
+        self._updated = None
+
+    @property
+    def func(self):
+        """
+        Get the function which computes the value.
+        :return: The function.
+        """
+        return self._func
+
+    @property
+    def properties(self):
+        """
+        Get the properties the value is computed from.
+        :return tuple: The properties.
+        """
+        return self._properties
+
+    @property
+    def updated(self):
+        """
+        Get the updated event handler, it is created on first access.
+        :return EventHandler: The event handler.
+        """
+        if self._updated is None:
+            self._updated = EventHandler(after_add_func=self._after_add_updated,
+                                         after_remove_func=self._after_remove_updated,
+                                         dispatcher=self._dispatcher)
+
+        return self._updated
+
+    def get(self):
+        """
+        Get the most recent value of the property.
+        :return: The most recent value of the property.
+        """
+        numbers, values, value = self._cached
+
+        # the version numbers are read before the values,
+        # so a change made while reading them is not missed.
+        latest_numbers = tuple([version.number for version in self._versions])
+
+        if numbers == latest_numbers:
+            return value
+
+        latest_values = tuple([prop.get() for prop in self._properties])
+
+        if numbers is None or values != latest_values:
+            value = self._func(*latest_values)
+
+        self._cached = (latest_numbers, latest_values, value)
+
+        return value
+
+    def on_updated(self, func):
+        """
+        Add a new callback for updated event.
+        It can also be used as decorator.
+        :param func: The callback.
+        """
+        self.updated.add(func)
+
+    def _after_add_updated(self):
+        """
+        Listen to the properties it depends on for the first subscriber of data modification.
+        """
+        if len(self._updated) == 1:
+            try:
+                self._notified = self.get()
+            except:
+                logger.warning('Unable to compute the value of derived property', exc_info=True)
+
+            for prop in self._properties:
+                prop.updated.add(self._property_updated)
+
+    def _after_remove_updated(self):
+        """
+        Stop listening to the properties if there is not subscribers for data modification.
+        """
+        if len(self._updated) == 0:
+            for prop in self._properties:
+                prop.updated.remove(self._property_updated)
+
+    def _property_updated(self, value):
+        """
+        Called when the value of any property it depends on has been changed.
+        :param value: The new value of the property changed.
+        """
+        try:
+            new_value = self.get()
+        except:
+            logger.warning('Unable to compute the value of derived property', exc_info=True)
+            return
+
+        # properties changed together notify one by one, the value
+        # computed on the first notification already includes all of them.
+        if new_value != self._notified:
+            self._notified = new_value
+            self.updated(new_value)
+
+    def __str__(self):
+        """
+        Get a string representation of a property.
+        :return str: The string representation of a property.
+        """
+        return text_type(self.get())
@@ -25,6 +25,7 @@ __all__ = [
     'add_reader',
     'get_reader',
     'remove_reader',
+    'BaseReader',
     'IniReader',
     'JsonReader',
     'TomlReader',
@@ -74,7 +75,37 @@ def remove_reader(name):
     return __readers.pop(name, None)
 
 
-class IniReader(abc.Reader):
+class BaseReader(abc.Reader):
+    """
+    Base reader class.
+
+    :param bool ignore_case: If True the data is read into `IgnoreCaseDict` objects,
+        otherwise into plain dicts, which are faster when the keys are normalized.
+    """
+
+    def __init__(self, ignore_case=True):
+        if not isinstance(ignore_case, bool):
+            raise TypeError('ignore_case must be a bool')
+
+        self._ignore_case = ignore_case
+
+    @property
+    def ignore_case(self):
+        """
+        Get whether the data is read into `IgnoreCaseDict` objects.
+        :return bool: True if the data is read into `IgnoreCaseDict` objects, otherwise False.
+        """
+        return self._ignore_case
+
+    def _get_dict_cls(self):
+        """
+        Get the class used to hold the data read.
+        :return type: `IgnoreCaseDict` if ignore case, otherwise dict.
+        """
+        return IgnoreCaseDict if self._ignore_case else dict
+
+
+class IniReader(BaseReader):
     """
     A reader for ini content.
 
@@ -95,7 +126,8 @@ class IniReader(abc.Reader):
         """
         Read the given stream and returns it as a dict.
         :param stream: The stream to read the configuration from.
-        :return IgnoreCaseDict: The configuration read from the stream.
+        :return IgnoreCaseDict: The configuration read from the stream,
+            a dict if not ignore case.
         """
         if stream is None:
             raise ValueError('stream cannot be None')
@@ -107,10 +139,12 @@ class IniReader(abc.Reader):
         else:
             parser.read_file(stream)
 
-        data = IgnoreCaseDict()
+        dict_cls = self._get_dict_cls()
+
+        data = dict_cls()
 
         for section in parser.sections():
-            data_section = data[section] = IgnoreCaseDict()
+            data_section = data[section] = dict_cls()
 
             for option in parser.options(section):
                 data_section[option] = parser.get(section, option, raw=True)
@@ -118,7 +152,7 @@ class IniReader(abc.Reader):
         return data
 
 
-class JsonReader(abc.Reader):
+class JsonReader(BaseReader):
     """
     A reader for json content.
 
@@ -139,15 +173,19 @@ class JsonReader(abc.Reader):
         """
         Read the given stream and returns it as a dict.
         :param stream: The stream to read the configuration from.
-        :return IgnoreCaseDict: The configuration read from the stream.
+        :return IgnoreCaseDict: The configuration read from the stream,
+            a dict if not ignore case.
         """
         if stream is None:
             raise ValueError('stream cannot be None')
 
+        if not self._ignore_case:
+            return json.load(stream)
+
         return json.load(stream, object_pairs_hook=IgnoreCaseDict)
 
 
-class TomlReader(abc.Reader):
+class TomlReader(BaseReader):
     """
     A reader for toml content.
 
@@ -166,23 +204,26 @@ class TomlReader(abc.Reader):
 
     """
 
-    def __init__(self):
+    def __init__(self, ignore_case=True):
         if not toml:
             raise LibraryRequiredError('toml', 'https://pypi.python.org/pypi/toml')
 
+        super(TomlReader, self).__init__(ignore_case)
+
     def read(self, stream):
         """
         Read the given stream and returns it as a dict.
         :param stream: The stream to read the configuration from.
-        :return IgnoreCaseDict: The configuration read from the stream.
+        :return IgnoreCaseDict: The configuration read from the stream,
+            a dict if not ignore case.
         """
         if stream is None:
             raise ValueError('stream cannot be None')
 
-        return toml.load(stream, _dict=IgnoreCaseDict)
+        return toml.load(stream, _dict=self._get_dict_cls())
 
 
-class YamlReader(abc.Reader):
+class YamlReader(BaseReader):
     """
     A reader for yaml content.
 
@@ -201,15 +242,18 @@ class YamlReader(abc.Reader):
 
     """
 
-    def __init__(self):
+    def __init__(self, ignore_case=True):
         if not yaml:
             raise LibraryRequiredError('PyYAML', 'https://pypi.python.org/pypi/PyYAML')
 
+        super(YamlReader, self).__init__(ignore_case)
+
     def read(self, stream):
         """
         Read the given stream and returns it as a dict.
         :param stream: The stream to read the configuration from.
-        :return IgnoreCaseDict: The configuration read from the stream.
+        :return IgnoreCaseDict: The configuration read from the stream,
+            a dict if not ignore case.
         """
         if stream is None:
             raise ValueError('stream cannot be None')
@@ -219,9 +263,11 @@ class YamlReader(abc.Reader):
     def _get_loader(self):
         """
         Get a loader that uses an IgnoreCaseDict for
-        complex objects.
+        complex objects, or a plain dict if not ignore case.
         :return yaml.Loader: The loader object.
         """
+        dict_cls = self._get_dict_cls()
+
         # this class was copied from
         # https://github.com/fmenabe/python-yamlordereddictloader/blob/master/yamlordereddictloader.py
         # and adapted to use IgnoreCaseDict
@@ -235,7 +281,7 @@ class YamlReader(abc.Reader):
                     'tag:yaml.org,2002:omap', type(self).construct_yaml_map)
 
             def construct_yaml_map(self, node):
-                data = IgnoreCaseDict()
+                data = dict_cls()
                 yield data
                 value = self.construct_mapping(node)
                 data.update(value)
@@ -247,7 +293,7 @@ class YamlReader(abc.Reader):
                     raise yaml.constructor.ConstructorError(
                         None, None, 'expected a mapping node, but found %s' % node.id, node.start_mark)
 
-                mapping = IgnoreCaseDict()
+                mapping = dict_cls()
                 for key_node, value_node in node.value:
                     key = self.construct_object(key_node, deep=deep)
                     try:
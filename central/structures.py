@@ -2,7 +2,250 @@
 Data structure implementations.
 """
 
-from collections import MutableMapping
+from collections import Mapping, MutableMapping
+from threading import Lock
+from .compat import PY2, intern
+
+
+# the lowered form of the keys recently looked up, it is
+# cleared when full so it only holds the keys frequently used.
+_lowered_keys = {}
+_lowered_keys_max_size = 10000
+
+
+def _lower(key):
+    """
+    Get the lowered form of the given key.
+    The lowered keys are interned, so dicts sharing the
+    same keys share the same string objects.
+    :param str key: The key to be lowered.
+    :return str: The lowered key.
+    """
+    lowered = _lowered_keys.get(key)
+
+    if lowered is not None:
+        return lowered
+
+    try:
+        lowered = key.lower()
+    except AttributeError:
+        raise TypeError('key must be a str')
+
+    try:
+        lowered = intern(lowered)
+    except TypeError:
+        # only exact str objects can be interned.
+        pass
+
+    if len(_lowered_keys) >= _lowered_keys_max_size:
+        _lowered_keys.clear()
+
+    _lowered_keys[key] = lowered
+
+    return lowered
+
+
+# held while a nested mapping of a `LazyIgnoreCaseDict` is converted,
+# so the readers of the same mapping share the same converted object.
+_convert_lock = Lock()
+
+
+def _convert(value):
+    """
+    Convert the given value into a `LazyIgnoreCaseDict`
+    if it is a mapping not converted yet.
+    :param value: The value to be converted.
+    :return: The value converted.
+    """
+    if isinstance(value, IgnoreCaseDict) or not isinstance(value, Mapping):
+        return value
+
+    return LazyIgnoreCaseDict(value)
+
+
+class ChangeSet(object):
+    """
+    An immutable set of the keys changed in a configuration,
+    the nested keys are joined by a dot.
+
+    A change set built with `unknown` set to True means the keys
+    changed are not known, so it affects every key.
+    >>> changes = ChangeSet(modified=['database.port'])
+    >>> changes.affects('database')
+    True
+    >>> changes.affects('database.host')
+    False
+
+    :param added: The keys added.
+    :param removed: The keys removed.
+    :param modified: The keys whose value has been modified.
+    :param bool unknown: If True the keys changed are not known.
+    :param bool ignore_case: If True the keys are matched case insensitively.
+    """
+
+    __slots__ = ('_added', '_removed', '_modified', '_unknown', '_ignore_case', '_keys', '_parents')
+
+    DELIMITER = '.'
+
+    def __init__(self, added=(), removed=(), modified=(), unknown=False, ignore_case=True):
+        if ignore_case:
+            added = [_lower(key) for key in added]
+            removed = [_lower(key) for key in removed]
+            modified = [_lower(key) for key in modified]
+
+        self._added = frozenset(added)
+        self._removed = frozenset(removed)
+        self._modified = frozenset(modified)
+        self._unknown = unknown
+        self._ignore_case = ignore_case
+        self._keys = self._added | self._removed | self._modified
+        self._parents = None
+
+    @property
+    def added(self):
+        """
+        Get the keys added.
+        :return frozenset: The keys added.
+        """
+        return self._added
+
+    @property
+    def removed(self):
+        """
+        Get the keys removed.
+        :return frozenset: The keys removed.
+        """
+        return self._removed
+
+    @property
+    def modified(self):
+        """
+        Get the keys whose value has been modified.
+        :return frozenset: The keys modified.
+        """
+        return self._modified
+
+    @property
+    def keys(self):
+        """
+        Get all the keys changed.
+        :return frozenset: The keys added, removed and modified.
+        """
+        return self._keys
+
+    @property
+    def unknown(self):
+        """
+        Get whether the keys changed are not known.
+        :return bool: True if the keys changed are not known, otherwise False.
+        """
+        return self._unknown
+
+    @property
+    def ignore_case(self):
+        """
+        Get whether the keys are matched case insensitively.
+        :return bool: True if the keys are matched case insensitively, otherwise False.
+        """
+        return self._ignore_case
+
+    def affects(self, key):
+        """
+        Get whether the given key is affected by the changes, a key is affected
+        if the key itself, any of its parents or any of its children has changed.
+        :param str key: The key.
+        :return bool: True if the key is affected, otherwise False.
+        """
+        if self._unknown:
+            return True
+
+        if not self._keys:
+            return False
+
+        if self._ignore_case:
+            key = _lower(key)
+
+        if key in self._keys:
+            return True
+
+        parents = self._parents
+
+        if parents is None:
+            parents = set()
+
+            for changed in self._keys:
+                i = changed.rfind(self.DELIMITER)
+
+                while i > 0:
+                    changed = changed[:i]
+                    parents.add(changed)
+                    i = changed.rfind(self.DELIMITER)
+
+            self._parents = parents = frozenset(parents)
+
+        if key in parents:
+            return True
+
+        i = key.rfind(self.DELIMITER)
+
+        while i > 0:
+            key = key[:i]
+
+            if key in self._keys:
+                return True
+
+            i = key.rfind(self.DELIMITER)
+
+        return False
+
+    def merge(self, other):
+        """
+        Merge the given change set, made after this one, into a new change set.
+        A key added and then removed is not changed, a key removed
+        and then added again is modified.
+        :param ChangeSet other: The change set made after this one.
+        :return ChangeSet: The merged change set.
+        """
+        if not isinstance(other, ChangeSet):
+            raise TypeError('other must be a ChangeSet')
+
+        added = set(self._added)
+        removed = set(self._removed)
+        modified = set(self._modified)
+
+        for key in other.added:
+            if key in removed:
+                removed.discard(key)
+                modified.add(key)
+            else:
+                added.add(key)
+
+        for key in other.removed:
+            if key in added:
+                added.discard(key)
+            else:
+                modified.discard(key)
+                removed.add(key)
+
+        for key in other.modified:
+            if key not in added:
+                modified.add(key)
+
+        return ChangeSet(added, removed, modified,
+                         unknown=self._unknown or other.unknown,
+                         ignore_case=self._ignore_case)
+
+    def __bool__(self):
+        return self._unknown or bool(self._keys)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        if self._unknown:
+            return 'ChangeSet(unknown=True)'
+
+        return 'ChangeSet(added=%s, removed=%s, modified=%s)' % (
+            sorted(self._added), sorted(self._removed), sorted(self._modified))
 
 
 class IgnoreCaseDict(MutableMapping):
@@ -14,12 +257,20 @@ class IgnoreCaseDict(MutableMapping):
     True
     >>> set(d.keys())
     {'Foo'}
+
+    The values are held by a dict indexed by the lowered keys and
+    the original keys are only held when they are not lower case.
     """
 
+    # the abstract classes have no slots on Python 2,
+    # so the instances already support weak references.
+    __slots__ = ('_keys', '_values') + (() if PY2 else ('__weakref__',))
+
     __marker = object()
 
     def __init__(self, seq=None, **kwargs):
-        self._store = {}
+        self._keys = {}
+        self._values = {}
 
         if seq:
             self.update(seq)
@@ -28,19 +279,20 @@ class IgnoreCaseDict(MutableMapping):
             self.update(kwargs)
 
     def clear(self):
-        self._store.clear()
+        self._keys.clear()
+        self._values.clear()
 
     def copy(self):
-        return self.__class__(self)
+        d = IgnoreCaseDict.__new__(self.__class__)
+        d._keys = self._keys.copy()
+        d._values = self._values.copy()
+        return d
 
     def get(self, key, default=__marker):
-        try:
-            pair = self._store.get(key.lower(), self.__marker)
-        except AttributeError:
-            raise TypeError('key must be a str')
+        value = self._values.get(_lower(key), self.__marker)
 
-        if pair is not self.__marker:
-            return pair[1]
+        if value is not self.__marker:
+            return value
 
         if default is self.__marker:
             return None
@@ -48,13 +300,13 @@ class IgnoreCaseDict(MutableMapping):
         return default
 
     def pop(self, key, default=__marker):
-        try:
-            pair = self._store.pop(key.lower(), self.__marker)
-        except AttributeError:
-            raise TypeError('key must be a str')
+        lowered = _lower(key)
+
+        value = self._values.pop(lowered, self.__marker)
 
-        if pair is not self.__marker:
-            return pair[1]
+        if value is not self.__marker:
+            self._keys.pop(lowered, None)
+            return value
 
         if default is self.__marker:
             raise KeyError(key)
@@ -62,50 +314,135 @@ class IgnoreCaseDict(MutableMapping):
         return default
 
     def popitem(self):
-        _, pair = self._store.popitem()
-        return pair[0], pair[1]
+        lowered, value = self._values.popitem()
+        return self._keys.pop(lowered, lowered), value
+
+    def update(self, *args, **kwargs):
+        if len(args) == 1 and type(args[0]) in (IgnoreCaseDict, type(self)):
+            # the keys are already lowered, the original keys replaced
+            # by keys in lower case are dropped as __setitem__ does.
+            other = args[0]
+            keys = self._keys
+
+            if keys:
+                for lowered in other._values:
+                    if lowered not in other._keys:
+                        keys.pop(lowered, None)
+
+            keys.update(other._keys)
+            self._values.update(other._values)
+            args = ()
+
+        super(IgnoreCaseDict, self).update(*args, **kwargs)
 
     __copy__ = copy
 
     def __contains__(self, key):
-        try:
-            return key.lower() in self._store
-        except AttributeError:
-            raise TypeError('key must be a str')
+        return _lower(key) in self._values
 
     def __delitem__(self, key):
-        try:
-            del self._store[key.lower()]
-        except AttributeError:
-            raise TypeError('key must be a str')
+        lowered = _lower(key)
+        del self._values[lowered]
+        self._keys.pop(lowered, None)
 
     def __getitem__(self, key):
-        try:
-            return self._store[key.lower()][1]
-        except AttributeError:
-            raise TypeError('key must be a str')
+        return self._values[_lower(key)]
 
     def __setitem__(self, key, value):
-        try:
-            self._store[key.lower()] = (key, value)
-        except AttributeError:
-            raise TypeError('key must be a str')
+        lowered = _lower(key)
+
+        self._values[lowered] = value
+
+        if key != lowered:
+            self._keys[lowered] = key
+        elif self._keys:
+            self._keys.pop(lowered, None)
 
     def __iter__(self):
-        for pair in self._store.values():
-            yield pair[0]
+        keys = self._keys
+
+        if not keys:
+            return iter(self._values)
+
+        return (keys.get(lowered, lowered) for lowered in self._values)
 
     def __len__(self):
-        return len(self._store)
+        return len(self._values)
+
+    def __reduce__(self):
+        return self.__class__, (list(self.items()),)
 
     def __repr__(self):
-        s = '{'
+        keys = self._keys
+
+        return '{' + ', '.join(repr(keys.get(lowered, lowered)) + ': ' + repr(value)
+                               for lowered, value in self._values.items()) + '}'
+
+
+class LazyIgnoreCaseDict(IgnoreCaseDict):
+    """
+    A case insensitive dict that converts its nested mappings into
+    `LazyIgnoreCaseDict` objects only when they are accessed, the
+    converted mappings replace the original ones.
+
+    Only the first level of the given mapping is copied, the nested
+    mappings are not copied until they are accessed.
+    >>> d = LazyIgnoreCaseDict({'Foo': {'Bar': 5}})
+    >>> d['foo']['BAR']
+    5
+    """
+
+    __slots__ = ()
+
+    __marker = object()
+
+    def get(self, key, default=None):
+        lowered = _lower(key)
+
+        value = self._values.get(lowered, self.__marker)
+
+        if value is self.__marker:
+            return default
+
+        return self._convert_value(lowered, value)
+
+    def pop(self, key, default=__marker):
+        if default is self.__marker:
+            value = super(LazyIgnoreCaseDict, self).pop(key)
+        else:
+            value = super(LazyIgnoreCaseDict, self).pop(key, default)
+
+        return _convert(value)
+
+    def popitem(self):
+        key, value = super(LazyIgnoreCaseDict, self).popitem()
+        return key, _convert(value)
+
+    def __getitem__(self, key):
+        lowered = _lower(key)
+        return self._convert_value(lowered, self._values[lowered])
+
+    def _convert_value(self, lowered, value):
+        """
+        Convert the given value if it is a mapping not converted yet,
+        the converted value replaces the original one.
+
+        The conversion is made under a lock, so the readers of a
+        mapping converted by multiple threads get the same object.
+        :param str lowered: The lowered key.
+        :param value: The value to be converted.
+        :return: The value converted.
+        """
+        if isinstance(value, IgnoreCaseDict) or not isinstance(value, Mapping):
+            return value
+
+        with _convert_lock:
+            current = self._values.get(lowered, self.__marker)
 
-        for key, value in self.items():
-            if not s.endswith('{'):
-                s += ', '
-            s += repr(key) + ': ' + repr(value)
+            if current is not value:
+                # converted by another thread or replaced meanwhile.
+                return _convert(value if current is self.__marker else current)
 
-        s += '}'
+            converted = self._values[lowered] = LazyIgnoreCaseDict(value)
 
-        return s
+        return converted
@@ -5,7 +5,9 @@ Utility module
 import os
 
 from collections import Mapping, MutableMapping
-from .structures import IgnoreCaseDict
+from . import abc
+from .compat import string_types
+from .structures import ChangeSet, IgnoreCaseDict, LazyIgnoreCaseDict
 
 
 def get_file_ext(filename):
@@ -20,25 +22,186 @@ def get_file_ext(filename):
 def make_ignore_case(data):
     """
     Convert the given `Mapping` into an `IgnoreCaseDict`.
+    The nested mappings are converted when they are accessed,
+    so they must not be modified after.
     :param Mapping data: The object to be converted.
     :return IgnoreCaseDict: The object converted to IgnoreCaseDict.
     """
     if isinstance(data, IgnoreCaseDict):
         return data
 
-    d = IgnoreCaseDict()
+    return LazyIgnoreCaseDict(data)
+
+
+def make_case_sensitive(data):
+    """
+    Convert the given `Mapping` into a plain dict, the nested
+    `Mapping` objects are also converted.
+    :param Mapping data: The object to be converted.
+    :return dict: The object converted to dict.
+    """
+    d = {}
 
     for key in data:
         value = data.get(key)
 
         if isinstance(value, Mapping):
-            value = make_ignore_case(value)
+            value = make_case_sensitive(value)
 
         d[key] = value
 
     return d
 
 
+def diff_dict(old, new, delimiter='.', ignore_case=True):
+    """
+    Compare the given `Mapping` objects and get the keys changed,
+    the nested keys are joined by the delimiter.
+
+    The nested mappings shared by both objects are skipped without
+    being compared, keys holding None are taken as not present.
+    :param Mapping old: The previous mapping.
+    :param Mapping new: The current mapping.
+    :param str delimiter: The delimiter used to join the keys.
+    :param bool ignore_case: If True the keys are lower cased.
+    :return ChangeSet: The keys added, removed and modified.
+    """
+    added = set()
+    removed = set()
+    modified = set()
+
+    if old is not new:
+        _diff_dict(old, new, '', delimiter, ignore_case, added, removed, modified)
+
+    return ChangeSet(added, removed, modified, ignore_case=ignore_case)
+
+
+def _diff_dict(old, new, prefix, delimiter, ignore_case, added, removed, modified):
+    """
+    Add the keys changed between the given `Mapping` objects into the given sets.
+    :param Mapping old: The previous mapping.
+    :param Mapping new: The current mapping.
+    :param str prefix: The path of the mappings.
+    :param str delimiter: The delimiter used to join the keys.
+    :param bool ignore_case: If True the keys are lower cased.
+    :param set added: The keys added.
+    :param set removed: The keys removed.
+    :param set modified: The keys modified.
+    """
+    for key in old:
+        if not isinstance(key, string_types):
+            continue
+
+        path = prefix + (key.lower() if ignore_case else key)
+
+        _diff_value(old.get(key), new.get(key), path, delimiter, ignore_case, added, removed, modified)
+
+    for key in new:
+        if not isinstance(key, string_types) or key in old:
+            continue
+
+        path = prefix + (key.lower() if ignore_case else key)
+
+        _diff_value(None, new.get(key), path, delimiter, ignore_case, added, removed, modified)
+
+
+def _diff_value(old_value, new_value, path, delimiter, ignore_case, added, removed, modified):
+    """
+    Add the keys changed between the given values into the given sets.
+    :param old_value: The previous value.
+    :param new_value: The current value.
+    :param str path: The path of the values.
+    :param str delimiter: The delimiter used to join the keys.
+    :param bool ignore_case: If True the keys are lower cased.
+    :param set added: The keys added.
+    :param set removed: The keys removed.
+    :param set modified: The keys modified.
+    """
+    if old_value is new_value:
+        return
+
+    if old_value is None:
+        added.add(path)
+        _add_nested_keys(new_value, path, delimiter, ignore_case, added)
+        return
+
+    if new_value is None:
+        removed.add(path)
+        _add_nested_keys(old_value, path, delimiter, ignore_case, removed)
+        return
+
+    old_is_mapping = isinstance(old_value, Mapping)
+    new_is_mapping = isinstance(new_value, Mapping)
+
+    if old_is_mapping and new_is_mapping:
+        _diff_dict(old_value, new_value, path + delimiter, delimiter, ignore_case, added, removed, modified)
+
+    elif old_is_mapping or new_is_mapping:
+        modified.add(path)
+        _add_nested_keys(old_value, path, delimiter, ignore_case, removed)
+        _add_nested_keys(new_value, path, delimiter, ignore_case, added)
+
+    elif old_value != new_value:
+        modified.add(path)
+
+
+def _add_nested_keys(value, path, delimiter, ignore_case, keys):
+    """
+    Add the paths of the nested values into the given set if the value is a `Mapping`.
+    :param value: The value.
+    :param str path: The path of the value.
+    :param str delimiter: The delimiter used to join the keys.
+    :param bool ignore_case: If True the keys are lower cased.
+    :param set keys: The set to receive the paths.
+    """
+    if isinstance(value, Mapping):
+        nested = {}
+        _flatten_dict(value, path + delimiter, delimiter, ignore_case, nested)
+        keys.update(nested)
+
+
+def flatten_dict(data, delimiter='.', ignore_case=True):
+    """
+    Flatten the given `Mapping` into a dict where the keys are the
+    paths to every nested value joined by the delimiter.
+    Keys containing the delimiter are skipped since they cannot be
+    reached by a delimited path.
+    :param Mapping data: The mapping to be flattened.
+    :param str delimiter: The delimiter used to join the keys.
+    :param bool ignore_case: If True the paths are lower cased.
+    :return dict: The flattened dict.
+    """
+    flat = {}
+    _flatten_dict(data, '', delimiter, ignore_case, flat)
+    return flat
+
+
+def _flatten_dict(data, prefix, delimiter, ignore_case, flat):
+    """
+    Add the paths of the given `Mapping` into the flattened dict.
+    :param Mapping data: The mapping to be flattened.
+    :param str prefix: The path of the mapping.
+    :param str delimiter: The delimiter used to join the keys.
+    :param bool ignore_case: If True the paths are lower cased.
+    :param dict flat: The flattened dict.
+    """
+    for key in data:
+        if not isinstance(key, string_types) or delimiter in key:
+            continue
+
+        value = data.get(key)
+
+        if value is None:
+            continue
+
+        path = prefix + (key.lower() if ignore_case else key)
+
+        flat[path] = value
+
+        if isinstance(value, Mapping):
+            _flatten_dict(value, path + delimiter, delimiter, ignore_case, flat)
+
+
 def merge_dict(target, *sources):
     """
     Merge the given list of `Mapping` objects into `target` object.
@@ -70,20 +233,51 @@ class EventHandler(object):
     """
     A simple event handling class, which manages callbacks to be executed.
 
+    When a dispatcher is given the callbacks are dispatched to it rather than
+    executed by the caller, so a slow callback does not block the caller.
+
     :param after_add_func: The func called after adding a new callback.
     :param after_remove_func: The func called after removing a callback.
+    :param abc.Dispatcher dispatcher: The dispatcher used to execute the callbacks,
+        if None the callbacks are executed by the caller.
     """
-    def __init__(self, after_add_func=None, after_remove_func=None):
+
+    __slots__ = ('_after_add_func', '_after_remove_func', '_dispatcher', '_callbacks')
+
+    def __init__(self, after_add_func=None, after_remove_func=None, dispatcher=None):
         if after_add_func and not callable(after_add_func):
             raise TypeError('after_add_func must be callable object')
 
         if after_remove_func and not callable(after_remove_func):
             raise TypeError('after_remove_func must be callable object')
 
+        if dispatcher is not None and not isinstance(dispatcher, abc.Dispatcher):
+            raise TypeError('dispatcher must be an abc.Dispatcher')
+
         self._after_add_func = after_add_func
         self._after_remove_func = after_remove_func
+        self._dispatcher = dispatcher
         self._callbacks = []
 
+    @property
+    def dispatcher(self):
+        """
+        Get the dispatcher used to execute the callbacks.
+        :return abc.Dispatcher: The dispatcher, None if the callbacks are executed by the caller.
+        """
+        return self._dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, value):
+        """
+        Set the dispatcher used to execute the callbacks.
+        :param abc.Dispatcher value: The dispatcher, if None the callbacks are executed by the caller.
+        """
+        if value is not None and not isinstance(value, abc.Dispatcher):
+            raise TypeError('dispatcher must be an abc.Dispatcher')
+
+        self._dispatcher = value
+
     def __call__(self, *args):
         """
         Execute all callbacks.
@@ -91,8 +285,17 @@ class EventHandler(object):
         Execute all connected callbacks in the order of addition,
         passing the sender of the EventHandler as first argument and the
         optional args as second, third, ... argument to them.
+
+        When a dispatcher is set the callbacks are dispatched
+        and an empty list is returned.
         """
-        return [callback(*args) for callback in self._callbacks]
+        if self._dispatcher is None:
+            return [callback(*args) for callback in self._callbacks]
+
+        for callback in list(self._callbacks):
+            self._dispatcher.dispatch(callback, *args)
+
+        return []
 
     def __len__(self):
         """
@@ -141,16 +344,22 @@ class Version(object):
 
     :param int number: The initial version number.
     """
+
+    __slots__ = ('_number', '_changed')
+
     def __init__(self, number=0):
         self._number = number
-        self._changed = EventHandler()
+        self._changed = None
 
     @property
     def changed(self):
         """
-        Get the changed event handler.
+        Get the changed event handler, it is created on first access.
         :return EventHandler: The changed event handler.
         """
+        if self._changed is None:
+            self._changed = EventHandler()
+
         return self._changed
 
     @property
@@ -168,7 +377,9 @@ class Version(object):
         :param int value: The version number.
         """
         self._number = value
-        self._changed()
+
+        if self._changed is not None:
+            self._changed()
 
     def __str__(self):
         """
@@ -1,13 +1,30 @@
 from __future__ import absolute_import
 
+import sys
+
 from collections import MutableMapping
 
 from central.compat import text_type
-from central.config import PrefixedConfig, ReloadConfig
+from central.config import MemoryConfig, PrefixedConfig, ReloadConfig
 from central.decoders import Decoder
-from central.exceptions import ConfigError
+from central.exceptions import ConfigError, LoadError
 from central.interpolation import BashInterpolator, ConfigLookup
 from central.utils import EventHandler
+from threading import Event
+from unittest import skipIf
+
+
+skip_without_async = skipIf(sys.version_info < (3, 5), 'async/await requires Python 3.5+')
+
+
+def run_async(awaitable):
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
 
 
 class BaseConfigMixin(object):
@@ -36,7 +53,7 @@ class BaseConfigMixin(object):
 
     def test_get_updated_with_default_value(self):
         config = self._create_base_config()
-        self.assertEqual(EventHandler, type(config.updated))
+        self.assertIsInstance(config.updated, EventHandler)
 
     def test_on_updated_with_func_value(self):
         def func():
@@ -57,6 +74,15 @@ class BaseConfigMixin(object):
         self.assertEqual(PrefixedConfig, type(config))
         self.assertEqual('database', config.prefix)
 
+    def test_snapshot(self):
+        config = self._create_base_config(load_data=True)
+        snapshot = config.snapshot()
+
+        self.assertEqual('value', snapshot.get_value('key_str', str))
+        self.assertEqual('value', snapshot.get_value('key_interpolated', str))
+        self.assertEqual('value', snapshot.get_value('key_delimited.key_str', str))
+        self.assertEqual(len(config), len(snapshot))
+
     def test_get_before_loading(self):
         config = self._create_base_config()
         self.assertIsNone(config.get_int('key_int'))
@@ -134,6 +160,58 @@ class BaseConfigMixin(object):
         config = self._create_base_config(load_data=True)
         self.assertEqual('value', config.get_value('key_STR', str))
 
+    def test_get_many(self):
+        config = self._create_base_config(load_data=True)
+
+        values = config.get_many({
+            'key_str': (str, None),
+            'key_int_as_str': (int, None),
+            'key_interpolated': (str, None),
+            'key_delimited.key_str': (str, None),
+            'not_found': (int, 2),
+            'not_found_callable': (int, lambda: 3),
+        })
+
+        self.assertEqual({
+            'key_str': 'value',
+            'key_int_as_str': 1,
+            'key_interpolated': 'value',
+            'key_delimited.key_str': 'value',
+            'not_found': 2,
+            'not_found_callable': 3,
+        }, values)
+
+    def test_get_many_with_str_value(self):
+        config = self._create_base_config(load_data=True)
+        with self.assertRaises(TypeError):
+            config.get_many('key_str')
+
+    def test_compile_accessor(self):
+        config = self._create_base_config(load_data=True)
+
+        self.assertEqual('value', config.compile_accessor('key_str', str)())
+        self.assertEqual(1, config.compile_accessor('key_int_as_str', int)())
+        self.assertEqual('value', config.compile_accessor('key_interpolated', str)())
+        self.assertEqual('value', config.compile_accessor('key_delimited.key_str', str)())
+        self.assertEqual(2, config.compile_accessor('not_found', int, 2)())
+        self.assertEqual([1], config.compile_accessor('not_found', list, [1])())
+
+    def test_compile_accessor_is_cached(self):
+        config = self._create_base_config()
+
+        self.assertIs(config.compile_accessor('key_int', int, 1), config.compile_accessor('key_int', int, 1))
+        self.assertIsNot(config.compile_accessor('key_int', int, 1), config.compile_accessor('key_int', str, 1))
+
+    def test_compile_accessor_with_key_as_int(self):
+        config = self._create_base_config()
+        with self.assertRaises(TypeError):
+            config.compile_accessor(1234, str)
+
+    def test_compile_accessor_with_type_as_none(self):
+        config = self._create_base_config()
+        with self.assertRaises(ValueError):
+            config.compile_accessor('key_str', None)
+
     def test_get_bool_with_existent_key(self):
         config = self._create_base_config(load_data=True)
         self.assertEqual(bool, type(config.get_bool('key_int')))
@@ -299,6 +377,71 @@ class BaseDataConfigMixin(BaseConfigMixin):
         with self.assertRaises(TypeError):
             config.interpolator = 'non interpolator'
 
+    def test_get_value_from_cache(self):
+        config = self._create_base_config(load_data=True)
+
+        self.assertEqual(1, config.get_value('key_int_as_str', int))
+        self.assertEqual(0, config.cache_hits)
+        self.assertEqual(1, config.cache_misses)
+
+        self.assertEqual(1, config.get_value('key_int_as_str', int))
+        self.assertEqual(1, config.cache_hits)
+        self.assertEqual(1, config.cache_misses)
+
+        self.assertEqual('1', config.get_value('key_int_as_str', str))
+        self.assertEqual(1, config.cache_hits)
+        self.assertEqual(2, config.cache_misses)
+
+    def test_get_value_from_cache_with_mutable_value(self):
+        config = self._create_base_config(load_data=True)
+
+        config.get_list('key_list_as_str').append('item3')
+        config.get_dict('key_dict_as_str')['other_key'] = 'value'
+
+        self.assertEqual(['item1', 'item2'], config.get_list('key_list_as_str'))
+        self.assertEqual({'item_key': 'value'}, config.get_dict('key_dict_as_str'))
+
+    def test_get_indexed_with_default_value(self):
+        config = self._create_base_config()
+        self.assertFalse(config.indexed)
+
+    def test_set_indexed_with_string_value(self):
+        config = self._create_base_config()
+        with self.assertRaises(TypeError):
+            config.indexed = 'true'
+
+    def test_get_value_with_indexed_delimited_key(self):
+        config = self._create_base_config(load_data=True)
+        config.indexed = True
+        self.assertEqual('value', config.get_value('key_delimited.key_str', str))
+        self.assertEqual('value', config.get_value('KEY_delimited.KEY_str', str))
+        self.assertIsNone(config.get_value('key_str.other_key', str))
+        self.assertIsNone(config.get_value('key_parent.not_found', str))
+
+    def test_get_ignore_case_with_default_value(self):
+        config = self._create_base_config()
+        self.assertTrue(config.ignore_case)
+
+    def test_set_ignore_case_with_string_value(self):
+        config = self._create_base_config()
+        with self.assertRaises(TypeError):
+            config.ignore_case = 'false'
+
+    def test_get_value_with_case_sensitive_key(self):
+        config = self._create_base_config(load_data=True)
+        config.ignore_case = False
+        self.assertEqual('value', config.get_value('key_str', str))
+        self.assertEqual('value', config.get_value('key_delimited.key_str', str))
+        self.assertIsNone(config.get_value('KEY_str', str))
+        self.assertIsNone(config.get_value('key_delimited.KEY_str', str))
+
+    def test_get_value_with_case_sensitive_indexed_key(self):
+        config = self._create_base_config(load_data=True)
+        config.ignore_case = False
+        config.indexed = True
+        self.assertEqual('value', config.get_value('key_delimited.key_str', str))
+        self.assertIsNone(config.get_value('KEY_delimited.KEY_str', str))
+
 
 class NextMixin(object):
     def _create_config_with_invalid_next(self):
@@ -316,3 +459,166 @@ class NextMixin(object):
         config = self._create_config_with_invalid_next()
         with self.assertRaises(ConfigError):
             config.load()
+
+
+class LoadConcurrentlyMixin(object):
+    def _create_composite_config(self, *configs, **kwargs):
+        raise NotImplementedError()
+
+    def _create_slow_config(self, data, delay=0, error=None):
+        class Config(MemoryConfig):
+            def load(self):
+                started.set()
+
+                if delay:
+                    release.wait(delay)
+
+                if error:
+                    raise error
+
+        started = Event()
+        release = Event()
+
+        config = Config(data=data)
+        config.started = started
+        config.release = release
+
+        return config
+
+    def test_init_max_workers_with_str_value(self):
+        with self.assertRaises(TypeError):
+            self._create_composite_config(MemoryConfig(), max_workers='1')
+
+    def test_init_max_workers_with_zero_value(self):
+        with self.assertRaises(ValueError):
+            self._create_composite_config(MemoryConfig(), max_workers=0)
+
+    def test_init_timeout_with_str_value(self):
+        with self.assertRaises(TypeError):
+            self._create_composite_config(MemoryConfig(), max_workers=1, timeout='1')
+
+    def test_init_timeout_without_max_workers(self):
+        with self.assertRaises(ValueError):
+            self._create_composite_config(MemoryConfig(), timeout=1)
+
+    def test_init_with_unexpected_keyword_argument(self):
+        with self.assertRaises(TypeError):
+            self._create_composite_config(MemoryConfig(), other=1)
+
+    def test_get_load_options(self):
+        config = self._create_composite_config(MemoryConfig(), max_workers=2, timeout=5)
+
+        self.assertEqual(2, config.max_workers)
+        self.assertEqual(5, config.timeout)
+
+    def test_load_concurrently(self):
+        started = [Event(), Event()]
+        overlapped = []
+
+        class Config(MemoryConfig):
+            def __init__(self, index, data):
+                super(Config, self).__init__(data=data)
+                self.index = index
+
+            def load(self):
+                # it only returns True if the other child is loading at the same time.
+                started[self.index].set()
+                overlapped.append(started[1 - self.index].wait(1))
+
+        config = self._create_composite_config(
+            Config(0, {'key': 1, 'key1': 1}),
+            Config(1, {'key': 2, 'key2': 2}),
+            max_workers=2)
+
+        config.load()
+
+        self.assertEqual([True, True], overlapped)
+        self.assertEqual(2, config.get_value('key', int))
+        self.assertEqual(1, config.get_value('key1', int))
+        self.assertEqual(2, config.get_value('key2', int))
+
+    def test_load_concurrently_with_errors(self):
+        child1 = self._create_slow_config({'key': 1}, error=MemoryError())
+        child2 = self._create_slow_config({'key': 2})
+        child3 = self._create_slow_config({'key': 3}, error=ValueError())
+
+        config = self._create_composite_config(child1, child2, child3, max_workers=2)
+
+        with self.assertRaises(LoadError) as cm:
+            config.load()
+
+        self.assertEqual([child1, child3], [c for c, _ in cm.exception.errors])
+        self.assertIsInstance(cm.exception.errors[0][1], MemoryError)
+        self.assertIsInstance(cm.exception.errors[1][1], ValueError)
+
+    def test_load_concurrently_with_timeout(self):
+        child1 = self._create_slow_config({'key': 1})
+        child2 = self._create_slow_config({'key': 2}, delay=5)
+
+        config = self._create_composite_config(child1, child2, max_workers=2, timeout=0.05)
+
+        try:
+            with self.assertRaises(LoadError) as cm:
+                config.load()
+        finally:
+            child2.release.set()
+
+        self.assertEqual([child2], [c for c, _ in cm.exception.errors])
+        self.assertIsInstance(cm.exception.errors[0][1], ConfigError)
+
+    @skip_without_async
+    def test_aload_concurrently(self):
+        started = [Event(), Event()]
+        overlapped = []
+
+        class Config(MemoryConfig):
+            def __init__(self, index, data):
+                super(Config, self).__init__(data=data)
+                self.index = index
+
+            def load(self):
+                # it only returns True if the other child is loading at the same time.
+                started[self.index].set()
+                overlapped.append(started[1 - self.index].wait(1))
+
+        config = self._create_composite_config(
+            Config(0, {'key': 1, 'key1': 1}),
+            Config(1, {'key': 2, 'key2': 2}))
+
+        run_async(config.aload())
+
+        self.assertEqual([True, True], overlapped)
+        self.assertEqual(2, config.get_value('key', int))
+        self.assertEqual(1, config.get_value('key1', int))
+        self.assertEqual(2, config.get_value('key2', int))
+
+    @skip_without_async
+    def test_aload_with_errors(self):
+        child1 = self._create_slow_config({'key': 1}, error=MemoryError())
+        child2 = self._create_slow_config({'key': 2})
+        child3 = self._create_slow_config({'key': 3}, error=ValueError())
+
+        config = self._create_composite_config(child1, child2, child3)
+
+        with self.assertRaises(LoadError) as cm:
+            run_async(config.aload())
+
+        self.assertEqual([child1, child3], [c for c, _ in cm.exception.errors])
+        self.assertIsInstance(cm.exception.errors[0][1], MemoryError)
+        self.assertIsInstance(cm.exception.errors[1][1], ValueError)
+
+    @skip_without_async
+    def test_aload_with_timeout(self):
+        child1 = self._create_slow_config({'key': 1})
+        child2 = self._create_slow_config({'key': 2}, delay=5)
+
+        config = self._create_composite_config(child1, child2, max_workers=2, timeout=0.05)
+
+        try:
+            with self.assertRaises(LoadError) as cm:
+                run_async(config.aload())
+        finally:
+            child2.release.set()
+
+        self.assertEqual([child2], [c for c, _ in cm.exception.errors])
+        self.assertIsInstance(cm.exception.errors[0][1], ConfigError)
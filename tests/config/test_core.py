@@ -4,17 +4,22 @@ import os
 import sys
 import time
 
+from central import abc
 from central.config import (
-    ChainConfig, CommandLineConfig, EnvironmentConfig, MemoryConfig,
-    MergeConfig, ModuleConfig, PrefixedConfig, ReloadConfig
+    ChainConfig, CommandLineConfig, DebounceConfig, EnvironmentConfig, LazyConfig,
+    MemoryConfig, MergeConfig, ModuleConfig, PrefixedConfig, ReloadConfig, SnapshotConfig
 )
 from central.config.core import BaseConfig
 from central.exceptions import ConfigError
+from central.mergers import DeepMerger, ListMerger, PersistentMerger
 from central.schedulers import FixedIntervalScheduler
 from central.structures import IgnoreCaseDict
-from threading import Event
+from central.utils import EventHandler
+from threading import Event, current_thread
 from unittest import TestCase
-from .mixins import BaseConfigMixin, BaseDataConfigMixin, NextMixin
+from .mixins import (
+    BaseConfigMixin, BaseDataConfigMixin, LoadConcurrentlyMixin, NextMixin, run_async, skip_without_async
+)
 
 
 class TestCommandLineConfig(TestCase, BaseDataConfigMixin):
@@ -139,6 +144,19 @@ class TestEnvironmentConfig(TestCase, BaseDataConfigMixin):
         os.environ.pop('key_int', None)
         os.environ.pop('key_interpolated', None)
 
+    def test_get_value_from_cache_after_loading(self):
+        os.environ['key_int'] = '1'
+
+        config = EnvironmentConfig()
+        config.load()
+
+        self.assertEqual(1, config.get_int('key_int'))
+
+        os.environ['key_int'] = '2'
+        config.load()
+
+        self.assertEqual(2, config.get_int('key_int'))
+
     def _create_base_config(self, load_data=False):
         config = EnvironmentConfig()
 
@@ -157,7 +175,7 @@ class TestEnvironmentConfig(TestCase, BaseDataConfigMixin):
         return config
 
 
-class TestChainConfig(TestCase, BaseConfigMixin):
+class TestChainConfig(TestCase, BaseConfigMixin, LoadConcurrentlyMixin):
     def test_configs_with_none_as_value(self):
         with self.assertRaises(TypeError):
             ChainConfig(None)
@@ -199,6 +217,247 @@ class TestChainConfig(TestCase, BaseConfigMixin):
 
         self.assertEqual(2, config.get_value('key', int))
 
+    def test_get_value_from_owner(self):
+        class Config(MemoryConfig):
+            def get_value(self, key, type, default=None):
+                calls.append(key)
+                return super(Config, self).get_value(key, type, default)
+
+        calls = []
+
+        config = ChainConfig(Config(data={'key1': 'value1'}), MemoryConfig(data={'key2': 'value2'}))
+
+        self.assertEqual('value1', config.get('key1'))
+        self.assertEqual('value2', config.get('key2'))
+        self.assertIsNone(config.get('not_found'))
+        self.assertEqual(['key1'], calls)
+
+    def test_get_value_after_child_updated(self):
+        child = MemoryConfig()
+
+        config = ChainConfig(child, MemoryConfig(data={'key': 'value'}))
+
+        self.assertEqual('value', config.get('key'))
+        self.assertIsNone(config.get('other_key'))
+
+        child.set('other_key', 'other value')
+
+        self.assertEqual('other value', config.get('other_key'))
+
+    def test_get_value_after_child_loaded_directly(self):
+        child = EnvironmentConfig()
+
+        config = ChainConfig(MemoryConfig(data={'key': 'value'}), child)
+        config.load()
+
+        self.assertIsNone(config.get('key_str'))
+
+        os.environ['key_str'] = 'value'
+
+        try:
+            child.load()
+        finally:
+            os.environ.pop('key_str')
+
+        self.assertEqual('value', config.get('key_str'))
+
+    def test_get_value_with_owners_kept_by_unrelated_data(self):
+        child = MemoryConfig(data={'key': 'value'})
+
+        config = ChainConfig(child, MemoryConfig())
+        config.get('key')
+
+        owners = config._owners_cached
+
+        MemoryConfig(data={'key': 'other value'}).set('key', 'new value')
+        config.get_many({'key': (str, None)})
+        child.snapshot()
+
+        self.assertEqual('value', config.get('key'))
+        self.assertIs(owners, config._owners_cached)
+
+        child.set('key', 'new value')
+
+        self.assertEqual('new value', config.get('key'))
+        self.assertIsNot(owners, config._owners_cached)
+
+    def test_get_value_with_child_not_base_config(self):
+        class Config(abc.Config):
+            def get_raw(self, key):
+                calls.append(key)
+                return data.get(key)
+
+            def get_value(self, key, type, default=None):
+                return data.get(key, default)
+
+            @property
+            def lookup(self):
+                return None
+
+            @lookup.setter
+            def lookup(self, value):
+                pass
+
+            @property
+            def updated(self):
+                return updated
+
+        calls = []
+        data = {}
+        updated = EventHandler()
+        config = ChainConfig(MemoryConfig(), Config())
+
+        self.assertIsNone(config.get('key'))
+        self.assertIsNone(config.get('key'))
+        self.assertEqual(['key'], calls)
+
+        data['key'] = 'value'
+        updated()
+
+        self.assertEqual('value', config.get('key'))
+
+    def test_updated_trigger_from_child_updated_directly(self):
+        class Config(MemoryConfig):
+            def load(self):
+                self._data = self._make_dict({'key': 'new value'})
+                self.updated()
+
+        child = Config(data={'key': 'value'})
+
+        config = ChainConfig(MemoryConfig(), child)
+
+        self.assertEqual('value', config.get('key'))
+
+        passed = []
+        config.updated.add(lambda: passed.append(True))
+
+        child.load()
+
+        self.assertEqual(1, len(passed))
+        self.assertEqual('new value', config.get('key'))
+
+    def test_compile_accessor_from_child_with_key_in_sibling(self):
+        child = MemoryConfig(data={'url': 'http://${host}'})
+        sibling = MemoryConfig(data={'host': 'h1'})
+
+        ChainConfig(child, sibling)
+
+        url = child.compile_accessor('url', str)
+
+        self.assertEqual('http://h1', url())
+
+        sibling.set('host', 'h2')
+
+        self.assertEqual('http://h2', url())
+
+        child.set('url', 'http://localhost')
+
+        self.assertEqual('http://localhost', url())
+
+    def test_keys_with_case_sensitive_children(self):
+        child1 = MemoryConfig(data={'Key': 1})
+        child1.ignore_case = False
+
+        child2 = MemoryConfig(data={'key': 2})
+        child2.ignore_case = False
+
+        config = ChainConfig(child1, LazyConfig(child2))
+
+        self.assertEqual({'Key', 'key'}, set(config.keys()))
+        self.assertEqual(2, len(config))
+
+    def test_keys_with_case_insensitive_children(self):
+        config = ChainConfig(MemoryConfig(data={'Key': 1}), MemoryConfig(data={'key': 2}))
+
+        self.assertEqual(1, len(config))
+
+    @skip_without_async
+    def test_aload_with_child_not_implementing_aload(self):
+        threads = []
+
+        class Config(abc.Config):
+            def load(self):
+                threads.append(current_thread())
+
+            @property
+            def lookup(self):
+                return None
+
+            @lookup.setter
+            def lookup(self, value):
+                pass
+
+            @property
+            def updated(self):
+                return EventHandler()
+
+        config = ChainConfig(MemoryConfig(), Config())
+
+        run_async(config.aload())
+
+        self.assertEqual(1, len(threads))
+        self.assertIsNot(current_thread(), threads[0])
+
+    def test_get_many_with_child_not_base_config(self):
+        class Config(abc.Config):
+            def get_raw(self, key):
+                return {'key2': '2'}.get(key)
+
+            def get_value(self, key, type, default=None):
+                value = self.get_raw(key)
+                return default if value is None else type(value)
+
+            @property
+            def lookup(self):
+                return None
+
+            @lookup.setter
+            def lookup(self, value):
+                pass
+
+            @property
+            def updated(self):
+                return EventHandler()
+
+        config = ChainConfig(MemoryConfig(data={'key1': '1', 'key2': '1'}), Config())
+
+        values = config.get_many({'key1': (int, None), 'key2': (int, None), 'key3': (int, 3)})
+
+        self.assertEqual({'key1': 1, 'key2': 2, 'key3': 3}, values)
+
+    def test_get_many_with_overridden_key(self):
+        config = ChainConfig(
+            MemoryConfig(data={'key1': '1', 'key2': '1'}),
+            MemoryConfig(data={'key2': '2'})
+        )
+
+        values = config.get_many({'key1': (int, None), 'key2': (int, None), 'key3': (int, 3)})
+
+        self.assertEqual({'key1': 1, 'key2': 2, 'key3': 3}, values)
+
+    def test_snapshot_after_child_set(self):
+        child = MemoryConfig(data={'key': 'value'})
+
+        config = ChainConfig(child, MemoryConfig(data={'key_interpolated': '${key}'}))
+
+        snapshot = config.snapshot()
+
+        child.set('key', 'new value')
+
+        self.assertEqual('value', snapshot.get('key_interpolated'))
+        self.assertEqual('new value', config.get('key_interpolated'))
+
+    def test_get_value_with_key_interpolated_from_other_child(self):
+        child = MemoryConfig(data={'key': 'value'})
+
+        config = ChainConfig(child, MemoryConfig(data={'key_interpolated': '${key}'}))
+
+        self.assertEqual('value', config.get_str('key_interpolated'))
+
+        child.set('key', 'new value')
+
+        self.assertEqual('new value', config.get_str('key_interpolated'))
+
     def test_load_with_configs(self):
         os.environ['key'] = 'value'
 
@@ -219,6 +478,22 @@ class TestChainConfig(TestCase, BaseConfigMixin):
 
         self.assertEqual(1, len(passed))
 
+    def test_changed_trigger(self):
+        child = MemoryConfig()
+
+        config = ChainConfig(MemoryConfig(), child)
+
+        changes = []
+        config.changed.add(changes.append)
+
+        child.set('key', {'nested': 'value'})
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual({'key', 'key.nested'}, changes[0].added)
+
+    def _create_composite_config(self, *configs, **kwargs):
+        return ChainConfig(*configs, **kwargs)
+
     def _create_base_config(self, load_data=False):
         if load_data:
             config = ChainConfig(
@@ -256,6 +531,14 @@ class TestModuleConfig(TestCase, BaseDataConfigMixin, NextMixin):
         config = ModuleConfig('config.json')
         self.assertEqual('config.json', config.name)
 
+    def test_init_merger_with_str_value(self):
+        with self.assertRaises(TypeError):
+            ModuleConfig('config.json', merger='non merger')
+
+    def test_get_merger_with_default_value(self):
+        config = ModuleConfig('config.json')
+        self.assertIsInstance(config.merger, DeepMerger)
+
     def test_load_with_module_not_found(self):
         config = ModuleConfig('not_found')
         with self.assertRaises(ImportError):
@@ -331,11 +614,35 @@ class TestMemoryConfig(TestCase, BaseDataConfigMixin):
         # the initial dict should be cloned by MemoryConfig
         self.assertEqual(data['key1'], 'value')
 
+    def test_init_data_with_nested_dict_value(self):
+        nested = {'Key': 'value'}
+        config = MemoryConfig({'parent': nested})
+
+        # the nested dict is only converted when it is accessed
+        self.assertIs(nested, config._data._values['parent'])
+
+        self.assertEqual('value', config.get('parent.key'))
+        self.assertIsInstance(config._data._values['parent'], IgnoreCaseDict)
+
     def test_load(self):
         # it should do nothing
         config = MemoryConfig()
         config.load()
 
+    @skip_without_async
+    def test_aload_in_executor(self):
+        threads = []
+
+        class Config(MemoryConfig):
+            def load(self):
+                threads.append(current_thread())
+
+        config = Config()
+        run_async(config.aload())
+
+        self.assertEqual(1, len(threads))
+        self.assertIsNot(current_thread(), threads[0])
+
     def test_set_with_key_as_none(self):
         config = MemoryConfig()
         with self.assertRaises(TypeError):
@@ -365,6 +672,125 @@ class TestMemoryConfig(TestCase, BaseDataConfigMixin):
         self.assertIsInstance(config.get('key'), IgnoreCaseDict)
         self.assertEqual(id(config.get('key')), id(data))
 
+    def test_snapshot_after_set(self):
+        config = MemoryConfig(data={'key': 'value', 'key_interpolated': '${key}'})
+
+        snapshot = config.snapshot()
+
+        config.set('key', 'new value')
+
+        self.assertEqual('value', snapshot.get('key'))
+        self.assertEqual('value', snapshot.get('key_interpolated'))
+        self.assertEqual('new value', config.get('key_interpolated'))
+        self.assertGreater(config.snapshot().version, snapshot.version)
+
+    def test_set_with_cached_value(self):
+        config = MemoryConfig(data={'key': {'item': '1'}})
+
+        self.assertEqual(1, config.get_int('key.item'))
+
+        config.set('key', {'item': '2'})
+
+        self.assertEqual(2, config.get_int('key.item'))
+
+    def test_set_with_indexed_keys(self):
+        config = MemoryConfig(data={'key': {'item': {'subitem': 'value'}}})
+        config.indexed = True
+
+        self.assertEqual('value', config.get('key.item.subitem'))
+
+        config.set('key', {'other': 'value'})
+
+        self.assertIsNone(config.get('key.item.subitem'))
+        self.assertEqual('value', config.get('key.other'))
+
+        config.set('key', 'value')
+
+        self.assertIsNone(config.get('key.other'))
+
+    def test_set_with_changes(self):
+        config = MemoryConfig(data={'key': {'nested1': 1, 'nested2': 2}})
+
+        changes = []
+        config.changed.add(changes.append)
+
+        config.set('key', {'nested1': 1, 'nested3': 3})
+        config.set('key', {'nested1': 1, 'nested3': 3})
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual({'key.nested3'}, changes[0].added)
+        self.assertEqual({'key.nested2'}, changes[0].removed)
+        self.assertEqual(frozenset(), changes[0].modified)
+
+    def test_set_with_compiled_accessor(self):
+        config = MemoryConfig(data={'db': {'host': 'localhost', 'port': '5432'}})
+
+        port = config.compile_accessor('db.port', int, 0)
+
+        self.assertEqual(5432, port())
+
+        config.set('db', {'host': 'localhost', 'port': '1234'})
+
+        self.assertEqual(1234, port())
+
+        config.set('db', {'host': 'remote'})
+
+        self.assertEqual(0, port())
+
+    def test_set_with_compiled_accessor_not_affected(self):
+        config = MemoryConfig(data={'key': 'value', 'other': 'value'})
+
+        accessor = config.compile_accessor('key', str)
+        accessor()
+
+        config._data['key'] = 'changed without event'
+        config.set('other', 'new value')
+
+        self.assertEqual('value', accessor())
+
+    def test_set_with_compiled_accessor_while_reading(self):
+        class Config(MemoryConfig):
+            def get_value(self, key, type, default=None):
+                value = super(Config, self).get_value(key, type, default)
+
+                if value == 'old value':
+                    self.set('key', 'new value')
+
+                return value
+
+        config = Config(data={'key': 'old value'})
+
+        accessor = config.compile_accessor('key', str)
+
+        self.assertEqual('old value', accessor())
+        self.assertEqual('new value', accessor())
+
+    def test_compile_accessor_with_unhashable_default(self):
+        config = MemoryConfig(data={'key': 'item1,item2'})
+
+        accessor = config.compile_accessor('key', list, [])
+
+        self.assertEqual(['item1', 'item2'], accessor())
+
+        config.compile_accessor('key', list, [])
+
+        self.assertEqual(0, len(config.changed))
+
+        config.set('key', 'item3')
+
+        self.assertEqual(['item3'], accessor())
+
+    def test_set_with_compiled_accessor_interpolated(self):
+        config = MemoryConfig(data={'url': 'http://${host}:${port}', 'host': 'localhost', 'port': 80})
+
+        url = config.compile_accessor('url', str)
+
+        self.assertEqual('http://localhost:80', url())
+
+        config.set('port', 8080)
+
+        self.assertEqual('http://localhost:8080', url())
+
     def test_trigger_updated_event_on_set_key(self):
         ev = Event()
 
@@ -396,7 +822,7 @@ class TestMemoryConfig(TestCase, BaseDataConfigMixin):
         return config
 
 
-class TestMergeConfig(TestCase, BaseDataConfigMixin):
+class TestMergeConfig(TestCase, BaseDataConfigMixin, LoadConcurrentlyMixin):
     def test_configs_with_none_as_value(self):
         with self.assertRaises(TypeError):
             MergeConfig(None)
@@ -459,6 +885,145 @@ class TestMergeConfig(TestCase, BaseDataConfigMixin):
 
         self.assertEqual(1, len(passed))
 
+    def test_changed_trigger(self):
+        child = MemoryConfig(data={'database': {'host': 'localhost', 'port': 1234}})
+
+        config = MergeConfig(MemoryConfig(data={'database': {'host': 'remote'}}), child)
+        config.load()
+
+        changes = []
+        config.changed.add(changes.append)
+
+        child.set('database', {'host': 'other', 'port': 5678})
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual(frozenset(), changes[0].added)
+        self.assertEqual({'database.host', 'database.port'}, changes[0].modified)
+
+    def test_changed_trigger_with_overridden_key(self):
+        child = MemoryConfig(data={'key': 1})
+
+        config = MergeConfig(child, MemoryConfig(data={'key': 2}))
+        config.load()
+
+        updated = []
+        config.on_updated(lambda: updated.append(True))
+
+        child.set('key', 3)
+
+        self.assertEqual([], updated)
+        self.assertEqual(2, config.get_value('key', int))
+
+    def test_get_value_after_child_updated(self):
+        child = MemoryConfig(data={'key': 1})
+
+        config = MergeConfig(MemoryConfig(data={'key': 0, 'other_key': 0}), child)
+        config.load()
+
+        child.set('key', 2)
+        self.assertEqual(2, config.get_value('key', int))
+
+        child.set('key', None)
+        self.assertEqual(0, config.get_value('key', int))
+
+        child.set('other_key', 1)
+        self.assertEqual(1, config.get_value('other_key', int))
+
+    def test_merge_nested_keys(self):
+        child1 = MemoryConfig(data={'database': {'host': 'localhost', 'port': 1234}})
+        child2 = MemoryConfig(data={'database': {'Port': 5678}})
+
+        config = MergeConfig(child1, child2)
+        config.load()
+
+        self.assertEqual('localhost', config.get_value('database.host', str))
+        self.assertEqual(5678, config.get_value('database.port', int))
+
+        # the children are not modified by the merge
+        self.assertEqual({'host': 'localhost', 'port': 1234}, child1.get_value('database', dict))
+        self.assertEqual({'Port': 5678}, child2.get_value('database', dict))
+
+    def test_share_keys_not_changed(self):
+        child1 = MemoryConfig(data={'key_dict': {'key': 'value'}, 'key_merged': {'key1': 1}})
+        child2 = MemoryConfig(data={'key_merged': {'key2': 2}})
+
+        config = MergeConfig(child1, child2)
+        config.load()
+
+        key_dict = config._data['key_dict']
+        key_merged = config._data['key_merged']
+
+        self.assertIs(child1._data['key_dict'], key_dict)
+
+        child2.set('key_str', 'value')
+
+        self.assertEqual('value', config.get_value('key_str', str))
+        self.assertIs(key_dict, config._data['key_dict'])
+        self.assertIs(key_merged, config._data['key_merged'])
+
+        child2.set('key_merged', {'key2': 3})
+
+        self.assertEqual(3, config.get_value('key_merged.key2', int))
+        self.assertIsNot(key_merged, config._data['key_merged'])
+        self.assertIs(key_dict, config._data['key_dict'])
+
+    def test_init_merger_with_str_value(self):
+        with self.assertRaises(TypeError):
+            MergeConfig(MemoryConfig(), merger='non merger')
+
+    def test_init_with_unexpected_keyword_argument(self):
+        with self.assertRaises(TypeError):
+            MergeConfig(MemoryConfig(), other=None)
+
+    def test_get_merger_with_default_value(self):
+        config = MergeConfig(MemoryConfig())
+        self.assertIsInstance(config.merger, PersistentMerger)
+
+    def test_load_with_merger(self):
+        config = MergeConfig(
+            MemoryConfig(data={'key': [1, 2], 'key_dict': {'key1': 1}}),
+            MemoryConfig(data={'key': [2, 3], 'key_dict': {'key2': 2}}),
+            merger=ListMerger(unique=True)
+        )
+        config.load()
+
+        self.assertEqual([1, 2, 3], config.get_value('key', list))
+        self.assertEqual(1, config.get_value('key_dict.key1', int))
+        self.assertEqual(2, config.get_value('key_dict.key2', int))
+
+    def test_load_with_merger_does_not_modify_children(self):
+        for merger in (DeepMerger(), ListMerger()):
+            child1 = MemoryConfig(data={'db': {'host': 'localhost'}, 'key': [1]})
+            child2 = MemoryConfig(data={'db': {'port': 1}, 'key': [2]})
+
+            config = MergeConfig(child1, child2, merger=merger)
+            config.load()
+
+            child2.set('other', 'value')
+            config.load()
+
+            self.assertEqual({'host': 'localhost'}, child1.get('db'))
+            self.assertEqual([1], child1.get('key'))
+            self.assertEqual({'port': 1}, child2.get('db'))
+            self.assertEqual([2], child2.get('key'))
+            self.assertEqual({'host': 'localhost', 'port': 1}, config.get('db'))
+
+    def test_child_updated_before_load(self):
+        child = MemoryConfig()
+
+        config = MergeConfig(child)
+
+        child.set('key', 'value')
+
+        self.assertIsNone(config.get('key'))
+
+        config.load()
+
+        self.assertEqual('value', config.get('key'))
+
+    def _create_composite_config(self, *configs, **kwargs):
+        return MergeConfig(*configs, **kwargs)
+
     def _create_base_config(self, load_data=False):
         if load_data:
             config = MergeConfig(
@@ -519,6 +1084,71 @@ class TestReloadConfig(TestCase, BaseConfigMixin):
 
         self.assertEqual('value', config['key_str'])
 
+    def test_reload_with_child_not_base_config(self):
+        class Config(abc.Config):
+            def load(self):
+                loads.append(True)
+
+            def get_raw(self, key):
+                return len(loads)
+
+            @property
+            def lookup(self):
+                return None
+
+            @lookup.setter
+            def lookup(self, value):
+                pass
+
+        loads = []
+        changes = []
+        updated = []
+
+        config = ReloadConfig(Config(), FixedIntervalScheduler(12345))
+        config.changed.add(changes.append)
+        config.on_updated(lambda: updated.append(True))
+
+        config._reload()
+
+        self.assertEqual([True], loads)
+        self.assertEqual([True], updated)
+        self.assertTrue(changes[0].unknown)
+
+    def test_reload_with_compiled_accessor(self):
+        class Config(MemoryConfig):
+            def load(self):
+                self._data = self._make_dict({'key': values.pop(0)})
+
+        values = ['1', '2']
+
+        config = Config().reload_every(12345)
+        config.load()
+
+        accessor = config.compile_accessor('key', int)
+
+        self.assertEqual(1, accessor())
+
+        config._reload()
+
+        self.assertEqual(2, accessor())
+
+    @skip_without_async
+    def test_aload_starts_scheduler(self):
+        config = EnvironmentConfig().reload_every(0.005)
+        run_async(config.aload())
+
+        with self.assertRaises(KeyError):
+            config['key_aload']
+
+        os.environ['key_aload'] = 'value'
+
+        try:
+            time.sleep(0.02)
+
+            self.assertEqual('value', config['key_aload'])
+        finally:
+            del os.environ['key_aload']
+
     def test_reload_with_load_error(self):
         ev = Event()
 
@@ -536,7 +1166,11 @@ class TestReloadConfig(TestCase, BaseConfigMixin):
         self.assertTrue(ev.is_set())
 
     def test_reload_with_updated_error(self):
-        config = MemoryConfig().reload_every(0.005)
+        class Config(MemoryConfig):
+            def load(self):
+                self._data = self._make_dict({'key': time.time()})
+
+        config = Config().reload_every(0.005)
 
         ev = Event()
 
@@ -551,6 +1185,53 @@ class TestReloadConfig(TestCase, BaseConfigMixin):
 
         self.assertTrue(ev.is_set())
 
+    def test_reload_with_changes(self):
+        class Config(MemoryConfig):
+            def load(self):
+                self._data = self._make_dict(data)
+
+        data = {'key': 'value', 'database': {'host': 'localhost'}}
+        changes = []
+
+        config = Config().reload_every(0.005)
+        config.changed.add(changes.append)
+        config.load()
+
+        time.sleep(0.02)
+
+        self.assertEqual([], changes)
+
+        data = {'key': 'value', 'database': {'host': 'remote', 'port': 5432}}
+
+        time.sleep(0.02)
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual({'database.port'}, changes[0].added)
+        self.assertEqual({'database.host'}, changes[0].modified)
+
+    def test_reload_with_lazy_config_not_loaded(self):
+        child = LazyConfig(MemoryConfig(data={'key': 'value'}))
+
+        config = child.reload_every(0.005)
+        config.load()
+
+        time.sleep(0.02)
+
+        self.assertFalse(child.loaded)
+        self.assertEqual('value', config.get('key'))
+        self.assertTrue(child.loaded)
+
+    def test_reload_without_changes(self):
+        updated = []
+
+        config = MemoryConfig(data={'key': 'value'}).reload_every(0.005)
+        config.on_updated(lambda: updated.append(True))
+        config.load()
+
+        time.sleep(0.02)
+
+        self.assertEqual([], updated)
+
     def _create_base_config(self, load_data=False):
         config = MemoryConfig()
 
@@ -569,6 +1250,338 @@ class TestReloadConfig(TestCase, BaseConfigMixin):
         return config.reload_every(12345)
 
 
+class TestLazyConfig(TestCase, BaseConfigMixin):
+    def test_init_config_with_none_value(self):
+        with self.assertRaises(TypeError):
+            LazyConfig(config=None)
+
+    def test_init_config_with_str_value(self):
+        with self.assertRaises(TypeError):
+            LazyConfig(config='non config')
+
+    def test_init_config_with_config_value(self):
+        child = MemoryConfig()
+        config = LazyConfig(child)
+        self.assertEqual(child, config.config)
+
+    def test_child_lookup(self):
+        child = MemoryConfig()
+        config = LazyConfig(child)
+        self.assertEqual(config.lookup, child.lookup)
+
+    def test_load_on_first_access(self):
+        child = self._create_counter_config()
+
+        config = LazyConfig(child)
+        config.load()
+
+        self.assertFalse(config.loaded)
+        self.assertEqual(0, child.loads)
+
+        self.assertEqual('value', config.get('key'))
+        self.assertEqual('value', config.get('key'))
+
+        self.assertTrue(config.loaded)
+        self.assertEqual(1, child.loads)
+
+    def test_load_on_iteration(self):
+        for func in (list, len, lambda c: c.get_many({'key': (str, None)}), lambda c: c.snapshot().get('key')):
+            child = self._create_counter_config()
+
+            func(LazyConfig(child))
+
+            self.assertEqual(1, child.loads)
+
+    def test_load_after_first_access(self):
+        child = self._create_counter_config()
+
+        config = LazyConfig(child)
+        config.get('key')
+        config.load()
+
+        self.assertEqual(2, child.loads)
+
+    def test_load_once_from_multiple_threads(self):
+        from threading import Thread
+
+        ev = Event()
+
+        class Config(MemoryConfig):
+            loads = 0
+
+            def load(self):
+                ev.wait(1)
+                self.loads += 1
+
+        child = Config()
+        config = LazyConfig(child)
+
+        threads = [Thread(target=config.get, args=('key',)) for _ in range(5)]
+
+        for thread in threads:
+            thread.start()
+
+        ev.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, child.loads)
+
+    def test_load_with_lookup_while_loading(self):
+        class Config(MemoryConfig):
+            def load(self):
+                self.set('key', 'value')
+                self.set('other_key', self.lookup.lookup('key'))
+
+        config = LazyConfig(Config())
+
+        self.assertEqual('value', config.get('other_key'))
+
+    def test_load_again_after_load_error(self):
+        class Config(MemoryConfig):
+            loads = 0
+
+            def load(self):
+                self.loads += 1
+
+                if self.loads == 1:
+                    raise MemoryError()
+
+        child = Config()
+        config = LazyConfig(child)
+
+        with self.assertRaises(MemoryError):
+            config.get('key')
+
+        self.assertFalse(config.loaded)
+
+        config.get('key')
+
+        self.assertTrue(config.loaded)
+        self.assertEqual(2, child.loads)
+
+    def test_updated_trigger(self):
+        child = MemoryConfig()
+
+        config = LazyConfig(child)
+
+        passed = []
+        config.updated.add(lambda: passed.append(True))
+
+        child.set('key', 'value')
+
+        self.assertEqual(1, len(passed))
+
+    def test_load_chain_layers_on_demand(self):
+        child1 = LazyConfig(self._create_counter_config(data={'key': 1, 'other_key': 1}))
+        child2 = LazyConfig(self._create_counter_config(data={'key': 2}))
+
+        config = ChainConfig(child1, child2)
+        config.load()
+
+        self.assertEqual(2, config.get_value('key', int))
+        self.assertFalse(child1.loaded)
+        self.assertTrue(child2.loaded)
+
+        self.assertEqual(1, config.get_value('other_key', int))
+        self.assertTrue(child1.loaded)
+
+    def test_get_many_loads_chain_layers_on_demand(self):
+        child1 = LazyConfig(self._create_counter_config(data={'key': 1, 'other_key': 1}))
+        child2 = LazyConfig(self._create_counter_config(data={'key': 2}))
+
+        config = ChainConfig(child1, child2)
+        config.load()
+
+        self.assertEqual({'key': 2}, config.get_many({'key': (int, None)}))
+        self.assertFalse(child1.loaded)
+        self.assertTrue(child2.loaded)
+
+        self.assertEqual({'key': 2, 'other_key': 1}, config.get_many({'key': (int, None), 'other_key': (int, None)}))
+        self.assertTrue(child1.loaded)
+
+    def test_snapshot_before_first_access(self):
+        child = self._create_counter_config()
+
+        config = LazyConfig(child)
+
+        snapshot = config.snapshot()
+
+        self.assertFalse(config.loaded)
+
+        child.set('key', 'new value')
+
+        self.assertEqual('new value', snapshot.get('key'))
+        self.assertTrue(config.loaded)
+        self.assertEqual(1, child.loads)
+
+        child.set('key', 'other value')
+
+        self.assertEqual('new value', snapshot.get('key'))
+        self.assertEqual(['key'], list(snapshot))
+
+    def _create_counter_config(self, data=None):
+        class Config(MemoryConfig):
+            loads = 0
+
+            def load(self):
+                self.loads += 1
+
+        return Config(data=data or {'key': 'value'})
+
+    def _create_base_config(self, load_data=False):
+        config = MemoryConfig()
+
+        if load_data:
+            config.set('key_str', 'value')
+            config.set('key_int', 1)
+            config.set('key_int_as_str', '1')
+            config.set('key_dict', {'key_str': 'value'})
+            config.set('key_dict_as_str', 'item_key=value')
+            config.set('key_list_as_str', 'item1,item2')
+            config.set('key_interpolated', '${key_str}')
+            config.set('key_ignore_case', 'value')
+            config.set('key_IGNORE_case', 'value1')
+            config.set('key_delimited', {'key_str': 'value'})
+
+        return config.lazy()
+
+
+class TestDebounceConfig(TestCase, BaseConfigMixin):
+    def test_init_config_with_str_value(self):
+        with self.assertRaises(TypeError):
+            DebounceConfig('non config', 1)
+
+    def test_init_config_with_config_value(self):
+        child = MemoryConfig()
+        config = DebounceConfig(child, 1, 2)
+
+        self.assertEqual(child, config.config)
+        self.assertEqual(1, config.window)
+        self.assertEqual(2, config.max_delay)
+
+    def test_init_window_with_str_value(self):
+        with self.assertRaises(TypeError):
+            DebounceConfig(MemoryConfig(), '1')
+
+    def test_init_window_with_negative_value(self):
+        with self.assertRaises(ValueError):
+            DebounceConfig(MemoryConfig(), -1)
+
+    def test_init_max_delay_with_str_value(self):
+        with self.assertRaises(TypeError):
+            DebounceConfig(MemoryConfig(), 1, '2')
+
+    def test_init_max_delay_less_than_window(self):
+        with self.assertRaises(ValueError):
+            DebounceConfig(MemoryConfig(), 1, 0.5)
+
+    def test_debounce(self):
+        config = MemoryConfig().debounce(1, 2)
+
+        self.assertEqual(DebounceConfig, type(config))
+        self.assertEqual(1, config.window)
+        self.assertEqual(2, config.max_delay)
+
+    def test_get_before_updated(self):
+        child = MemoryConfig()
+        config = child.debounce(10)
+
+        child.set('key', 'value')
+
+        self.assertEqual('value', config.get('key'))
+
+    def test_updated_coalesces_burst(self):
+        ev = Event()
+        changes = []
+
+        child = MemoryConfig(data={'key1': 1, 'key2': 2})
+        config = child.debounce(0.02)
+        config.changed.add(changes.append)
+        config.on_updated(ev.set)
+
+        child.set('key1', 10)
+        child.set('key2', 20)
+        child.set('key3', 30)
+        child.set('key1', 1)
+
+        self.assertTrue(ev.wait(5))
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual({'key3'}, changes[0].added)
+        self.assertEqual({'key1', 'key2'}, changes[0].modified)
+
+    def test_updated_without_net_changes(self):
+        changes = []
+
+        child = MemoryConfig()
+        config = child.debounce(10)
+        config.changed.add(changes.append)
+
+        child.set('key', 'value')
+        child.set('key', None)
+
+        config.flush()
+
+        self.assertEqual([], changes)
+
+    def test_updated_with_max_delay(self):
+        ev = Event()
+
+        child = MemoryConfig()
+        config = child.debounce(0.05, 0.1)
+        config.on_updated(ev.set)
+
+        started = time.time()
+
+        # the child keeps changing for longer than the max delay.
+        while not ev.is_set() and time.time() - started < 5:
+            child.set('key', time.time())
+            time.sleep(0.01)
+
+        self.assertTrue(ev.is_set())
+        self.assertLess(time.time() - started, 1)
+
+    def test_flush(self):
+        changes = []
+
+        child = MemoryConfig()
+        config = child.debounce(10)
+        config.changed.add(changes.append)
+
+        child.set('key1', 1)
+        child.set('key2', 2)
+
+        config.flush()
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual({'key1', 'key2'}, changes[0].added)
+
+        child.set('key3', 3)
+        config.flush()
+
+        self.assertEqual(2, len(changes))
+        self.assertEqual({'key3'}, changes[1].added)
+
+    def _create_base_config(self, load_data=False):
+        config = MemoryConfig()
+
+        if load_data:
+            config.set('key_str', 'value')
+            config.set('key_int', 1)
+            config.set('key_int_as_str', '1')
+            config.set('key_dict', {'key_str': 'value'})
+            config.set('key_dict_as_str', 'item_key=value')
+            config.set('key_list_as_str', 'item1,item2')
+            config.set('key_interpolated', '${key_str}')
+            config.set('key_ignore_case', 'value')
+            config.set('key_IGNORE_case', 'value1')
+            config.set('key_delimited', {'key_str': 'value'})
+
+        return config.debounce(0.01)
+
+
 class TestPrefixedConfig(TestCase, BaseConfigMixin):
     def test_init_prefix_with_none_value(self):
         with self.assertRaises(TypeError):
@@ -595,6 +1608,84 @@ class TestPrefixedConfig(TestCase, BaseConfigMixin):
         config = PrefixedConfig('prefix', config=child)
         self.assertEqual(child, config.config)
 
+    def test_prefixed_cached(self):
+        config = MemoryConfig()
+
+        prefixed = config.prefixed('prefix')
+
+        self.assertIs(prefixed, config.prefixed('prefix'))
+        self.assertIs(prefixed, config.prefixed('prefix.'))
+        self.assertIsNot(prefixed, config.prefixed('other'))
+
+    def test_prefixed_with_int_value(self):
+        with self.assertRaises(TypeError):
+            MemoryConfig().prefixed(123)
+
+    def test_prefixed_shared_lookup(self):
+        config = MemoryConfig(data={
+            'key': 'value',
+            'prefix': {'key_interpolated': '${key}'}
+        })
+
+        lookup = config.lookup
+
+        prefixed = config.prefixed('prefix')
+
+        self.assertIs(lookup, config.lookup)
+        self.assertIs(lookup, prefixed.lookup)
+        self.assertEqual('value', prefixed.get('key_interpolated'))
+        self.assertEqual('value', prefixed.snapshot().get('key_interpolated'))
+
+    def test_iter_with_similar_keys(self):
+        config = MemoryConfig(data={
+            'prefix': {'key1': 'value'},
+            'prefix.key2': 'value',
+            'prefix-key3': 'value',
+            'prefixed.key4': 'value',
+            'other.key5': 'value',
+        })
+
+        prefixed = config.prefixed('prefix')
+
+        self.assertEqual({'key1', 'key2'}, set(prefixed))
+        self.assertEqual(2, len(prefixed))
+
+    def test_iter_with_chain_config(self):
+        config = ChainConfig(
+            MemoryConfig(data={'prefix': {'key1': 'value'}, 'other': 'value'}),
+            MemoryConfig(data={'prefix.key2': 'value'}),
+            MemoryConfig(data={'key3': 'value'}).prefixed('other')
+        )
+
+        prefixed = config.prefixed('prefix')
+
+        self.assertEqual({'key1', 'key2'}, set(prefixed))
+        self.assertEqual(2, len(prefixed))
+
+    def test_iter_after_set(self):
+        config = MemoryConfig(data={'prefix.key1': 'value'})
+
+        prefixed = config.prefixed('prefix')
+
+        self.assertEqual({'key1'}, set(prefixed))
+
+        config.set('prefix.key2', 'value')
+
+        self.assertEqual({'key1', 'key2'}, set(prefixed))
+
+    def test_compile_accessor_from_config(self):
+        child = MemoryConfig(data={'database': {'port': '5432'}})
+        config = PrefixedConfig('database', child)
+
+        port = config.compile_accessor('port', int)
+
+        self.assertIs(child.compile_accessor('database.port', int), port)
+        self.assertEqual(5432, port())
+
+        child.set('database', {'port': 1234})
+
+        self.assertEqual(1234, port())
+
     def _create_base_config(self, load_data=False):
         config = MemoryConfig()
 
@@ -613,9 +1704,29 @@ class TestPrefixedConfig(TestCase, BaseConfigMixin):
             })
             config.set('prefix.nested_delimited', 'value')
 
-        prefixed = config.prefixed('prefix')
+        prefixed = PrefixedConfig('prefix', config)
 
         if load_data:
             prefixed.load()
 
         return prefixed
+
+
+class TestSnapshotConfig(TestCase):
+    def test_init_config_with_none_value(self):
+        with self.assertRaises(TypeError):
+            SnapshotConfig(config=None)
+
+    def test_init_config_with_chain_config_value(self):
+        with self.assertRaises(TypeError):
+            SnapshotConfig(config=ChainConfig())
+
+    def test_load(self):
+        config = MemoryConfig(data={'key': 'value'})
+        snapshot = config.snapshot()
+        snapshot.load()
+        self.assertEqual('value', snapshot.get('key'))
+
+    def test_snapshot(self):
+        snapshot = MemoryConfig().snapshot()
+        self.assertIs(snapshot, snapshot.snapshot())
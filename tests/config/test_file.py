@@ -4,6 +4,7 @@ from central import abc
 from central.compat import FileNotFoundError
 from central.config.file import FileConfig
 from central.exceptions import ConfigError
+from central.mergers import DeepMerger, ReplaceMerger
 from central.readers import JsonReader
 from io import BytesIO
 from unittest import TestCase
@@ -36,6 +37,38 @@ class TestFileConfig(TestCase, BaseDataConfigMixin, NextMixin):
         config = FileConfig('config.json', reader=reader)
         self.assertEqual(reader, config.reader)
 
+    def test_get_merger_with_default_value(self):
+        config = FileConfig('config.json')
+        self.assertIsInstance(config.merger, DeepMerger)
+
+    def test_init_merger_with_str_value(self):
+        with self.assertRaises(TypeError):
+            FileConfig('config.json', merger='non merger')
+
+    def test_load_with_merger(self):
+        class Merger(ReplaceMerger):
+            def merge(self, base, *data):
+                merged.append(len(data))
+                return super(Merger, self).merge(base, *data)
+
+        merged = []
+
+        config = self._create_base_config()
+        config._merger = Merger()
+        config.load()
+
+        self.assertEqual([1], merged)
+        self.assertEqual('value overridden', config.get('key_overridden'))
+
+    def test_load_with_compiled_accessor(self):
+        config = self._create_base_config()
+
+        accessor = config.compile_accessor('key_str', str)
+
+        config.load()
+
+        self.assertEqual('value', accessor())
+
     def test_load_with_unknown_file_extension(self):
         class Config(FileConfig):
             def _find_file(self, filename):
@@ -110,6 +143,38 @@ class TestFileConfig(TestCase, BaseDataConfigMixin, NextMixin):
         with self.assertRaises(ConfigError):
             config.load()
 
+    def test_load_case_sensitive_with_reader_case_sensitive(self):
+        class Config(FileConfig):
+            def _find_file(self, filename):
+                return filename
+
+            def _open_file(self, filename):
+                stream = BytesIO()
+                stream.write(b'''{"Key": {"Nested": "value"}}''')
+                stream.seek(0, 0)
+                return stream
+
+        class Reader(abc.Reader):
+            def read(self, stream):
+                import json
+                return json.load(stream)
+
+        config = Config('config.json', reader=Reader())
+        config.ignore_case = False
+        config.load()
+
+        self.assertEqual('value', config.get('Key.Nested'))
+        self.assertIsNone(config.get('key.nested'))
+
+    def test_load_case_sensitive_with_default_reader(self):
+        config = self._create_base_config()
+        config.ignore_case = False
+        config.load()
+
+        self.assertIs(dict, type(config._data))
+        self.assertEqual('value', config.get('key_str'))
+        self.assertIsNone(config.get('KEY_str'))
+
     def _create_base_config(self, load_data=False):
         class Config(FileConfig):
             def _find_file(self, filename):
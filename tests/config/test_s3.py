@@ -3,6 +3,7 @@ from __future__ import absolute_import
 from central import abc
 from central.config.s3 import S3Config
 from central.exceptions import ConfigError, LibraryRequiredError
+from central.mergers import ReplaceMerger
 from central.readers import JsonReader
 from io import BytesIO
 from unittest import TestCase
@@ -66,6 +67,15 @@ class TestS3Config(TestCase, BaseDataConfigMixin, NextMixin):
         config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json', reader=reader)
         self.assertEqual(reader, config.reader)
 
+    def test_init_merger_with_str_value(self):
+        with self.assertRaises(TypeError):
+            S3Config(client=self.s3, bucket_name='bucket name', filename='config.json', merger='non merger')
+
+    def test_init_merger_with_merger_value(self):
+        merger = ReplaceMerger()
+        config = S3Config(client=self.s3, bucket_name='bucket name', filename='config.json', merger=merger)
+        self.assertEqual(merger, config.merger)
+
     def test_load_with_unknown_file_extension(self):
         class Config(S3Config):
             def _open_file(self, filename):
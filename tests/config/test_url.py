@@ -3,10 +3,12 @@ from __future__ import absolute_import
 from central.config.url import UrlConfig
 from central import abc
 from central.exceptions import ConfigError
+from central.mergers import ReplaceMerger
 from central.readers import JsonReader
 from io import BytesIO
+from threading import current_thread
 from unittest import TestCase
-from .mixins import BaseDataConfigMixin, NextMixin
+from .mixins import BaseDataConfigMixin, NextMixin, run_async, skip_without_async
 
 
 class TestUrlConfig(TestCase, BaseDataConfigMixin, NextMixin):
@@ -35,6 +37,15 @@ class TestUrlConfig(TestCase, BaseDataConfigMixin, NextMixin):
         config = UrlConfig('http://config.json', reader=reader)
         self.assertEqual(reader, config.reader)
 
+    def test_init_merger_with_str_as_value(self):
+        with self.assertRaises(TypeError):
+            UrlConfig('http://config.json', merger='non merger')
+
+    def test_init_merger_with_merger_value(self):
+        merger = ReplaceMerger()
+        config = UrlConfig('http://config.json', merger=merger)
+        self.assertEqual(merger, config.merger)
+
     def test_load_with_url_extension(self):
         class Config(UrlConfig):
             def _open_url(self, url):
@@ -207,6 +218,100 @@ class TestUrlConfig(TestCase, BaseDataConfigMixin, NextMixin):
         config.load()
         self.assertIsNotNone(config['time'])
 
+    @skip_without_async
+    def test_aload_from_local_server(self):
+        responses = {}
+        server = self._start_local_server(responses)
+        url = 'http://127.0.0.1:%s' % server.server_port
+
+        responses['/config.json'] = (
+            '{"key": "value", "key_overridden": "value", "@next": "%s/next.json"}' % url).encode('utf-8')
+        responses['/next.json'] = b'{"key_new": "new value", "key_overridden": "value overridden"}'
+
+        try:
+            config = UrlConfig(url + '/config.json')
+            run_async(config.aload())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual('value', config.get('key'))
+        self.assertEqual('new value', config.get('key_new'))
+        self.assertEqual('value overridden', config.get('key_overridden'))
+        self.assertIsNone(config.get('@next'))
+
+    @skip_without_async
+    def test_aload_from_local_server_not_found(self):
+        server = self._start_local_server({})
+
+        try:
+            config = UrlConfig('http://127.0.0.1:%s/config.json' % server.server_port)
+
+            with self.assertRaises(Exception):
+                run_async(config.aload())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @skip_without_async
+    def test_aload_without_aiohttp(self):
+        from central.config import aio
+
+        threads = []
+
+        config = self._create_base_config()
+        read_url = config._read_url
+
+        def record_thread(*args):
+            threads.append(current_thread())
+            return read_url(*args)
+
+        config._read_url = record_thread
+
+        aiohttp = aio.aiohttp
+        aio.aiohttp = None
+
+        try:
+            run_async(config.aload())
+        finally:
+            aio.aiohttp = aiohttp
+
+        # the responses are read in the executor rather than by the event loop thread.
+        self.assertEqual(2, len(threads))
+        self.assertNotIn(current_thread(), threads)
+
+        self.assertEqual('value', config.get('key_str'))
+        self.assertEqual('value overridden', config.get('key_overridden'))
+
+    def _start_local_server(self, responses):
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from threading import Thread
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = responses.get(self.path)
+
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+
+        thread = Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        return server
+
     def _create_base_config(self, load_data=False):
         class Config(UrlConfig):
             def _open_url(self, url):
@@ -0,0 +1,193 @@
+from __future__ import absolute_import
+
+import sys
+
+from central import abc
+from central.binding import Binding
+from central.config import MemoryConfig
+from central.exceptions import DecoderError
+from central.utils import EventHandler
+from unittest import TestCase, skipIf
+
+
+skip_without_typing = skipIf(sys.version_info < (3, 5), 'typing requires Python 3.5+')
+
+
+class Database(object):
+    __annotations__ = {'host': str, 'port': int}
+
+    host = 'localhost'
+    port = 5432
+
+
+class Settings(object):
+    __annotations__ = {'debug': bool, 'name': str, 'database': Database}
+
+    debug = False
+
+
+class ExtendedSettings(Settings):
+    __annotations__ = {'timeout': int}
+
+    timeout = 10
+
+
+class ForwardSettings(object):
+    # annotations written as str, like `from __future__ import annotations` does.
+    __annotations__ = {'key': 'int', 'database': 'Database'}
+
+
+class TestBinding(TestCase):
+    def test_init_config_with_none_value(self):
+        with self.assertRaises(TypeError):
+            Binding(None, Settings)
+
+    def test_init_schema_with_none_value(self):
+        with self.assertRaises(TypeError):
+            Binding(MemoryConfig(), None)
+
+    @skip_without_typing
+    def test_init_schema_with_str_annotation(self):
+        config = MemoryConfig(data={'key': '1', 'database': {'port': '1234'}})
+
+        binding = Binding(config, ForwardSettings)
+
+        self.assertEqual(1, binding.value.key)
+        self.assertEqual(1234, binding.value.database.port)
+
+    @skip_without_typing
+    def test_init_schema_with_unresolved_str_annotation(self):
+        class Schema(object):
+            __annotations__ = {'key': 'NotFound'}
+
+        with self.assertRaises(TypeError):
+            Binding(MemoryConfig(), Schema)
+
+    def test_schema(self):
+        binding = Binding(MemoryConfig(), Settings)
+        self.assertEqual(Settings, binding.schema)
+
+    def test_value_with_default_values(self):
+        binding = Binding(MemoryConfig(), Settings)
+
+        self.assertEqual(False, binding.value.debug)
+        self.assertIsNone(binding.value.name)
+        self.assertEqual('localhost', binding.value.database.host)
+        self.assertEqual(5432, binding.value.database.port)
+
+    def test_value_with_decoded_values(self):
+        config = MemoryConfig(data={'debug': '1', 'name': 'app', 'database': {'host': 'db', 'port': '1234'}})
+
+        binding = Binding(config, Settings)
+
+        self.assertEqual(True, binding.value.debug)
+        self.assertEqual('app', binding.value.name)
+        self.assertEqual('db', binding.value.database.host)
+        self.assertEqual(1234, binding.value.database.port)
+
+    def test_value_with_config_not_implementing_get_many(self):
+        class Config(abc.Config):
+            def get_value(self, key, type, default=None):
+                return {'name': 'app'}.get(key, default)
+
+            @property
+            def updated(self):
+                return EventHandler()
+
+        binding = Binding(Config(), Settings)
+
+        self.assertEqual('app', binding.value.name)
+        self.assertEqual(5432, binding.value.database.port)
+
+    def test_value_with_inherited_schema(self):
+        config = MemoryConfig(data={'timeout': '20'})
+
+        binding = Binding(config, ExtendedSettings)
+
+        self.assertEqual(20, binding.value.timeout)
+        self.assertEqual(False, binding.value.debug)
+
+    def test_value_has_slots(self):
+        binding = Binding(MemoryConfig(), Settings)
+
+        self.assertFalse(hasattr(binding.value, '__dict__'))
+        self.assertEqual('Settings', type(binding.value).__name__)
+
+    def test_value_is_read_only(self):
+        binding = Binding(MemoryConfig(), Settings)
+
+        with self.assertRaises(AttributeError):
+            binding.value.debug = True
+
+        with self.assertRaises(AttributeError):
+            del binding.value.debug
+
+    def test_value_repr(self):
+        binding = Binding(MemoryConfig(), Database)
+        self.assertIn("host='localhost'", repr(binding.value))
+
+    def test_same_class_for_same_schema(self):
+        value1 = Binding(MemoryConfig(), Settings).value
+        value2 = Binding(MemoryConfig(), Settings).value
+
+        self.assertIs(type(value1), type(value2))
+
+    def test_value_after_config_updated(self):
+        config = MemoryConfig()
+
+        binding = Binding(config, Settings)
+        value = binding.value
+
+        config.set('database', {'port': '1000'})
+
+        self.assertIsNot(value, binding.value)
+        self.assertEqual(5432, value.database.port)
+        self.assertEqual(1000, binding.value.database.port)
+
+    def test_updated_event(self):
+        config = MemoryConfig()
+
+        binding = Binding(config, Settings)
+
+        values = []
+
+        @binding.on_updated
+        def updated(value):
+            values.append(value)
+
+        config.set('name', 'app')
+
+        self.assertEqual(1, len(values))
+        self.assertIs(binding.value, values[0])
+        self.assertEqual('app', values[0].name)
+
+    def test_value_with_invalid_value(self):
+        config = MemoryConfig(data={'database': {'port': 'abc'}})
+
+        binding = Binding(config, Settings)
+
+        with self.assertRaises(DecoderError):
+            binding.value
+
+    def test_value_after_config_loaded(self):
+        class Config(MemoryConfig):
+            def load(self):
+                self._data = self._make_dict({'name': 'app'})
+
+        config = Config()
+
+        binding = Binding(config, Settings)
+
+        config.load()
+
+        self.assertEqual('app', binding.value.name)
+
+    def test_keep_value_with_invalid_value(self):
+        config = MemoryConfig()
+
+        binding = Binding(config, Settings)
+        value = binding.value
+
+        config.set('database', {'port': 'abc'})
+
+        self.assertIs(value, binding.value)
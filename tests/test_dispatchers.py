@@ -0,0 +1,174 @@
+from __future__ import absolute_import
+
+from central.dispatchers import ThreadPoolDispatcher
+from central.exceptions import DispatcherError
+from threading import Event, Lock, Thread
+from unittest import TestCase
+
+
+class TestThreadPoolDispatcher(TestCase):
+    def test_default_max_workers(self):
+        dispatcher = ThreadPoolDispatcher()
+        self.assertEqual(1, dispatcher.max_workers)
+        self.assertIsNone(dispatcher.max_queue_size)
+
+    def test_init_max_workers_with_str_value(self):
+        with self.assertRaises(TypeError):
+            ThreadPoolDispatcher(max_workers='1')
+
+    def test_init_max_workers_equal_to_zero(self):
+        with self.assertRaises(ValueError):
+            ThreadPoolDispatcher(max_workers=0)
+
+    def test_init_max_queue_size_with_str_value(self):
+        with self.assertRaises(TypeError):
+            ThreadPoolDispatcher(max_queue_size='1')
+
+    def test_init_max_queue_size_equal_to_zero(self):
+        with self.assertRaises(ValueError):
+            ThreadPoolDispatcher(max_queue_size=0)
+
+    def test_dispatch_with_non_callable_as_func(self):
+        dispatcher = ThreadPoolDispatcher()
+        with self.assertRaises(TypeError):
+            dispatcher.dispatch('non callable')
+
+    def test_dispatch_with_closed_dispatcher(self):
+        dispatcher = ThreadPoolDispatcher()
+        dispatcher.close()
+
+        with self.assertRaises(DispatcherError):
+            dispatcher.dispatch(lambda: None)
+
+    def test_dispatch(self):
+        ev = Event()
+
+        dispatcher = ThreadPoolDispatcher()
+        dispatcher.dispatch(ev.set)
+
+        self.assertTrue(ev.wait(5))
+
+    def test_dispatch_keeps_order_per_func(self):
+        def func(value):
+            calls.append(value)
+
+        calls = []
+        dispatcher = ThreadPoolDispatcher(max_workers=4)
+
+        for i in range(100):
+            dispatcher.dispatch(func, i)
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual(list(range(100)), calls)
+
+    def test_dispatch_with_slow_func(self):
+        slow = Event()
+        fast = Event()
+
+        dispatcher = ThreadPoolDispatcher(max_workers=2)
+        dispatcher.dispatch(slow.wait)
+        dispatcher.dispatch(fast.set)
+
+        # the fast func is not delayed by the slow one.
+        self.assertTrue(fast.wait(5))
+
+        slow.set()
+
+        self.assertTrue(dispatcher.wait(5))
+
+    def test_dispatch_with_full_queue(self):
+        release = Event()
+        lock = Lock()
+        dispatched = []
+
+        dispatcher = ThreadPoolDispatcher(max_queue_size=2)
+        dispatcher.dispatch(release.wait)
+        dispatcher.dispatch(release.wait)
+
+        def dispatch():
+            dispatcher.dispatch(lambda: None)
+            with lock:
+                dispatched.append(True)
+
+        thread = Thread(target=dispatch)
+        thread.daemon = True
+        thread.start()
+        thread.join(0.05)
+
+        # blocked until a call completes.
+        self.assertEqual([], dispatched)
+
+        release.set()
+        thread.join(5)
+
+        self.assertEqual([True], dispatched)
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual(2, dispatcher.max_queue_size_reached)
+
+    def test_dispatch_from_dispatched_func_with_full_queue(self):
+        calls = []
+
+        def func(value):
+            calls.append(value)
+
+            if value < 3:
+                dispatcher.dispatch(func, value + 1)
+
+        dispatcher = ThreadPoolDispatcher(max_workers=1, max_queue_size=1)
+        dispatcher.dispatch(func, 1)
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual([1, 2, 3], calls)
+
+    def test_dispatch_with_error(self):
+        def func():
+            raise Exception()
+
+        dispatcher = ThreadPoolDispatcher()
+        dispatcher.dispatch(func)
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual(1, dispatcher.calls)
+
+    def test_wait_with_timeout(self):
+        ev = Event()
+
+        dispatcher = ThreadPoolDispatcher()
+        dispatcher.dispatch(ev.wait)
+
+        self.assertFalse(dispatcher.wait(0.01))
+        self.assertEqual(1, dispatcher.queue_size)
+
+        ev.set()
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual(0, dispatcher.queue_size)
+
+    def test_metrics(self):
+        ev = Event()
+
+        dispatcher = ThreadPoolDispatcher()
+
+        self.assertEqual(0, dispatcher.calls)
+        self.assertEqual(0, dispatcher.total_latency)
+        self.assertEqual(0, dispatcher.max_latency)
+
+        dispatcher.dispatch(ev.wait, 0.01)
+        dispatcher.dispatch(ev.wait, 0.01)
+
+        self.assertTrue(dispatcher.wait(5))
+
+        self.assertEqual(2, dispatcher.calls)
+        self.assertEqual(2, dispatcher.max_queue_size_reached)
+        self.assertGreaterEqual(dispatcher.max_latency, 0.02)
+        self.assertGreaterEqual(dispatcher.total_latency, 0.03)
+
+    def test_close_completes_dispatched(self):
+        calls = []
+
+        dispatcher = ThreadPoolDispatcher()
+        dispatcher.dispatch(calls.append, 1)
+        dispatcher.close()
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual([1], calls)
@@ -0,0 +1,128 @@
+from __future__ import absolute_import
+
+from central.mergers import DeepMerger, ListMerger, PersistentMerger, ReplaceMerger
+from central.structures import IgnoreCaseDict
+from unittest import TestCase
+
+
+class MergerMixin(object):
+    def test_merge_with_str_as_base(self):
+        with self.assertRaises(TypeError):
+            self.merger.merge('str', {})
+
+    def test_merge_with_str_as_data(self):
+        with self.assertRaises(TypeError):
+            self.merger.merge({}, 'str')
+
+    def test_merge_without_data(self):
+        base = {'key': 'value'}
+        self.assertEqual({'key': 'value'}, self.merger.merge(base))
+
+    def test_merge_top_level_keys(self):
+        data = self.merger.merge({'key1': 1, 'key2': 2}, {'key2': 3}, {'key3': 4})
+        self.assertEqual({'key1': 1, 'key2': 3, 'key3': 4}, data)
+
+    def test_merge_ignore_case_dicts(self):
+        data = self.merger.merge(IgnoreCaseDict(Key=1), IgnoreCaseDict(KEY=2))
+
+        self.assertIsInstance(data, IgnoreCaseDict)
+        self.assertEqual(2, data['key'])
+        self.assertEqual(1, len(data))
+
+
+class TestDeepMerger(TestCase, MergerMixin):
+    def setUp(self):
+        self.merger = DeepMerger()
+
+    def test_merge_nested_keys(self):
+        base = {'database': {'host': 'localhost', 'port': 1234}, 'key': 'value'}
+
+        data = self.merger.merge(base, {'database': {'port': 5678}}, {'key': {'nested': 'value'}})
+
+        self.assertIs(base, data)
+        self.assertEqual({'database': {'host': 'localhost', 'port': 5678}, 'key': {'nested': 'value'}}, data)
+
+    def test_merge_lists(self):
+        data = self.merger.merge({'key': [1, 2]}, {'key': [3]})
+        self.assertEqual({'key': [3]}, data)
+
+    def test_merge_none_value(self):
+        data = self.merger.merge({'key': {'nested': 'value'}}, {'key': None})
+        self.assertEqual({'key': None}, data)
+
+
+class TestListMerger(TestCase, MergerMixin):
+    def setUp(self):
+        self.merger = ListMerger()
+
+    def test_init_unique_with_str_value(self):
+        with self.assertRaises(TypeError):
+            ListMerger(unique='true')
+
+    def test_unique(self):
+        self.assertFalse(ListMerger().unique)
+        self.assertTrue(ListMerger(unique=True).unique)
+
+    def test_merge_lists(self):
+        base = {'key': [1, 2], 'database': {'hosts': ['host1']}}
+
+        data = self.merger.merge(base, {'key': [2, 3], 'database': {'hosts': ['host2']}})
+
+        self.assertEqual({'key': [1, 2, 2, 3], 'database': {'hosts': ['host1', 'host2']}}, data)
+
+    def test_merge_unique_lists(self):
+        merger = ListMerger(unique=True)
+
+        data = merger.merge({'key': [1, 2]}, {'key': [2, 3]}, {'key': [{'a': 1}]}, {'key': [{'a': 1}]})
+
+        self.assertEqual({'key': [1, 2, 3, {'a': 1}]}, data)
+
+    def test_merge_list_with_str(self):
+        data = self.merger.merge({'key': [1, 2]}, {'key': 'value'})
+        self.assertEqual({'key': 'value'}, data)
+
+
+class TestPersistentMerger(TestCase, MergerMixin):
+    def setUp(self):
+        self.merger = PersistentMerger()
+
+    def test_merge_nested_keys(self):
+        base = {'database': {'host': 'localhost', 'port': 1234}, 'key': 'value'}
+
+        data = self.merger.merge(base, {'database': {'port': 5678}})
+
+        self.assertEqual({'database': {'host': 'localhost', 'port': 5678}, 'key': 'value'}, data)
+
+    def test_merge_does_not_modify_dicts(self):
+        base = {'database': {'host': 'localhost', 'port': 1234}}
+        source = {'database': {'port': 5678}}
+
+        data = self.merger.merge(base, source)
+
+        self.assertIsNot(base, data)
+        self.assertEqual({'database': {'host': 'localhost', 'port': 1234}}, base)
+        self.assertEqual({'database': {'port': 5678}}, source)
+        self.assertEqual({'database': {'host': 'localhost', 'port': 5678}}, data)
+
+    def test_merge_shares_nested_dicts(self):
+        base = {'key1': {'nested': 1}, 'key3': {'nested': 3}}
+        source = {'key2': {'nested': 2}, 'key3': {'other': 3}}
+
+        data = self.merger.merge(base, source)
+
+        self.assertIs(base['key1'], data['key1'])
+        self.assertIs(source['key2'], data['key2'])
+        self.assertIsNot(base['key3'], data['key3'])
+
+
+class TestReplaceMerger(TestCase, MergerMixin):
+    def setUp(self):
+        self.merger = ReplaceMerger()
+
+    def test_merge_nested_keys(self):
+        base = {'database': {'host': 'localhost', 'port': 1234}}
+
+        data = self.merger.merge(base, {'database': {'port': 5678}})
+
+        self.assertIs(base, data)
+        self.assertEqual({'database': {'port': 5678}}, data)
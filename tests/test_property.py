@@ -2,8 +2,10 @@ from __future__ import absolute_import
 
 from collections import MutableMapping
 from central.config import MemoryConfig
-from central.property import PropertyManager, PropertyContainer, Property
+from central.dispatchers import ThreadPoolDispatcher
+from central.property import PropertyManager, PropertyContainer, Property, PropertyGroup, DerivedProperty
 from central.compat import string_types
+from central.structures import ChangeSet
 from central.utils import EventHandler, Version
 from threading import Event
 from unittest import TestCase
@@ -40,11 +42,270 @@ class TestPropertyManager(TestCase):
         config = MemoryConfig()
         properties = PropertyManager(config)
 
-        self.assertEqual(0, properties._version.number)
+        container = properties.get_property('key')
+
+        self.assertEqual(0, container._version.number)
 
         config.set('key', 'value')
 
-        self.assertEqual(1, properties._version.number)
+        self.assertEqual(1, container._version.number)
+
+    def test_invalidate_only_affected_properties(self):
+        config = MemoryConfig(data={'database': {'host': 'localhost', 'port': 1234}, 'key': 'value'})
+        properties = PropertyManager(config)
+
+        database = properties.get_property('database')
+        host = properties.get_property('database.host')
+        port = properties.get_property('database.port')
+        key = properties.get_property('key')
+
+        config.set('database', {'host': 'localhost', 'port': 5678})
+
+        self.assertEqual(1, database._version.number)
+        self.assertEqual(0, host._version.number)
+        self.assertEqual(1, port._version.number)
+        self.assertEqual(0, key._version.number)
+
+        config.set('key', 'other value')
+
+        self.assertEqual(1, database._version.number)
+        self.assertEqual(1, key._version.number)
+
+    def test_invalidate_properties_with_interpolated_value(self):
+        config = MemoryConfig(data={'url': 'http://${host}:${port}', 'host': 'localhost', 'port': '${default_port}',
+                                    'default_port': 80, 'other': 1})
+        properties = PropertyManager(config)
+
+        url = properties.get_property('url').as_str(None)
+
+        self.assertEqual('http://localhost:80', url.get())
+
+        config.set('other', 2)
+
+        self.assertEqual(0, properties.get_property('url')._version.number)
+
+        config.set('default_port', 8080)
+
+        self.assertEqual('http://localhost:8080', url.get())
+
+        config.set('url', 'http://${host}')
+        config.set('host', 'remote')
+
+        self.assertEqual('http://remote', url.get())
+
+    def test_invalidate_properties_with_unknown_changes(self):
+        config = MemoryConfig()
+        properties = PropertyManager(config)
+
+        container = properties.get_property('key')
+
+        config._trigger_updated(ChangeSet(unknown=True))
+
+        self.assertEqual(1, container._version.number)
+
+    def test_invalidate_properties_with_updated_triggered_directly(self):
+        class Config(MemoryConfig):
+            def load(self):
+                self._data = self._make_dict({'key': '3'})
+                self.updated()
+
+        config = Config(data={'key': '2'})
+        properties = PropertyManager(config)
+
+        values = []
+
+        prop = properties.get_property('key').as_int(0)
+        prop.on_updated(values.append)
+
+        self.assertEqual(2, prop.get())
+
+        config.load()
+
+        self.assertEqual(3, prop.get())
+        self.assertEqual([3], values)
+
+    def test_invalidate_properties_with_config_without_snapshot(self):
+        import logging
+
+        from central import abc
+
+        class Config(abc.Config):
+            def get_value(self, key, type, default=None):
+                return data.get(key, default)
+
+            @property
+            def updated(self):
+                return updated
+
+        class Handler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        data = {'key': 1}
+        updated = EventHandler()
+        records = []
+
+        properties = PropertyManager(Config())
+
+        values = []
+
+        prop = properties.get_property('key').as_int(0)
+        prop.on_updated(values.append)
+
+        handler = Handler()
+        logger = logging.getLogger('central.property')
+        logger.addHandler(handler)
+
+        try:
+            data['key'] = 2
+            updated()
+        finally:
+            logger.removeHandler(handler)
+
+        self.assertEqual([2], values)
+        self.assertEqual([], records)
+
+    def test_listener_of_unaffected_property_is_not_called(self):
+        config = MemoryConfig(data={'key1': 1, 'key2': 2})
+        properties = PropertyManager(config)
+
+        values = []
+
+        prop = properties.get_property('key1').as_int(0)
+        prop.on_updated(values.append)
+
+        config.set('key2', 3)
+        config.set('key1', 4)
+
+        self.assertEqual([4], values)
+
+    def test_recompute_properties_from_snapshot(self):
+        class Config(MemoryConfig):
+            def get_value(self, key, type, default=None):
+                reads.append(key)
+                return super(Config, self).get_value(key, type, default)
+
+        reads = []
+        config = Config(data={'database': {'host': 'localhost', 'port': 1234}})
+        properties = PropertyManager(config)
+
+        host = properties.get_property('database.host').as_str(None)
+        port = properties.get_property('database.port').as_int(None)
+
+        values = []
+
+        @host.on_updated
+        def host_updated(value):
+            values.append((value, port._value))
+
+        @port.on_updated
+        def port_updated(value):
+            values.append((host._value, value))
+
+        config.set('database', {'host': 'remote', 'port': 5678})
+
+        self.assertEqual([], reads)
+        self.assertEqual([('remote', 5678), ('remote', 5678)], values)
+        self.assertEqual('remote', host.get())
+        self.assertEqual(5678, port.get())
+        self.assertEqual([], reads)
+
+    def test_recompute_properties_with_listener_error(self):
+        config = MemoryConfig(data={'key': {'nested1': 1, 'nested2': 2}})
+        properties = PropertyManager(config)
+
+        values = []
+
+        nested1 = properties.get_property('key.nested1').as_int(None)
+        nested2 = properties.get_property('key.nested2').as_int(None)
+
+        @nested1.on_updated
+        def nested1_updated(value):
+            raise MemoryError()
+
+        nested2.on_updated(values.append)
+
+        config.set('key', {'nested1': 3, 'nested2': 4})
+
+        self.assertEqual([4], values)
+
+    def test_unused_property_is_collected(self):
+        import gc
+        import weakref
+
+        config = MemoryConfig(data={'key': 1})
+        properties = PropertyManager(config)
+
+        ref = weakref.ref(properties.get_property('key').as_int(0))
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_property_with_listeners_is_not_collected(self):
+        import gc
+        import weakref
+
+        def subscribe():
+            properties.get_property('key').as_int(0).on_updated(values.append)
+
+        config = MemoryConfig(data={'key': 1})
+        properties = PropertyManager(config)
+
+        values = []
+
+        subscribe()
+        gc.collect()
+
+        config.set('key', 2)
+
+        self.assertEqual([2], values)
+
+        prop = properties.get_property('key').as_int(0)
+        prop.updated.remove(values.append)
+
+        ref = weakref.ref(prop)
+        del prop
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_invalidate_once_per_burst(self):
+        child = MemoryConfig()
+        config = child.debounce(10)
+        properties = PropertyManager(config)
+
+        container = properties.get_property('key')
+
+        for value in range(10):
+            child.set('key', value)
+
+        self.assertEqual(0, container._version.number)
+
+        config.flush()
+
+        self.assertEqual(1, container._version.number)
+
+    def test_init_dispatcher_with_str_value(self):
+        with self.assertRaises(TypeError):
+            PropertyManager(MemoryConfig(), dispatcher='non dispatcher')
+
+    def test_updated_with_dispatcher(self):
+        config = MemoryConfig(data={'key': 1})
+        dispatcher = ThreadPoolDispatcher()
+        properties = PropertyManager(config, dispatcher=dispatcher)
+
+        prop = properties.get_property('key').as_int(0)
+
+        values = []
+        prop.on_updated(values.append)
+
+        self.assertIs(dispatcher, prop.updated.dispatcher)
+
+        for value in range(2, 10):
+            config.set('key', value)
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual(list(range(2, 10)), values)
 
 
 class TestPropertyContainer(TestCase):
@@ -178,6 +439,26 @@ class TestPropertyContainer(TestCase):
 
         self.assertEqual(container.as_type(int, 1), container.as_type(int, 1))
 
+    def test_as_type_for_same_key_with_unhashable_default(self):
+        container = PropertyContainer('key', MemoryConfig(), version=Version())
+
+        prop = container.as_type(list, [1, 2])
+
+        self.assertIs(prop, container.as_type(list, [1, 2]))
+        self.assertIsNot(prop, container.as_type(list, [1]))
+        self.assertIsNot(prop, container.as_type(dict, {}))
+
+    def test_as_type_for_same_key_with_different_types(self):
+        container = PropertyContainer('key', MemoryConfig(), version=Version())
+
+        self.assertIsNot(container.as_type(int, 1), container.as_type(str, 1))
+
+    def test_slots(self):
+        container = PropertyContainer('key', MemoryConfig(), version=Version())
+
+        self.assertFalse(hasattr(container, '__dict__'))
+        self.assertFalse(hasattr(container.as_int(1), '__dict__'))
+
 
 class TestProperty(TestCase):
     def test_init_name_with_none_value(self):
@@ -300,3 +581,272 @@ class TestProperty(TestCase):
 
         prop = Property(name='key', default=1, type=int, config=config, version=Version())
         self.assertEqual('2', str(prop))
+
+
+class TestPropertyGroup(TestCase):
+    def test_init_with_str_value(self):
+        with self.assertRaises(TypeError):
+            PropertyGroup('key')
+
+    def test_init_with_duplicated_names(self):
+        properties = PropertyManager(MemoryConfig())
+
+        with self.assertRaises(ValueError):
+            PropertyGroup(properties.get_property('key').as_int(0), properties.get_property('key').as_str(''))
+
+    def test_init_with_different_configs(self):
+        prop1 = PropertyManager(MemoryConfig()).get_property('key1').as_int(0)
+        prop2 = PropertyManager(MemoryConfig()).get_property('key2').as_int(0)
+
+        with self.assertRaises(ValueError):
+            PropertyGroup(prop1, prop2)
+
+    def test_get(self):
+        config = MemoryConfig(data={'db': {'host': 'localhost', 'port': '5432'}})
+        properties = PropertyManager(config)
+
+        host = properties.get_property('db.host').as_str(None)
+        port = properties.get_property('db.port').as_int(None)
+        password = properties.get_property('db.password').as_str('secret')
+
+        group = PropertyGroup(host, port, password)
+
+        self.assertEqual((host, port, password), group.properties)
+        self.assertEqual(('localhost', 5432, 'secret'), group.get())
+
+        config.set('db', {'host': 'remote', 'port': 1234})
+
+        self.assertEqual(('remote', 1234, 'secret'), group.get())
+
+    def test_get_without_properties(self):
+        self.assertEqual((), PropertyGroup().get())
+
+    def test_get_with_reload_while_reading(self):
+        class Config(MemoryConfig):
+            def _get_value(self, snapshot, key, type, default):
+                if reloads:
+                    reloads.pop()
+                    self.set('db', {'host': 'remote', 'port': 2})
+
+                return super(Config, self)._get_value(snapshot, key, type, default)
+
+        reloads = []
+        config = Config(data={'db': {'host': 'localhost', 'port': 1}})
+        properties = PropertyManager(config)
+
+        group = PropertyGroup(properties.get_property('db.host').as_str(None),
+                              properties.get_property('db.port').as_int(None))
+
+        reloads.append(True)
+
+        self.assertEqual(('localhost', 1), group.get())
+        self.assertEqual(('remote', 2), group.get())
+
+    def test_get_with_invalid_value(self):
+        config = MemoryConfig(data={'key1': 'value', 'key2': 'not an int'})
+        properties = PropertyManager(config)
+
+        group = PropertyGroup(properties.get_property('key1').as_str(None),
+                              properties.get_property('key2').as_int(0))
+
+        self.assertEqual(('value', 0), group.get())
+
+    def test_collected_group_stops_listening(self):
+        import gc
+
+        properties = PropertyManager(MemoryConfig())
+        prop = properties.get_property('key').as_int(0)
+
+        group = PropertyGroup(prop)
+
+        self.assertEqual(1, len(prop._master_version.changed))
+
+        del group
+        gc.collect()
+
+        self.assertEqual(0, len(prop._master_version.changed))
+
+
+
+class TestDerivedProperty(TestCase):
+    def test_derive_with_str_value(self):
+        properties = PropertyManager(MemoryConfig())
+
+        with self.assertRaises(TypeError):
+            properties.derive(lambda value: value, 'key')
+
+    def test_derive_with_property_from_other_manager(self):
+        properties = PropertyManager(MemoryConfig())
+        prop = PropertyManager(MemoryConfig()).get_property('key').as_str(None)
+
+        with self.assertRaises(ValueError):
+            properties.derive(lambda value: value, prop)
+
+    def test_init_func_with_str_value(self):
+        with self.assertRaises(TypeError):
+            DerivedProperty('str', (), MemoryConfig())
+
+    def test_get(self):
+        config = MemoryConfig(data={'db': {'host': 'localhost', 'port': 5432}})
+        properties = PropertyManager(config)
+
+        host = properties.get_property('db.host').as_str(None)
+        port = properties.get_property('db.port').as_int(None)
+
+        address = properties.derive(lambda host, port: '%s:%s' % (host, port), host, port)
+
+        self.assertEqual((host, port), address.properties)
+        self.assertEqual('localhost:5432', address.get())
+        self.assertEqual('localhost:5432', str(address))
+
+        config.set('db.port', 1234)
+
+        self.assertEqual('localhost:1234', address.get())
+
+    def test_get_is_cached(self):
+        def func(value):
+            calls.append(value)
+            return value * 2
+
+        calls = []
+        config = MemoryConfig(data={'key': 1, 'other': 1})
+        properties = PropertyManager(config)
+
+        prop = properties.derive(func, properties.get_property('key').as_int(0))
+
+        self.assertIs(func, prop.func)
+        self.assertEqual(2, prop.get())
+        self.assertEqual(2, prop.get())
+
+        # the version changes but the value does not.
+        config.set('key', '1')
+
+        self.assertEqual(2, prop.get())
+
+        config.set('other', 2)
+        config.set('key', 2)
+
+        self.assertEqual(4, prop.get())
+        self.assertEqual([1, 2], calls)
+
+    def test_get_chained(self):
+        config = MemoryConfig(data={'db': {'host': 'localhost', 'port': 5432, 'name': 'db'}})
+        properties = PropertyManager(config)
+
+        address = properties.derive(lambda host, port: '%s:%s' % (host, port),
+                                    properties.get_property('db.host').as_str(None),
+                                    properties.get_property('db.port').as_int(None))
+
+        url = properties.derive(lambda address, name: 'postgres://%s/%s' % (address, name),
+                                address, properties.get_property('db.name').as_str(None))
+
+        self.assertEqual('postgres://localhost:5432/db', url.get())
+
+        config.set('db.host', 'remote')
+
+        self.assertEqual('postgres://remote:5432/db', url.get())
+
+    def test_updated(self):
+        config = MemoryConfig(data={'db': {'host': 'localhost', 'port': 5432}})
+        properties = PropertyManager(config)
+
+        address = properties.derive(lambda host, port: '%s:%s' % (host, port),
+                                    properties.get_property('db.host').as_str(None),
+                                    properties.get_property('db.port').as_int(None))
+
+        values = []
+        address.on_updated(values.append)
+
+        config.set('db', {'host': 'remote', 'port': 1234})
+
+        # both properties changed but the listener is called once with both values.
+        self.assertEqual(['remote:1234'], values)
+
+        config.set('db.port', '1234')
+
+        self.assertEqual(['remote:1234'], values)
+
+    def test_updated_only_if_value_changed(self):
+        config = MemoryConfig(data={'key': 1})
+        properties = PropertyManager(config)
+
+        is_positive = properties.derive(lambda value: value > 0, properties.get_property('key').as_int(0))
+
+        values = []
+        is_positive.on_updated(values.append)
+
+        config.set('key', 2)
+        config.set('key', -1)
+        config.set('key', -2)
+
+        self.assertEqual([False], values)
+
+    def test_updated_chained(self):
+        config = MemoryConfig(data={'key': 1})
+        properties = PropertyManager(config)
+
+        doubled = properties.derive(lambda value: value * 2, properties.get_property('key').as_int(0))
+        is_big = properties.derive(lambda value: value > 10, doubled)
+
+        values = []
+        is_big.on_updated(values.append)
+
+        config.set('key', 2)
+        config.set('key', 6)
+        config.set('key', 7)
+
+        self.assertEqual([True], values)
+
+    def test_updated_with_func_error(self):
+        def func(value):
+            if value == 2:
+                raise ValueError()
+            return value
+
+        config = MemoryConfig(data={'key': 1})
+        properties = PropertyManager(config)
+
+        prop = properties.derive(func, properties.get_property('key').as_int(0))
+
+        values = []
+        prop.on_updated(values.append)
+
+        config.set('key', 2)
+        config.set('key', 3)
+
+        self.assertEqual([3], values)
+
+    def test_updated_with_bounded_dispatcher(self):
+        config = MemoryConfig(data={'key': 1})
+        dispatcher = ThreadPoolDispatcher(max_workers=1, max_queue_size=1)
+        properties = PropertyManager(config, dispatcher=dispatcher)
+
+        prop = properties.derive(lambda value: value * 2, properties.get_property('key').as_int(0))
+
+        values = []
+        prop.on_updated(values.append)
+
+        config.set('key', 2)
+
+        self.assertTrue(dispatcher.wait(5))
+        self.assertEqual([4], values)
+
+    def test_remove_updated(self):
+        config = MemoryConfig(data={'key': 1})
+        properties = PropertyManager(config)
+
+        source = properties.get_property('key').as_int(0)
+        prop = properties.derive(lambda value: value, source)
+
+        values = []
+        prop.on_updated(values.append)
+
+        self.assertEqual(1, len(source.updated))
+
+        prop.updated.remove(values.append)
+
+        self.assertEqual(0, len(source.updated))
+
+        config.set('key', 2)
+
+        self.assertEqual([], values)
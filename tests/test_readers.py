@@ -32,6 +32,23 @@ class ReaderMixin(object):
         self.assertEqual(data.get('Database'), {'host': 'localhost', 'port': '1234'})
         self.assertEqual(data.get('Database').get('Host'), 'localhost')
 
+    def test_read_case_sensitive(self):
+        stream = StringIO()
+        stream.write(self.data)
+        stream.seek(0, 0)
+
+        data = type(self.reader)(ignore_case=False).read(stream)
+
+        self.assertIs(type(data), dict)
+        self.assertIs(type(data['database']), dict)
+
+        self.assertEqual(data, {'database': {'host': 'localhost', 'port': '1234'}})
+        self.assertIsNone(data.get('Database'))
+
+    def test_init_ignore_case_with_str_value(self):
+        with self.assertRaises(TypeError):
+            type(self.reader)(ignore_case='false')
+
 
 class TestIniReader(TestCase, ReaderMixin):
     def setUp(self):
@@ -1,9 +1,56 @@
 from __future__ import absolute_import
 
-from central.structures import IgnoreCaseDict
+from central.structures import ChangeSet, IgnoreCaseDict, LazyIgnoreCaseDict
 from unittest import TestCase
 
 
+class TestChangeSet(TestCase):
+    def test_keys(self):
+        changes = ChangeSet(added=['Key1'], removed=['key2'], modified=['key3'])
+
+        self.assertEqual({'key1'}, changes.added)
+        self.assertEqual({'key1', 'key2', 'key3'}, changes.keys)
+
+    def test_keys_case_sensitive(self):
+        changes = ChangeSet(added=['Key1'], ignore_case=False)
+        self.assertEqual({'Key1'}, changes.added)
+
+    def test_bool(self):
+        self.assertFalse(ChangeSet())
+        self.assertTrue(ChangeSet(added=['key']))
+        self.assertTrue(ChangeSet(unknown=True))
+
+    def test_affects(self):
+        changes = ChangeSet(modified=['database.primary.port'])
+
+        self.assertTrue(changes.affects('database.primary.port'))
+        self.assertTrue(changes.affects('DATABASE.primary'))
+        self.assertTrue(changes.affects('database'))
+        self.assertTrue(changes.affects('database.primary.port.nested'))
+        self.assertFalse(changes.affects('database.primary.host'))
+        self.assertFalse(changes.affects('database.secondary'))
+        self.assertFalse(changes.affects('other'))
+
+    def test_affects_with_unknown_changes(self):
+        self.assertTrue(ChangeSet(unknown=True).affects('key'))
+
+    def test_merge(self):
+        changes = ChangeSet(added=['key1', 'key2'], removed=['key3'], modified=['key4', 'key5'])
+        changes = changes.merge(ChangeSet(added=['key3'], removed=['key2', 'key4'], modified=['key1', 'key6']))
+
+        self.assertEqual({'key1'}, changes.added)
+        self.assertEqual({'key4'}, changes.removed)
+        self.assertEqual({'key3', 'key5', 'key6'}, changes.modified)
+        self.assertFalse(changes.unknown)
+
+    def test_merge_with_unknown_changes(self):
+        self.assertTrue(ChangeSet().merge(ChangeSet(unknown=True)).unknown)
+
+    def test_merge_with_non_change_set(self):
+        with self.assertRaises(TypeError):
+            ChangeSet().merge('changes')
+
+
 class TestIgnoreCaseDict(TestCase):
     def test_init_with_kwargs(self):
         d = IgnoreCaseDict(key='value')
@@ -132,3 +179,170 @@ class TestIgnoreCaseDict(TestCase):
     def test_repr(self):
         d = IgnoreCaseDict(key='value')
         self.assertEqual("{'key': 'value'}", repr(d))
+
+    def test_repr_with_multiple_keys(self):
+        d = IgnoreCaseDict()
+        d['Key1'] = 'value1'
+        d['key2'] = 2
+
+        self.assertIn(repr(d), ("{'Key1': 'value1', 'key2': 2}", "{'key2': 2, 'Key1': 'value1'}"))
+
+    def test_copy_is_independent(self):
+        d = IgnoreCaseDict(key='value')
+        d2 = d.copy()
+        d2['Key'] = 'other value'
+        d2['key2'] = 'value2'
+
+        self.assertEqual({'key': 'value'}, d)
+        self.assertEqual({'Key': 'other value', 'key2': 'value2'}, d2)
+
+    def test_update_with_ignore_case_dict(self):
+        d = IgnoreCaseDict(Key='value')
+        d.update(IgnoreCaseDict(KEY='other value', key2='value2'))
+
+        self.assertEqual({'KEY': 'other value', 'key2': 'value2'}, d)
+
+    def test_update_with_ignore_case_dict_in_lower_case(self):
+        d = IgnoreCaseDict(Foo=1)
+        d.update(IgnoreCaseDict(foo=2))
+
+        self.assertEqual(['foo'], list(d.keys()))
+        self.assertEqual(2, d['FOO'])
+
+    def test_set_with_existent_key(self):
+        d = IgnoreCaseDict()
+        d['key'] = 'value'
+        d['KEY'] = 'other value'
+
+        self.assertEqual(1, len(d))
+        self.assertEqual({'KEY'}, set(d.keys()))
+        self.assertEqual('other value', d['key'])
+
+    def test_pop_with_existent_key(self):
+        d = IgnoreCaseDict(Key='value')
+
+        self.assertEqual('value', d.pop('KEY'))
+        self.assertEqual(0, len(d))
+        self.assertEqual([], list(d))
+
+    def test_deepcopy(self):
+        import copy
+
+        d = IgnoreCaseDict(Key=IgnoreCaseDict(Nested='value'))
+        d2 = copy.deepcopy(d)
+
+        self.assertIsInstance(d2['key'], IgnoreCaseDict)
+        self.assertEqual({'Key': {'Nested': 'value'}}, d2)
+        self.assertIsNot(d['key'], d2['key'])
+
+    def test_pickle(self):
+        import pickle
+
+        d = IgnoreCaseDict(Key='value')
+        d2 = pickle.loads(pickle.dumps(d))
+
+        self.assertIsInstance(d2, IgnoreCaseDict)
+        self.assertEqual({'Key'}, set(d2.keys()))
+
+    def test_set_with_existent_key_in_lower_case(self):
+        d = IgnoreCaseDict()
+        d['KEY'] = 'value'
+        d['key'] = 'other value'
+
+        self.assertEqual({'key'}, set(d.keys()))
+        self.assertEqual([('key', 'other value')], list(d.items()))
+
+
+class TestLazyIgnoreCaseDict(TestCase):
+    def test_get_with_nested_dict(self):
+        nested = {'Key': 'value'}
+        d = LazyIgnoreCaseDict({'Parent': nested})
+
+        self.assertIs(nested, d._values['parent'])
+
+        self.assertIsInstance(d.get('PARENT'), LazyIgnoreCaseDict)
+        self.assertEqual('value', d.get('parent').get('KEY'))
+        self.assertEqual('value', d['parent']['key'])
+
+    def test_get_caches_converted_dict(self):
+        d = LazyIgnoreCaseDict({'parent': {'key': 'value'}})
+        self.assertIs(d.get('parent'), d['parent'])
+
+    def test_get_from_multiple_threads(self):
+        from threading import Event, Thread
+
+        ev = Event()
+        d = LazyIgnoreCaseDict(dict(('parent%d' % i, {'Child': {'Key': i}}) for i in range(100)))
+
+        results = []
+
+        def read():
+            ev.wait(1)
+            results.append([d['PARENT%d' % i]['child'] for i in range(100)])
+
+        threads = [Thread(target=read) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        ev.set()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8, len(results))
+
+        for children in results:
+            for i, child in enumerate(children):
+                self.assertIs(results[0][i], child)
+                self.assertEqual(i, child['KEY'])
+
+    def test_get_with_ignore_case_dict(self):
+        nested = IgnoreCaseDict(key='value')
+        d = LazyIgnoreCaseDict({'parent': nested})
+
+        self.assertIs(nested, d['parent'])
+
+    def test_get_default_value(self):
+        d = LazyIgnoreCaseDict()
+
+        self.assertIsNone(d.get('key'))
+        self.assertEqual('value', d.get('key', 'value'))
+
+    def test_pop_with_nested_dict(self):
+        d = LazyIgnoreCaseDict({'parent': {'Key': 'value'}})
+        self.assertEqual('value', d.pop('parent')['key'])
+
+    def test_pop_with_nonexistent_key(self):
+        d = LazyIgnoreCaseDict()
+
+        with self.assertRaises(KeyError):
+            d.pop('not_found')
+
+        self.assertEqual('value', d.pop('not_found', 'value'))
+
+    def test_popitem_with_nested_dict(self):
+        d = LazyIgnoreCaseDict({'parent': {'Key': 'value'}})
+
+        k, v = d.popitem()
+
+        self.assertEqual('parent', k)
+        self.assertEqual('value', v['key'])
+
+    def test_items_with_nested_dict(self):
+        d = LazyIgnoreCaseDict({'parent': {'Key': 'value'}})
+
+        for _, value in d.items():
+            self.assertIsInstance(value, LazyIgnoreCaseDict)
+
+    def test_copy(self):
+        d = LazyIgnoreCaseDict({'parent': {'key': 'value'}})
+        d2 = d.copy()
+
+        self.assertIsInstance(d2, LazyIgnoreCaseDict)
+        self.assertEqual('value', d2['parent']['KEY'])
+        self.assertIsNot(d['parent'], d2['parent'])
+
+    def test_equal_with_dict(self):
+        d = LazyIgnoreCaseDict({'parent': {'key': 'value'}})
+        self.assertEqual({'parent': {'key': 'value'}}, d)
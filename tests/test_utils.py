@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 
-from central.utils import merge_dict, EventHandler, Version
+from central.dispatchers import ThreadPoolDispatcher
+from central.structures import IgnoreCaseDict
+from central.utils import diff_dict, flatten_dict, make_case_sensitive, make_ignore_case, merge_dict, EventHandler, Version
 from threading import Event
 from unittest import TestCase
 
@@ -51,6 +53,84 @@ class TestUtils(TestCase):
 
         self.assertEqual(base, expected)
 
+    def test_flatten_dict(self):
+        data = IgnoreCaseDict(Parent=IgnoreCaseDict(Child=IgnoreCaseDict(key='value')), key='value')
+
+        flat = flatten_dict(data)
+
+        self.assertEqual('value', flat['key'])
+        self.assertEqual('value', flat['parent.child.key'])
+        self.assertEqual(data['parent']['child'], flat['parent.child'])
+
+    def test_flatten_dict_with_delimited_key(self):
+        flat = flatten_dict({'parent': {'child.key': 'value'}, 'parent.key': 'value'})
+        self.assertEqual({'parent'}, set(flat.keys()))
+
+    def test_flatten_dict_with_none_value(self):
+        flat = flatten_dict({'parent': {'key': None}})
+        self.assertNotIn('parent.key', flat)
+
+    def test_flatten_dict_case_sensitive(self):
+        flat = flatten_dict({'Parent': {'Key': 'value'}}, ignore_case=False)
+        self.assertEqual({'Parent', 'Parent.Key'}, set(flat.keys()))
+
+    def test_make_ignore_case(self):
+        d = make_ignore_case({'Parent': {'Key': 'value'}})
+
+        self.assertIsInstance(d, IgnoreCaseDict)
+        self.assertEqual('value', d['parent']['key'])
+
+    def test_make_ignore_case_with_ignore_case_dict(self):
+        data = IgnoreCaseDict(key='value')
+        self.assertIs(data, make_ignore_case(data))
+
+    def test_make_case_sensitive(self):
+        data = IgnoreCaseDict(Parent=IgnoreCaseDict(Key='value'))
+
+        d = make_case_sensitive(data)
+
+        self.assertIs(dict, type(d))
+        self.assertIs(dict, type(d['Parent']))
+        self.assertEqual({'Parent': {'Key': 'value'}}, d)
+
+
+    def test_diff_dict(self):
+        old = {'key1': 1, 'key2': {'nested1': 1, 'nested2': 2}, 'key3': {'nested': 3}}
+        new = {'key1': 2, 'key2': {'nested1': 1, 'nested3': 3}, 'key3': 3, 'key4': {'nested': 4}}
+
+        changes = diff_dict(old, new)
+
+        self.assertEqual({'key2.nested3', 'key4', 'key4.nested'}, changes.added)
+        self.assertEqual({'key2.nested2', 'key3.nested'}, changes.removed)
+        self.assertEqual({'key1', 'key3'}, changes.modified)
+
+    def test_diff_dict_with_none_value(self):
+        changes = diff_dict({'key1': None, 'key2': 2}, {'key1': 1, 'key2': None})
+
+        self.assertEqual({'key1'}, changes.added)
+        self.assertEqual({'key2'}, changes.removed)
+
+    def test_diff_dict_with_shared_nested_dict(self):
+        class Nested(dict):
+            def __iter__(self):
+                raise AssertionError('shared nested dict must not be compared')
+
+        nested = Nested(key='value')
+
+        changes = diff_dict({'key': nested}, {'key': nested, 'other': 1})
+
+        self.assertEqual({'other'}, changes.added)
+
+    def test_diff_dict_ignore_case(self):
+        changes = diff_dict(IgnoreCaseDict(Key=1), IgnoreCaseDict(KEY=1, Other=2))
+
+        self.assertEqual({'other'}, changes.added)
+        self.assertEqual(frozenset(), changes.modified)
+
+        changes = diff_dict({'Key': 1}, {'Key': 2}, ignore_case=False)
+
+        self.assertEqual({'Key'}, changes.modified)
+
 
 class TestEventHandler(TestCase):
     def test_init_after_add_func_with_func_value(self):
@@ -71,6 +151,30 @@ class TestEventHandler(TestCase):
         with self.assertRaises(TypeError):
             EventHandler(after_remove_func='non callable')
 
+    def test_init_dispatcher_with_str_value(self):
+        with self.assertRaises(TypeError):
+            EventHandler(dispatcher='non dispatcher')
+
+    def test_set_dispatcher_with_str_value(self):
+        handler = EventHandler()
+        with self.assertRaises(TypeError):
+            handler.dispatcher = 'non dispatcher'
+
+    def test_call_with_dispatcher(self):
+        dispatcher = ThreadPoolDispatcher()
+        handler = EventHandler(dispatcher=dispatcher)
+
+        self.assertIs(dispatcher, handler.dispatcher)
+
+        calls = []
+        handler.add(lambda value: calls.append(value))
+
+        self.assertEqual([], handler(1))
+
+        dispatcher.wait()
+
+        self.assertEqual([1], calls)
+
     def test_get(self):
         handler = EventHandler()
 